@@ -0,0 +1,188 @@
+"""In-memory stand-in for the parts of confluent_kafka the services use.
+
+A ``FakeBroker`` keeps partitioned logs and committed group offsets;
+``install`` points the service's messaging module at fake producers,
+consumers and admin clients bound to it, so the real consumer and
+producer code runs unchanged without a broker.
+"""
+import threading
+import time
+import zlib
+from types import SimpleNamespace
+
+
+class FakeMessage:
+    __slots__ = ("_topic", "_partition", "_offset", "_key", "_value", "_headers")
+
+    def __init__(self, topic, partition, offset, key, value, headers=None):
+        self._topic = topic
+        self._partition = partition
+        self._offset = offset
+        self._key = key
+        self._value = value
+        self._headers = headers
+
+    def topic(self):
+        return self._topic
+
+    def partition(self):
+        return self._partition
+
+    def offset(self):
+        return self._offset
+
+    def key(self):
+        return self._key
+
+    def value(self):
+        return self._value
+
+    def headers(self):
+        return self._headers
+
+    def error(self):
+        return None
+
+
+class FakeBroker:
+    def __init__(self, partitions: int = 3):
+        self.partitions = partitions
+        self.topics = {}
+        self.committed = {}
+        self._changed = threading.Condition()
+
+    def create_topic(self, topic):
+        with self._changed:
+            self.topics.setdefault(topic, [[] for _ in range(self.partitions)])
+
+    def append(self, topic, key, value, headers=None) -> FakeMessage:
+        if isinstance(key, str):
+            key = key.encode("utf-8")
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        with self._changed:
+            logs = self.topics.setdefault(topic, [[] for _ in range(self.partitions)])
+            partition = zlib.crc32(key or b"") % self.partitions
+            log = logs[partition]
+            message = FakeMessage(topic, partition, len(log), key, value, headers)
+            log.append(message)
+            self._changed.notify_all()
+        return message
+
+    def end_offsets(self, topic):
+        with self._changed:
+            return [len(log) for log in self.topics.get(topic, [])]
+
+    def committed_offsets(self, group, topic):
+        with self._changed:
+            return [
+                self.committed.get((group, topic, partition), 0)
+                for partition in range(len(self.topics.get(topic, [])))
+            ]
+
+    def fetch(self, positions, max_messages, timeout):
+        """Messages at ``positions`` ({(topic, partition): offset}).
+
+        Like librdkafka's consume(), waits until ``max_messages`` are
+        available or ``timeout`` expires, then returns what there is.
+        """
+        deadline = time.monotonic() + max(timeout, 0)
+        with self._changed:
+            while True:
+                # Spread the batch over partitions, as a broker fetch would.
+                share = -(-max_messages // max(len(positions), 1))
+                batch = []
+                for (topic, partition), offset in positions.items():
+                    log = self.topics.get(topic, [])[partition]
+                    batch.extend(log[offset:offset + min(share, max_messages - len(batch))])
+                if len(batch) >= max_messages:
+                    return batch
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return batch
+                self._changed.wait(remaining)
+
+    def commit(self, group, offsets):
+        with self._changed:
+            for tp in offsets:
+                self.committed[(group, tp.topic, tp.partition)] = tp.offset
+
+
+class FakeProducer:
+    def __init__(self, broker: FakeBroker, config=None):
+        self.broker = broker
+        self._reports = []
+        self._ready = threading.Condition()
+
+    def produce(self, topic, value=None, key=None, headers=None, on_delivery=None):
+        message = self.broker.append(topic, key, value, headers)
+        if on_delivery is not None:
+            with self._ready:
+                self._reports.append((on_delivery, message))
+                self._ready.notify()
+
+    def poll(self, timeout=0):
+        with self._ready:
+            if not self._reports and timeout:
+                self._ready.wait(timeout)
+            reports, self._reports = self._reports, []
+        for on_delivery, message in reports:
+            on_delivery(None, message)
+        return len(reports)
+
+    def flush(self, timeout=None):
+        self.poll(0)
+        return 0
+
+    def __len__(self):
+        return len(self._reports)
+
+
+class FakeConsumer:
+    def __init__(self, broker: FakeBroker, config):
+        self.broker = broker
+        self.group = config["group.id"]
+        self.positions = {}
+
+    def subscribe(self, topics):
+        for topic in topics:
+            self.broker.create_topic(topic)
+            committed = self.broker.committed_offsets(self.group, topic)
+            for partition, offset in enumerate(committed):
+                self.positions[(topic, partition)] = offset
+
+    def consume(self, num_messages=1, timeout=-1):
+        messages = self.broker.fetch(dict(self.positions), num_messages, timeout)
+        for message in messages:
+            self.positions[(message.topic(), message.partition())] = message.offset() + 1
+        return messages
+
+    def commit(self, offsets=None, asynchronous=True):
+        self.broker.commit(self.group, offsets or [])
+
+    def seek(self, tp):
+        self.positions[(tp.topic, tp.partition)] = tp.offset
+
+    def get_watermark_offsets(self, tp, timeout=None, cached=False):
+        return 0, self.broker.end_offsets(tp.topic)[tp.partition]
+
+    def close(self):
+        pass
+
+
+class FakeAdminClient:
+    def __init__(self, broker: FakeBroker, config=None):
+        self.broker = broker
+
+    def list_topics(self, timeout=None):
+        return SimpleNamespace(topics=dict.fromkeys(self.broker.topics))
+
+
+def install(broker: FakeBroker):
+    """Route the service's Kafka clients to ``broker``. Call before the app starts."""
+    import confluent_kafka.admin
+    from src.infrastructure.messaging import kafka_consumer
+
+    kafka_consumer.Consumer = lambda config: FakeConsumer(broker, config)
+    kafka_consumer.Producer = lambda config: FakeProducer(broker, config)
+    confluent_kafka.admin.AdminClient = lambda config: FakeAdminClient(broker, config)
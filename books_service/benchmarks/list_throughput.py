@@ -0,0 +1,76 @@
+"""Compare the two ways a page of books can reach the wire.
+
+    DATABASE_URL=... python -m benchmarks.list_throughput [--page 500] [--rounds 200]
+
+"orm" is the previous path: ORM BookModel -> Book -> BookPage validation ->
+json. "rows" is the current one: Core rows -> orjson. Both read the same
+page from the database each round; missing rows are seeded first.
+"""
+import argparse
+import asyncio
+import json
+import time
+from uuid import uuid4
+from sqlalchemy import func, select
+from src.domain.library.entities.book import Book
+from src.infrastructure.db.migrate import migrate
+from src.infrastructure.db.models import BookModel
+from src.infrastructure.db.session import AsyncSessionLocal
+from src.infrastructure.repositories.book_repo_sql import BookRepositorySQL
+from src.presentation.responses import FastJSONResponse, rows_to_items
+from src.presentation.routers.books import BOOK_COLUMNS
+from src.presentation.schemas import BookPage
+
+
+async def _seed(session, count):
+    existing = await session.scalar(select(func.count()).select_from(BookModel))
+    missing = count - existing
+    if missing > 0:
+        books = [Book(uuid4(), f"Bench title {i}", f"Bench author {i % 97}") for i in range(missing)]
+        await BookRepositorySQL(session).create_many(books)
+        await session.commit()
+
+
+async def _orm_page(session, limit):
+    result = await session.execute(select(BookModel).order_by(BookModel.book_id).limit(limit))
+    books = [BookRepositorySQL._to_entity(row) for row in result.scalars()]
+    page = BookPage.model_validate({"items": books, "next_cursor": None}, from_attributes=True)
+    return json.dumps(page.model_dump(mode="json")).encode("utf-8")
+
+
+async def _rows_page(session, limit):
+    rows = await BookRepositorySQL(session).list_rows(limit)
+    return FastJSONResponse({"items": rows_to_items(rows, BOOK_COLUMNS), "next_cursor": None}).body
+
+
+async def _run(name, render, limit, rounds):
+    async with AsyncSessionLocal() as session:
+        await render(session, limit)  # warm up connection and statement cache
+        started = time.perf_counter()
+        for _ in range(rounds):
+            body = await render(session, limit)
+            # Each read must see fresh rows, not the session's identity map.
+            session.expunge_all()
+        elapsed = time.perf_counter() - started
+    rows_per_s = limit * rounds / elapsed
+    print(f"{name:>5}: {rows_per_s:12,.0f} rows/s  {elapsed / rounds * 1000:7.2f} ms/page  {len(body)} bytes")
+    return rows_per_s
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    await migrate()
+    async with AsyncSessionLocal() as session:
+        await _seed(session, args.page)
+
+    before = await _run("orm", _orm_page, args.page, args.rounds)
+    after = await _run("rows", _rows_page, args.page, args.rounds)
+    print(f"speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
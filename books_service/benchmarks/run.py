@@ -0,0 +1,204 @@
+"""Benchmark scenarios for the books service.
+
+    DATABASE_URL=postgresql+asyncpg://.../books_bench python -m benchmarks.run \\
+        [--scenarios replicate_borrow,read_lookups,list_10k,list_100k,consumer_replay] \\
+        [--ops 2000] [--concurrency 16] [--out bench-books.json]
+
+The app runs in-process with its real lifespan, against the given Postgres
+database and an in-memory Kafka fake. Tables are truncated first so runs
+are reproducible. SQLite cannot stand in: the repositories rely on
+Postgres-only SQL (ON CONFLICT, = ANY(array), tsvector). Compare two
+reports with ``python -m benchmarks.compare old.json new.json``.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from functools import partial
+from uuid import uuid4
+from benchmarks import fake_kafka
+from benchmarks.harness import booted, check_database, scenario, summarize, write_report
+
+SCENARIOS = ("replicate_borrow", "read_lookups", "list_10k", "list_100k", "consumer_replay")
+SEED_CHUNK = 10000
+
+
+async def _reset():
+    from sqlalchemy import text
+    from src.infrastructure.db.session import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as session:
+        await session.execute(text("TRUNCATE loans, books, members RESTART IDENTITY CASCADE"))
+        await session.commit()
+
+
+async def _seed_books(total: int):
+    """Top the books table up to ``total`` rows; returns every book id."""
+    from sqlalchemy import select
+    from src.domain.library.entities.book import Book
+    from src.infrastructure.db.models import BookModel
+    from src.infrastructure.db.session import AsyncSessionLocal
+    from src.infrastructure.repositories.book_repo_sql import BookRepositorySQL
+
+    async with AsyncSessionLocal() as session:
+        ids = list((await session.execute(select(BookModel.book_id))).scalars())
+        repo = BookRepositorySQL(session)
+        while len(ids) < total:
+            count = min(SEED_CHUNK, total - len(ids))
+            books = [
+                Book(uuid4(), f"Seed title {len(ids) + i}", f"Seed author {(len(ids) + i) % 500}")
+                for i in range(count)
+            ]
+            ids.extend(await repo.create_many(books))
+            await session.commit()
+    return ids
+
+
+async def _wait_committed(broker, group, message, timeout=30):
+    """Wait until the consumer group committed past ``message``."""
+    key = (group, message.topic(), message.partition())
+    deadline = time.monotonic() + timeout
+    while broker.committed.get(key, 0) <= message.offset():
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"event at offset {message.offset()} was not consumed")
+        await asyncio.sleep(0.001)
+
+
+def _expect(response, status):
+    if response.status_code != status:
+        raise RuntimeError(f"{response.request.method} {response.request.url}: {response.status_code} {response.text}")
+    return response
+
+
+async def _http_scenarios(args, broker, results):
+    from src.infrastructure.messaging.config import KAFKA_CONSUMER_GROUP, KAFKA_MEMBER_CREATED_TOPIC
+    from src.main import app
+    from src.presentation.pagination import encode_cursor
+
+    rng = random.Random(42)
+    alloc_ops = min(200, args.ops // 10)
+
+    async with booted(app) as client:
+        if "replicate_borrow" in args.scenarios:
+            async def replicate_borrow(i):
+                # What the members service publishes for a new member.
+                member_id = str(uuid4())
+                message = broker.append(
+                    KAFKA_MEMBER_CREATED_TOPIC, member_id, json.dumps({"member_id": member_id})
+                )
+                await _wait_committed(broker, KAFKA_CONSUMER_GROUP, message)
+                book = _expect(await client.post("/books/", json={"title": f"Bench {i}", "author": "Bench"}), 201)
+                _expect(await client.post(f"/books/{book.json()['book_id']}/borrow/member/{member_id}"), 204)
+
+            results["replicate_borrow"] = await scenario(
+                "replicate_borrow", replicate_borrow, args.ops, args.concurrency, alloc_ops,
+            )
+
+        if "read_lookups" in args.scenarios:
+            ids = await _seed_books(1000)
+            picks = [rng.choice(ids) for _ in range(args.ops + alloc_ops)]
+
+            async def read_lookup(i):
+                _expect(await client.get(f"/books/{picks[i]}"), 200)
+
+            results["read_lookups"] = await scenario(
+                "read_lookups", read_lookup, args.ops, args.concurrency, alloc_ops, table_rows=len(ids),
+            )
+
+        for name, rows in (("list_10k", 10000), ("list_100k", 100000)):
+            if name not in args.scenarios:
+                continue
+            await _seed_books(rows)
+            # Random cursors land each page at an arbitrary point in the key range.
+            cursors = [encode_cursor(uuid4()) for _ in range(args.ops + alloc_ops)]
+
+            async def list_page(i, cursors=cursors):
+                _expect(await client.get("/books/", params={"limit": 50, "cursor": cursors[i]}), 200)
+
+            results[name] = await scenario(
+                name, list_page, args.ops, args.concurrency, alloc_ops, table_rows=rows, page_size=50,
+            )
+
+
+async def _consumer_replay(args, broker, results):
+    """Re-read the whole member topic with a fresh consumer group."""
+    from src.infrastructure.db.unit_of_work_sql import UnitOfWorkSQL
+    from src.infrastructure.messaging.config import CONSUMER_PARTITION_CONCURRENCY, KAFKA_MEMBER_CREATED_TOPIC
+    from src.infrastructure.messaging.kafka_consumer import KafkaConsumerService
+
+    for _ in range(args.replay_events):
+        member_id = str(uuid4())
+        broker.append(KAFKA_MEMBER_CREATED_TOPIC, member_id, json.dumps({"member_id": member_id}))
+    end = broker.end_offsets(KAFKA_MEMBER_CREATED_TOPIC)
+    events = sum(end)
+
+    consumer = KafkaConsumerService(partial(UnitOfWorkSQL, use_cache=False))
+    consumer.group_id = f"bench-replay-{uuid4().hex[:8]}"
+    batch_latencies = []
+    handle_batch = consumer._handle_batch
+
+    async def timed_batch(messages):
+        started = time.perf_counter()
+        await handle_batch(messages)
+        batch_latencies.append(time.perf_counter() - started)
+
+    consumer._handle_batch = timed_batch
+
+    print(f"▶ consumer_replay: {events} events")
+    started = time.perf_counter()
+    consumer.start()
+    while broker.committed_offsets(consumer.group_id, KAFKA_MEMBER_CREATED_TOPIC) != end:
+        if not consumer.is_alive():
+            raise RuntimeError("consumer stopped before the replay finished")
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - started
+    await consumer.stop()
+
+    result = summarize(
+        batch_latencies, elapsed, CONSUMER_PARTITION_CONCURRENCY,
+        events=events, events_per_s=round(events / elapsed, 1),
+    )
+    # ops/rps/latency describe consumed batches here, not single events.
+    result["unit"] = "batch"
+    print(f"  {result['events_per_s']} events/s over {result['ops']} batches")
+    results["consumer_replay"] = result
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Books service benchmarks")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--ops", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--replay-events", type=int, default=20000)
+    parser.add_argument("--out", default="bench-books.json")
+    parser.add_argument("--allow-any-db", action="store_true")
+    args = parser.parse_args()
+    args.scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    check_database(os.environ.get("DATABASE_URL", ""), args.allow_any_db)
+
+    broker = fake_kafka.FakeBroker()
+    fake_kafka.install(broker)
+
+    from src.infrastructure.db.migrate import migrate
+    from src.infrastructure.messaging.config import KAFKA_MEMBER_CREATED_TOPIC
+
+    broker.create_topic(KAFKA_MEMBER_CREATED_TOPIC)
+    await migrate()
+    await _reset()
+
+    results = {}
+    await _http_scenarios(args, broker, results)
+    if "consumer_replay" in args.scenarios:
+        await _consumer_replay(args, broker, results)
+
+    write_report("books", results, args.out)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,54 +1,136 @@
 from uuid import UUID
 
+
+class PreconditionFailed(Exception):
+    """The stored book no longer matches the version the client wrote against."""
+
+
+class BookStateConflict(Exception):
+    """The book is not in the state the operation needs, e.g. already borrowed."""
+
+
 class BookService:
-    def __init__(self, book_repo, member_repo):
-        self.book_repo = book_repo
-        self.member_repo = member_repo
+    def __init__(self, uow):
+        self.uow = uow
 
     async def create_book(self, book):
-        existing = await self.book_repo.get_by_id(book.book_id)
+        existing = await self.uow.books.get_by_id(book.book_id)
         if existing:
             raise Exception("Book already exists")
 
-        await self.book_repo.create(book)
+        await self.uow.books.create(book)
+        await self.uow.commit()
         return book
 
+    async def create_books(self, books):
+        """Insert many books in one transaction.
+
+        Returns ``(book, status)`` pairs in input order, where status is
+        "created" or "conflict" (id already stored or repeated in the batch).
+        """
+        unique, seen = [], set()
+        for book in books:
+            if book.book_id not in seen:
+                seen.add(book.book_id)
+                unique.append(book)
+
+        created = await self.uow.books.create_many(unique)
+        await self.uow.commit()
+
+        results = []
+        for book in books:
+            if book.book_id in created:
+                created.discard(book.book_id)
+                results.append((book, "created"))
+            else:
+                results.append((book, "conflict"))
+        return results
+
+    async def delete_books(self, book_ids):
+        """Delete many books; returns ``(book_id, status)`` pairs in input order."""
+        deleted = await self.uow.books.delete_many(list(dict.fromkeys(book_ids)))
+        await self.uow.commit()
+        return [
+            (book_id, "deleted" if book_id in deleted else "not_found")
+            for book_id in book_ids
+        ]
+
     async def borrow_book(self, book_id: UUID, member_id):
-        book = await self.book_repo.get_by_id(book_id)
+        book = await self.uow.books.borrow(book_id, member_id)
         if not book:
-            raise Exception("Book not found")
-
-        member = await self.member_repo.get_by_id(member_id)
-        if not member:
+            # The conditional update matched nothing; work out which guard failed.
+            current = await self.uow.books.get_by_id(book_id)
+            if not current:
+                raise Exception("Book not found")
+            if current.is_borrowed:
+                raise BookStateConflict("Book is already borrowed")
             raise Exception("Member not found")
 
-        book.borrow(member_id)
-        await self.book_repo.update_state(book)
+        await self.uow.commit()
         return book
 
     async def get_book_by_id(self, book_id: UUID):
-        book = await self.book_repo.get_by_id(book_id)
+        book = await self.uow.books.get_by_id(book_id)
         if not book:
             raise Exception("Book not found")
 
         return book
 
+    async def get_books(self, book_ids):
+        """Look up many books at once.
+
+        Returns the books found, in request order without repeats, and the
+        requested ids that do not exist.
+        """
+        unique = list(dict.fromkeys(book_ids))
+        found = {book.book_id: book for book in await self.uow.books.get_many(unique)}
+        books = [found[book_id] for book_id in unique if book_id in found]
+        missing = [book_id for book_id in unique if book_id not in found]
+        return books, missing
+
     async def return_book(self, book_id: UUID):
-        book = await self.book_repo.get_by_id(book_id)
+        book = await self.uow.books.return_book(book_id)
         if not book:
-            raise Exception("Book not found")
+            if not await self.uow.books.get_by_id(book_id):
+                raise Exception("Book not found")
+            raise BookStateConflict("Book is not borrowed")
 
-        book.return_book()
-        await self.book_repo.update_state(book)
+        await self.uow.commit()
         return book
 
-    async def list_books(self):
-        return await self.book_repo.list()
-
-    async def update_book(self, book_id, data):
-        book = await self.book_repo.get_by_id(book_id)
+    async def list_books(self, limit: int, after: UUID = None, **filters):
+        """Return one page of book rows and the id to continue after, if any."""
+        books = await self.uow.books.list_rows(limit + 1, after, **filters)
+        if len(books) > limit:
+            books = books[:limit]
+            return books, books[-1].book_id
+        return books, None
+
+    async def search_books(self, query: str, limit: int, prefix: bool = False, after=None):
+        """Return one page of matches and the ``(sort_key, book_id)`` to continue after."""
+        matches = await self.uow.books.search(query, limit + 1, prefix, after)
+        if len(matches) > limit:
+            matches = matches[:limit]
+            book, key = matches[-1]
+            return [book for book, _ in matches], (key, book.book_id)
+        return [book for book, _ in matches], None
+
+    def export_books(self, batch_size: int = 1000):
+        """Async iterator over batches of book rows for bulk export."""
+        return self.uow.books.stream_rows(batch_size)
+
+    async def update_book(self, book_id, data, precondition=None):
+        """Apply ``data`` to the book.
+
+        The book is read locked, bypassing the cache, so fields left out of
+        ``data`` keep their latest stored values. ``precondition(version)``
+        is checked against that stored version.
+        """
+        book = await self.uow.books.get_for_update(book_id)
         if not book:
             raise Exception("Book not found")
+        if precondition is not None and not precondition(book.version):
+            raise PreconditionFailed("Book was modified")
 
         if data.title is not None:
             book.title = data.title
@@ -56,12 +138,16 @@ class BookService:
         if data.author is not None:
             book.author = data.author
 
-        await self.book_repo.update(book)
+        expected_version = book.version if precondition is not None else None
+        if await self.uow.books.update(book, expected_version) is None:
+            raise PreconditionFailed("Book was modified")
+        await self.uow.commit()
         return book
 
     async def delete_book(self, book_id):
-        book = await self.book_repo.get_by_id(book_id)
+        book = await self.uow.books.get_by_id(book_id)
         if not book:
             raise Exception("Book not found")
 
-        await self.book_repo.delete(book_id)
+        await self.uow.books.delete(book_id)
+        await self.uow.commit()
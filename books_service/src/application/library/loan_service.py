@@ -0,0 +1,29 @@
+from uuid import UUID
+
+
+class LoanService:
+    def __init__(self, uow):
+        self.uow = uow
+
+    @staticmethod
+    def _page(loans, limit):
+        if len(loans) > limit:
+            loans = loans[:limit]
+            return loans, loans[-1].loan_id
+        return loans, None
+
+    async def list_book_loans(self, book_id: UUID, limit: int, before: int = None, active: bool = None):
+        """Return one page of the book's loans, newest first, and the id to continue before."""
+        if not await self.uow.books.get_by_id(book_id):
+            raise Exception("Book not found")
+
+        loans = await self.uow.loans.list_for_book(book_id, limit + 1, before, active)
+        return self._page(loans, limit)
+
+    async def list_member_loans(self, member_id: UUID, limit: int, before: int = None, active: bool = None):
+        """Return one page of the member's loans, newest first, and the id to continue before."""
+        if not await self.uow.members.get_by_id(member_id):
+            raise Exception("Member not found")
+
+        loans = await self.uow.loans.list_for_member(member_id, limit + 1, before, active)
+        return self._page(loans, limit)
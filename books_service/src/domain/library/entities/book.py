@@ -1,29 +1,18 @@
-from datetime import datetime, timezone
 from uuid import UUID
 
 
 class Book:
+    __slots__ = ("book_id", "title", "author", "borrowed_by", "borrowed_date", "version")
+
     def __init__(self, book_id: UUID, title: str, author: str):
         self.book_id = book_id
         self.title = title
         self.author = author
         self.borrowed_by = None
         self.borrowed_date = None
+        # Bumped by the repository on every write; exposed to clients as the ETag.
+        self.version = 1
 
     @property
     def is_borrowed(self) -> bool:
         return self.borrowed_by is not None
-
-    def borrow(self, member_id):
-        if self.is_borrowed:
-            raise Exception("Book is already borrowed")
-
-        self.borrowed_by = member_id
-        self.borrowed_date = datetime.now(timezone.utc)
-
-    def return_book(self):
-        if not self.is_borrowed:
-            raise Exception("Book is not borrowed")
-
-        self.borrowed_by = None
-        self.borrowed_date = None
\ No newline at end of file
@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+
+class Loan:
+    """One borrowing of a book by a member; open until ``returned_at`` is set."""
+
+    __slots__ = ("loan_id", "book_id", "member_id", "borrowed_at", "returned_at")
+
+    def __init__(
+        self,
+        loan_id: int,
+        book_id: UUID,
+        member_id: UUID,
+        borrowed_at: datetime,
+        returned_at: Optional[datetime] = None,
+    ):
+        self.loan_id = loan_id
+        self.book_id = book_id
+        self.member_id = member_id
+        self.borrowed_at = borrowed_at
+        self.returned_at = returned_at
+
+    @property
+    def is_open(self) -> bool:
+        return self.returned_at is None
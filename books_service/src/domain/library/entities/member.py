@@ -1,5 +1,7 @@
 from uuid import UUID
 
 class Member:
+    __slots__ = ("member_id",)
+
     def __init__(self, id: UUID):
         self.member_id = id
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 from src.domain.library.entities.book import Book
 from uuid import UUID
 
@@ -10,7 +10,59 @@ class BookRepository(ABC):
         pass
 
     @abstractmethod
-    def list(self) -> List[Book]:
+    def get_for_update(self, book_id: UUID) -> Optional[Book]:
+        """The stored book, locked until the unit of work ends."""
+        pass
+
+    @abstractmethod
+    def get_many(self, book_ids: List[UUID]) -> List[Book]:
+        """Books for the ids that exist, in no particular order."""
+        pass
+
+    @abstractmethod
+    def list(
+        self,
+        limit: int,
+        after: Optional[UUID] = None,
+        author: Optional[str] = None,
+        title_prefix: Optional[str] = None,
+        is_borrowed: Optional[bool] = None,
+        borrowed_by: Optional[UUID] = None,
+    ) -> List[Book]:
+        """Up to ``limit`` books ordered by id, starting after ``after``."""
+        pass
+
+    @abstractmethod
+    def list_rows(
+        self,
+        limit: int,
+        after: Optional[UUID] = None,
+        author: Optional[str] = None,
+        title_prefix: Optional[str] = None,
+        is_borrowed: Optional[bool] = None,
+        borrowed_by: Optional[UUID] = None,
+    ) -> List[tuple]:
+        """Same as ``list`` but as read-only rows, without building entities.
+
+        Each row has the book_id, title, author, is_borrowed, borrowed_by,
+        borrowed_date and version fields, in that order.
+        """
+        pass
+
+    @abstractmethod
+    def search(
+        self,
+        query: str,
+        limit: int,
+        prefix: bool = False,
+        after: Optional[Tuple] = None,
+    ) -> List[Tuple[Book, object]]:
+        """Books matching ``query`` with the sort key each was ordered by.
+
+        Full-text mode orders by relevance; prefix mode completes titles in
+        alphabetical order. ``after`` is a ``(sort_key, book_id)`` position
+        from a previous page.
+        """
         pass
 
     @abstractmethod
@@ -18,10 +70,43 @@ class BookRepository(ABC):
         pass
 
     @abstractmethod
-    def update(self, book: Book) -> None:
+    def create_many(self, books: List[Book]) -> Set[UUID]:
+        """Insert books, skipping existing ids. Returns the inserted ids."""
+        pass
+
+    @abstractmethod
+    def delete_many(self, book_ids: List[UUID]) -> Set[UUID]:
+        """Delete books by id. Returns the ids that were deleted."""
+        pass
+
+    @abstractmethod
+    def update(self, book: Book, expected_version: Optional[int] = None) -> Optional[int]:
+        """Write title and author, bumping the version.
+
+        With ``expected_version`` the write only applies if the stored
+        version still matches. Returns the new version, or None when no
+        row was updated.
+        """
         pass
 
     @abstractmethod
     def delete(self, book_id: UUID) -> None:
         pass
 
+    @abstractmethod
+    def borrow(self, book_id: UUID, member_id: UUID) -> Optional[Book]:
+        """Mark the book borrowed if it is available and the member exists,
+        and open a loan for it.
+
+        Returns None when nothing was updated.
+        """
+        pass
+
+    @abstractmethod
+    def return_book(self, book_id: UUID) -> Optional[Book]:
+        """Clear the loan if the book is borrowed and close its history row.
+
+        Returns None otherwise.
+        """
+        pass
+
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from src.domain.library.entities.loan import Loan
+from uuid import UUID
+
+class LoanRepository(ABC):
+
+    @abstractmethod
+    def list_for_book(
+        self,
+        book_id: UUID,
+        limit: int,
+        before: Optional[int] = None,
+        active: Optional[bool] = None,
+    ) -> List[Loan]:
+        """Up to ``limit`` loans of the book, newest first, older than ``before``."""
+        pass
+
+    @abstractmethod
+    def list_for_member(
+        self,
+        member_id: UUID,
+        limit: int,
+        before: Optional[int] = None,
+        active: Optional[bool] = None,
+    ) -> List[Loan]:
+        """Up to ``limit`` loans of the member, newest first, older than ``before``."""
+        pass
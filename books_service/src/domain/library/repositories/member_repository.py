@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List
 from uuid import UUID
 from src.domain.library.entities.member import Member
 
@@ -11,3 +12,7 @@ class MemberRepository(ABC):
     @abstractmethod
     async def get_by_id(self, member_id: UUID):
         pass
+
+    @abstractmethod
+    async def create_many(self, member_ids: List[UUID]) -> int:
+        pass
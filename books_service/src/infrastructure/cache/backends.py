@@ -0,0 +1,233 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Iterable, List, Optional
+from src.infrastructure.cache.config import CACHE_RESUBSCRIBE_BACKOFF_S, CACHE_RESUBSCRIBE_MAX_BACKOFF_S
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """Byte-oriented key/value store with invalidation broadcast.
+
+    Shared backends also deliver invalidations published by other replicas
+    to ``subscribe`` callbacks, so near-caches can drop their copies.
+    """
+
+    evictions = 0
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, keys: Iterable[str]) -> None:
+        pass
+
+    async def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        """Values for ``keys`` in order; backends with a batch command override this."""
+        return [await self.get(key) for key in keys]
+
+    async def set_many(self, items: dict, ttl: float) -> None:
+        for key, value in items.items():
+            await self.set(key, value, ttl)
+
+    async def publish_invalidation(self, keys: List[str]) -> None:
+        """Tell other replicas to drop ``keys``. Local-only backends do nothing."""
+
+    async def subscribe(
+        self,
+        callback: Callable[[List[str]], None],
+        on_reconnect: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Register ``callback`` for invalidations published by any replica.
+
+        ``on_reconnect`` is called after a lost subscription is restored,
+        since invalidations published in between were never delivered.
+        """
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Process-local LRU with per-entry TTL; also used as a near-cache."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    async def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key, value, ttl):
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, keys):
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def delete_now(self, keys):
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis-backed shared cache with pub/sub invalidation between replicas.
+
+    Requires the optional ``redis`` package (``poetry install -E cache``).
+    """
+
+    def __init__(self, url: str, channel: str):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis needs the 'redis' package installed") from e
+
+        self._client = redis.from_url(url)
+        self._channel = channel
+        self._listener = None
+
+    async def get(self, key):
+        return await self._client.get(key)
+
+    async def set(self, key, value, ttl):
+        await self._client.set(key, value, px=int(ttl * 1000))
+
+    async def get_many(self, keys):
+        if not keys:
+            return []
+        return await self._client.mget(keys)
+
+    async def set_many(self, items, ttl):
+        if not items:
+            return
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, value, px=int(ttl * 1000))
+            await pipe.execute()
+
+    async def delete(self, keys):
+        keys = list(keys)
+        if keys:
+            await self._client.delete(*keys)
+
+    async def publish_invalidation(self, keys):
+        if keys:
+            await self._client.publish(self._channel, "\n".join(keys))
+
+    async def subscribe(self, callback, on_reconnect=None):
+        pubsub = await self._subscribe()
+        self._listener = asyncio.create_task(
+            self._listen(pubsub, callback, on_reconnect), name="CacheInvalidationListener"
+        )
+
+    async def _subscribe(self):
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self._channel)
+        return pubsub
+
+    async def _listen(self, pubsub, callback, on_reconnect):
+        """Deliver invalidations until cancelled, resubscribing with backoff
+        whenever the connection is lost."""
+        failures = 0
+        while True:
+            try:
+                if pubsub is None:
+                    pubsub = await self._subscribe()
+                    logger.info("Cache invalidation channel resubscribed", extra={"attempts": failures})
+                    failures = 0
+                    if on_reconnect is not None:
+                        on_reconnect()
+                async for message in pubsub.listen():
+                    data = message["data"]
+                    if isinstance(data, bytes):
+                        data = data.decode("utf-8")
+                    callback(data.split("\n"))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Cache invalidation channel lost", exc_info=True, extra={"attempt": failures + 1})
+            failures += 1
+            if pubsub is not None:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+                pubsub = None
+            # The exponent is clamped first: 2.0 ** 1024 overflows a float.
+            await asyncio.sleep(min(
+                CACHE_RESUBSCRIBE_BACKOFF_S * 2 ** min(failures - 1, 16), CACHE_RESUBSCRIBE_MAX_BACKOFF_S
+            ))
+
+    async def close(self):
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+        await self._client.aclose()
+
+
+class FakeNetwork:
+    """In-process stand-in for a shared store plus its pub/sub channel."""
+
+    def __init__(self, max_size: int = 100000):
+        self.store = MemoryCacheBackend(max_size)
+        self.subscribers = []
+
+
+class FakeNetworkCacheBackend(CacheBackend):
+    """Behaves like the Redis backend but keeps everything in memory.
+
+    Several instances sharing one ``FakeNetwork`` act like replicas talking
+    to the same server, which makes coherence testable without Redis.
+    """
+
+    default_network = FakeNetwork()
+
+    def __init__(self, network: FakeNetwork = None):
+        self.network = network or self.default_network
+
+    async def get(self, key):
+        return await self.network.store.get(key)
+
+    async def set(self, key, value, ttl):
+        await self.network.store.set(key, value, ttl)
+
+    async def delete(self, keys):
+        await self.network.store.delete(keys)
+
+    async def publish_invalidation(self, keys):
+        for callback in list(self.network.subscribers):
+            callback(list(keys))
+
+    async def subscribe(self, callback, on_reconnect=None):
+        # The in-process channel never drops, so on_reconnect is never due.
+        self.network.subscribers.append(callback)
@@ -0,0 +1,94 @@
+from uuid import UUID
+
+
+class CachedBookRepository:
+    """Read-through cache in front of a book repository.
+
+    ``get_by_id`` is served from the shared book cache. Every write drops
+    the affected keys immediately and once more after the unit of work
+    commits, so a read racing the transaction cannot leave the old row
+    cached. Other calls go straight to the wrapped repository.
+    """
+
+    def __init__(self, repo, cache, on_commit):
+        self._repo = repo
+        self._cache = cache
+        self._pending = set()
+        on_commit(self._invalidate_pending)
+
+    def __getattr__(self, name):
+        return getattr(self._repo, name)
+
+    async def _invalidate(self, *book_ids):
+        self._pending.update(book_ids)
+        await self._cache.invalidate(*book_ids)
+
+    async def _invalidate_pending(self):
+        pending, self._pending = self._pending, set()
+        await self._cache.invalidate(*pending)
+
+    async def get_by_id(self, book_id: UUID):
+        return await self._cache.get_or_load(book_id, lambda: self._repo.get_by_id(book_id))
+
+    async def get_many(self, book_ids):
+        found = await self._cache.get_many_or_load(book_ids, self._load_many)
+        return list(found.values())
+
+    async def _load_many(self, book_ids):
+        return {book.book_id: book for book in await self._repo.get_many(book_ids)}
+
+    async def update(self, book, expected_version=None):
+        await self._invalidate(book.book_id)
+        return await self._repo.update(book, expected_version)
+
+    async def delete(self, book_id: UUID):
+        await self._invalidate(book_id)
+        await self._repo.delete(book_id)
+
+    async def delete_many(self, book_ids):
+        await self._invalidate(*book_ids)
+        return await self._repo.delete_many(book_ids)
+
+    async def borrow(self, book_id: UUID, member_id: UUID):
+        await self._invalidate(book_id)
+        return await self._repo.borrow(book_id, member_id)
+
+    async def return_book(self, book_id: UUID):
+        await self._invalidate(book_id)
+        return await self._repo.return_book(book_id)
+
+
+class CachedMemberRepository:
+    """Read-through cache for the local member replica.
+
+    Rows only appear through the member-created consumer, so inserting ids
+    is the invalidation event.
+    """
+
+    def __init__(self, repo, cache, on_commit):
+        self._repo = repo
+        self._cache = cache
+        self._pending = set()
+        on_commit(self._invalidate_pending)
+
+    def __getattr__(self, name):
+        return getattr(self._repo, name)
+
+    async def _invalidate(self, *member_ids):
+        self._pending.update(member_ids)
+        await self._cache.invalidate(*member_ids)
+
+    async def _invalidate_pending(self):
+        pending, self._pending = self._pending, set()
+        await self._cache.invalidate(*pending)
+
+    async def get_by_id(self, member_id: UUID):
+        return await self._cache.get_or_load(member_id, lambda: self._repo.get_by_id(member_id))
+
+    async def create(self, member):
+        await self._invalidate(member.member_id)
+        return await self._repo.create(member)
+
+    async def create_many(self, member_ids):
+        await self._invalidate(*member_ids)
+        return await self._repo.create_many(member_ids)
@@ -0,0 +1,58 @@
+import json
+from datetime import datetime
+from uuid import UUID
+from src.domain.library.entities.book import Book
+from src.domain.library.entities.member import Member
+
+# Entities are stored as small positional JSON arrays (never pickled ORM
+# objects), so any replica can decode them and entries stay compact.
+_SEPARATORS = (",", ":")
+
+
+def _hex(value):
+    return value.hex if value is not None else None
+
+
+def _uuid(value):
+    return UUID(hex=value) if value is not None else None
+
+
+class BookCodec:
+    # Bump the prefix whenever the array layout changes, so replicas running
+    # the old layout never read entries they cannot decode.
+    prefix = "b2"
+
+    @staticmethod
+    def encode(book: Book) -> bytes:
+        return json.dumps(
+            [
+                book.book_id.hex,
+                book.title,
+                book.author,
+                _hex(book.borrowed_by),
+                book.borrowed_date.isoformat() if book.borrowed_date else None,
+                book.version,
+            ],
+            separators=_SEPARATORS,
+        ).encode("utf-8")
+
+    @staticmethod
+    def decode(data: bytes) -> Book:
+        book_id, title, author, borrowed_by, borrowed_date, version = json.loads(data)
+        book = Book(book_id=UUID(hex=book_id), title=title, author=author)
+        book.borrowed_by = _uuid(borrowed_by)
+        book.borrowed_date = datetime.fromisoformat(borrowed_date) if borrowed_date else None
+        book.version = version
+        return book
+
+
+class MemberCodec:
+    prefix = "m"
+
+    @staticmethod
+    def encode(member: Member) -> bytes:
+        return member.member_id.hex.encode("ascii")
+
+    @staticmethod
+    def decode(data: bytes) -> Member:
+        return Member(UUID(hex=data.decode("ascii")))
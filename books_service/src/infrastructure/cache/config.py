@@ -0,0 +1,17 @@
+import os
+
+from src.infrastructure.env import env_bool
+
+CACHE_ENABLED = env_bool("CACHE_ENABLED", True)
+# memory | redis | fake
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+CACHE_NAMESPACE = os.getenv("CACHE_NAMESPACE", "books")
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+CACHE_TTL_S = float(os.getenv("CACHE_TTL_S", "30"))
+# Near-cache kept in each replica in front of a shared backend.
+CACHE_LOCAL_TTL_S = float(os.getenv("CACHE_LOCAL_TTL_S", "5"))
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://redis:6379/0")
+CACHE_INVALIDATION_CHANNEL = os.getenv("CACHE_INVALIDATION_CHANNEL", "cache-invalidation")
+# Retry delays after the invalidation subscription drops.
+CACHE_RESUBSCRIBE_BACKOFF_S = float(os.getenv("CACHE_RESUBSCRIBE_BACKOFF_S", "0.5"))
+CACHE_RESUBSCRIBE_MAX_BACKOFF_S = float(os.getenv("CACHE_RESUBSCRIBE_MAX_BACKOFF_S", "30"))
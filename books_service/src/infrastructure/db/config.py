@@ -1,6 +1,21 @@
 import os
 
+from src.infrastructure.env import env_bool
+
 DATABASE_URL = os.getenv("DATABASE_URL")
 
 if not DATABASE_URL:
-    raise RuntimeError("DATABASE_URL is not set")
\ No newline at end of file
+    raise RuntimeError("DATABASE_URL is not set")
+
+DB_ECHO = env_bool("DB_ECHO", False)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = env_bool("DB_POOL_PRE_PING", True)
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "5000"))
+# Migrations normally run once per deploy (python -m src.infrastructure.db.migrate);
+# set this to let every app start apply them instead, e.g. for local development.
+DB_MIGRATE_ON_STARTUP = env_bool("DB_MIGRATE_ON_STARTUP", False)
+# How long a migration's DDL may wait for a table lock before failing.
+DB_MIGRATION_LOCK_TIMEOUT_MS = int(os.getenv("DB_MIGRATION_LOCK_TIMEOUT_MS", "5000"))
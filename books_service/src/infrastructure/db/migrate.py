@@ -0,0 +1,189 @@
+"""Versioned schema migrations.
+
+Migrations are the modules in ``migrations/`` named ``NNNN_description.py``.
+They are applied in order and recorded in ``schema_migrations``. Each one
+defines ``STATEMENTS``; by default they run in a single transaction
+together with the bookkeeping row.
+
+A migration that sets ``TRANSACTIONAL = False`` runs each statement on
+its own instead, which ``CREATE INDEX CONCURRENTLY`` requires. Those
+statements must be safe to repeat (``IF NOT EXISTS``); an index left
+invalid by an interrupted concurrent build is dropped and rebuilt.
+
+    python -m src.infrastructure.db.migrate            # apply pending migrations
+    python -m src.infrastructure.db.migrate --status   # list them, change nothing
+"""
+import argparse
+import asyncio
+import importlib
+import logging
+import pkgutil
+import re
+from contextlib import asynccontextmanager
+from pathlib import Path
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from src.infrastructure.db.config import DATABASE_URL, DB_MIGRATION_LOCK_TIMEOUT_MS
+from src.infrastructure.observability.logs import configure_logging
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+MIGRATIONS_PACKAGE = "src.infrastructure.db.migrations"
+
+_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version VARCHAR PRIMARY KEY,
+        name VARCHAR NOT NULL,
+        applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+    )
+"""
+# Held for the whole run, so pods starting together apply each migration once.
+# Waiters poll rather than block: a session stuck in pg_advisory_lock is a
+# running transaction, and CREATE INDEX CONCURRENTLY would wait for it.
+_TRY_LOCK = "SELECT pg_try_advisory_lock(hashtext('schema_migrations'))"
+_LOCK_POLL_S = 1.0
+_UNLOCK = "SELECT pg_advisory_unlock(hashtext('schema_migrations'))"
+_CONCURRENT_INDEX = re.compile(r"INDEX\s+CONCURRENTLY\s+IF\s+NOT\s+EXISTS\s+(\w+)", re.IGNORECASE)
+
+
+class Migration:
+    def __init__(self, module_name: str):
+        module = importlib.import_module(f"{MIGRATIONS_PACKAGE}.{module_name}")
+        self.version, _, self.name = module_name.partition("_")
+        self.statements = module.STATEMENTS
+        self.transactional = getattr(module, "TRANSACTIONAL", True)
+
+
+@asynccontextmanager
+async def _connect(target_engine):
+    """A connection of its own unless ``target_engine`` is given.
+
+    The session settings changed here (``statement_timeout``) must not reach
+    the application's pool, whose connections keep DB_STATEMENT_TIMEOUT_MS,
+    so by default the connection comes from an unpooled engine and is closed
+    afterwards.
+    """
+    own_engine = target_engine is None
+    if own_engine:
+        target_engine = create_async_engine(DATABASE_URL, poolclass=NullPool)
+    try:
+        async with target_engine.connect() as conn:
+            yield conn
+    finally:
+        if own_engine:
+            await target_engine.dispose()
+
+
+def discover() -> list:
+    names = sorted(info.name for info in pkgutil.iter_modules([str(MIGRATIONS_DIR)]))
+    return [Migration(name) for name in names]
+
+
+async def _lock(conn):
+    if await conn.scalar(text(_TRY_LOCK)):
+        return
+    logger.info("Waiting for another migration run to finish")
+    while not await conn.scalar(text(_TRY_LOCK)):
+        await asyncio.sleep(_LOCK_POLL_S)
+
+
+async def _applied(conn) -> set:
+    result = await conn.execute(text("SELECT version FROM schema_migrations"))
+    return set(result.scalars())
+
+
+async def _record(conn, migration: Migration):
+    await conn.execute(
+        text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"),
+        {"version": migration.version, "name": migration.name},
+    )
+
+
+async def _drop_invalid_index(conn, statement: str):
+    match = _CONCURRENT_INDEX.search(statement)
+    if not match:
+        return
+    invalid = await conn.scalar(
+        text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": match.group(1)},
+    )
+    if invalid:
+        logger.warning("Dropping invalid index left by an interrupted build", extra={"index": match.group(1)})
+        await conn.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {match.group(1)}")
+
+
+async def _apply(conn, migration: Migration):
+    """Run one migration; ``conn`` is in autocommit mode."""
+    if migration.transactional:
+        await conn.exec_driver_sql("BEGIN")
+        try:
+            # A DDL statement queued behind a long transaction stalls every
+            # query on its table, so it gives up instead of waiting.
+            await conn.exec_driver_sql(f"SET LOCAL lock_timeout = {DB_MIGRATION_LOCK_TIMEOUT_MS}")
+            for statement in migration.statements:
+                await conn.exec_driver_sql(statement)
+            await _record(conn, migration)
+        except BaseException:
+            await conn.exec_driver_sql("ROLLBACK")
+            raise
+        await conn.exec_driver_sql("COMMIT")
+        return
+
+    for statement in migration.statements:
+        await _drop_invalid_index(conn, statement)
+        await conn.exec_driver_sql(statement)
+    await _record(conn, migration)
+
+
+async def migrate(target_engine=None) -> list:
+    """Apply pending migrations in order; returns the versions applied."""
+    migrations = discover()
+    applied_now = []
+    async with _connect(target_engine) as conn:
+        # Autocommit, so concurrent index builds can run; transactional
+        # migrations open their own transaction.
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        # Index builds may take minutes.
+        await conn.exec_driver_sql("SET statement_timeout = 0")
+        await _lock(conn)
+        try:
+            await conn.exec_driver_sql(_CREATE_TABLE)
+            done = await _applied(conn)
+            for migration in migrations:
+                if migration.version in done:
+                    continue
+                logger.info("Applying migration", extra={"version": migration.version, "migration": migration.name})
+                await _apply(conn, migration)
+                applied_now.append(migration.version)
+        finally:
+            await conn.exec_driver_sql(_UNLOCK)
+    return applied_now
+
+
+async def status(target_engine=None) -> list:
+    """``(version, name, applied)`` for every known migration."""
+    async with _connect(target_engine) as conn:
+        exists = await conn.scalar(text("SELECT to_regclass('schema_migrations') IS NOT NULL"))
+        done = await _applied(conn) if exists else set()
+    return [(m.version, m.name, m.version in done) for m in discover()]
+
+
+async def _main(args):
+    if args.status:
+        for version, name, applied in await status():
+            print(f"{version}  {'applied' if applied else 'pending':8} {name}")
+        return
+    applied = await migrate()
+    logger.info("Database is up to date", extra={"applied": applied})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply the service's schema migrations.")
+    parser.add_argument("--status", action="store_true", help="list migrations without applying any")
+    configure_logging()
+    asyncio.run(_main(parser.parse_args()))
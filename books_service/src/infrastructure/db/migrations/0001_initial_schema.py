@@ -0,0 +1,49 @@
+"""Tables, as they were first created by create_all at app start.
+
+Every statement tolerates a database that create_all already built, so
+existing deployments adopt migrations by recording this version.
+"""
+
+STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS members (
+        member_id UUID NOT NULL,
+        PRIMARY KEY (member_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS books (
+        book_id UUID NOT NULL,
+        title VARCHAR NOT NULL,
+        author VARCHAR NOT NULL,
+        borrowed_by UUID,
+        borrowed_date TIMESTAMP WITH TIME ZONE,
+        is_borrowed BOOLEAN NOT NULL,
+        PRIMARY KEY (book_id),
+        FOREIGN KEY (borrowed_by) REFERENCES members (member_id)
+    )
+    """,
+    # Columns added after the first deploy.
+    "ALTER TABLE books ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1",
+    """
+    CREATE TABLE IF NOT EXISTS loans (
+        loan_id BIGSERIAL NOT NULL,
+        book_id UUID NOT NULL,
+        member_id UUID NOT NULL,
+        borrowed_at TIMESTAMP WITH TIME ZONE NOT NULL,
+        returned_at TIMESTAMP WITH TIME ZONE,
+        PRIMARY KEY (loan_id),
+        FOREIGN KEY (book_id) REFERENCES books (book_id) ON DELETE CASCADE,
+        FOREIGN KEY (member_id) REFERENCES members (member_id)
+    )
+    """,
+    # At most one open loan per book; the backfill below relies on it.
+    "CREATE UNIQUE INDEX IF NOT EXISTS ux_loans_open_book_id ON loans (book_id) WHERE returned_at IS NULL",
+    # Books already on loan before the loans table existed get their open loan.
+    """
+    INSERT INTO loans (book_id, member_id, borrowed_at)
+    SELECT book_id, borrowed_by, COALESCE(borrowed_date, now()) FROM books
+    WHERE is_borrowed IS true AND borrowed_by IS NOT NULL
+    ON CONFLICT (book_id) WHERE returned_at IS NULL DO NOTHING
+    """,
+)
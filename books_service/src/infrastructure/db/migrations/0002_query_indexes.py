@@ -0,0 +1,26 @@
+"""Indexes behind the list, search and loan history queries.
+
+Built concurrently, so reads and writes carry on while they build.
+"""
+
+# CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+TRANSACTIONAL = False
+
+STATEMENTS = (
+    # Every list query pages by book_id, so each filter index ends with it.
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_books_author_book_id ON books (author, book_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_books_borrowed_by_book_id ON books (borrowed_by, book_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_books_borrowed_book_id ON books (book_id) WHERE is_borrowed IS true",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_books_title_prefix ON books (title text_pattern_ops)",
+    # Byte-ordered, so one index serves both the LIKE 'prefix%' range and
+    # the ORDER BY of autocomplete pages.
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_books_title_lower_c ON books ((lower(title) COLLATE "C"), book_id)',
+    # Full-text search over the expression itself, see models.SEARCH_DOCUMENT.
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_books_search_document ON books USING gin (("
+    "setweight(to_tsvector('simple', title), 'A') || "
+    "setweight(to_tsvector('simple', author), 'B')))",
+    # Loan pages are newest first by loan_id, so every lookup index ends with it.
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_loans_book_id_loan_id ON loans (book_id, loan_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_loans_member_id_loan_id ON loans (member_id, loan_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_loans_member_id_returned_at ON loans (member_id, returned_at, loan_id)",
+)
@@ -1,8 +1,22 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, BigInteger, literal_column, text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from src.infrastructure.db.connection import Base
 import uuid
 
+
+# Titles rank above authors. The 'simple' configuration does no stemming or
+# stop-word removal, which suits names and titles in any language.
+# Nothing is stored per row: ix_books_search_document indexes this exact
+# expression, and queries must spell it the same way to use the index.
+SEARCH_DOCUMENT = literal_column(
+    "setweight(to_tsvector('simple', books.title), 'A') || "
+    "setweight(to_tsvector('simple', books.author), 'B')",
+    TSVECTOR,
+)
+
+# The tables and their indexes are created by the migrations in
+# src/infrastructure/db/migrations; these classes only map them.
+
 class BookModel(Base):
     __tablename__ = "books"
 
@@ -13,9 +27,22 @@ class BookModel(Base):
     borrowed_by = Column(UUID(as_uuid=True), ForeignKey("members.member_id"), nullable=True)
     borrowed_date = Column(DateTime(timezone = True), nullable=True)
     is_borrowed = Column(Boolean, nullable=False, default=False)
+    version = Column(Integer, nullable=False, default=1, server_default=text("1"))
 
 
 class MemberModel(Base):
     __tablename__ = "members"
 
-    member_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
\ No newline at end of file
+    member_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+
+class LoanModel(Base):
+    """Loan history; rows are never deleted when a book is returned."""
+
+    __tablename__ = "loans"
+
+    loan_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    book_id = Column(UUID(as_uuid=True), ForeignKey("books.book_id", ondelete="CASCADE"), nullable=False)
+    member_id = Column(UUID(as_uuid=True), ForeignKey("members.member_id"), nullable=False)
+    borrowed_at = Column(DateTime(timezone=True), nullable=False)
+    returned_at = Column(DateTime(timezone=True), nullable=True)
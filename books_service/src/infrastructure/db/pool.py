@@ -0,0 +1,30 @@
+import time
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from src.infrastructure.observability.metrics import DB_POOL_CHECKOUT_WAIT, DB_POOL_TIMEOUTS
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long each checkout waited."""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            DB_POOL_TIMEOUTS.inc()
+            raise
+        DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+        return connection
+
+
+def pool_snapshot(pool) -> dict:
+    """Current pool gauges; ``capacity`` is None when overflow is unbounded."""
+    max_overflow = getattr(pool, "_max_overflow", 0)
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "capacity": pool.size() + max_overflow if max_overflow >= 0 else None,
+    }
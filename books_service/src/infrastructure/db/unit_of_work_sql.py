@@ -0,0 +1,57 @@
+import time
+from src.application.library.unit_of_work import UnitOfWork
+from src.infrastructure.db.session import AsyncSessionLocal
+from src.infrastructure.repositories.book_repo_sql import BookRepositorySQL
+from src.infrastructure.repositories.member_repo_sql import MemberRepositorySQL
+from src.infrastructure.repositories.loan_repo_sql import LoanRepositorySQL
+from src.infrastructure.cache.cached_repositories import CachedBookRepository, CachedMemberRepository
+from src.infrastructure.cache.caches import book_cache, member_cache
+from src.infrastructure.cache.config import CACHE_ENABLED
+from src.infrastructure.observability.metrics import DB_SESSIONS_ACTIVE, DB_SESSION_DURATION
+
+
+class UnitOfWorkSQL(UnitOfWork):
+    """Opens one session per unit of work and shares it between repositories.
+
+    Nothing is persisted unless ``commit`` is called; leaving the block
+    without committing rolls the transaction back.
+    """
+
+    def __init__(self, session_factory=AsyncSessionLocal, use_cache: bool = CACHE_ENABLED):
+        self.session_factory = session_factory
+        self.use_cache = use_cache
+        self.session = None
+        self._commit_hooks = []
+        self._opened_at = 0.0
+
+    async def __aenter__(self):
+        self.session = self.session_factory()
+        self._opened_at = time.perf_counter()
+        DB_SESSIONS_ACTIVE.inc()
+        self.books = BookRepositorySQL(self.session)
+        self.members = MemberRepositorySQL(self.session)
+        self.loans = LoanRepositorySQL(self.session)
+        if self.use_cache:
+            self.books = CachedBookRepository(self.books, book_cache, self.on_commit)
+            self.members = CachedMemberRepository(self.members, member_cache, self.on_commit)
+        return await super().__aenter__()
+
+    def on_commit(self, callback):
+        """Await ``callback()`` after every successful commit."""
+        self._commit_hooks.append(callback)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            await super().__aexit__(exc_type, exc, tb)
+        finally:
+            DB_SESSIONS_ACTIVE.dec()
+            DB_SESSION_DURATION.observe(time.perf_counter() - self._opened_at)
+            await self.session.close()
+
+    async def commit(self):
+        await self.session.commit()
+        for callback in self._commit_hooks:
+            await callback()
+
+    async def rollback(self):
+        await self.session.rollback()
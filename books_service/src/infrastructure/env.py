@@ -0,0 +1,9 @@
+import os
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """Read a flag from the environment; 1/true/yes/on (any case) mean true."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
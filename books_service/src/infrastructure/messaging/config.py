@@ -0,0 +1,22 @@
+import os
+
+KAFKA_BOOTSTRAP_SERVERS = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "kafka:9092")
+KAFKA_MEMBER_CREATED_TOPIC = os.getenv("KAFKA_MEMBER_CREATED_TOPIC", "member-created")
+KAFKA_CONSUMER_GROUP = os.getenv("KAFKA_CONSUMER_GROUP", "books-member-consumer-group")
+KAFKA_DLQ_TOPIC = os.getenv("KAFKA_DLQ_TOPIC", "member-created.dlq")
+
+# "embedded": the API process consumes member events itself.
+# "external": a dedicated process does (python -m src.worker); the API only serves.
+CONSUMER_MODE = os.getenv("CONSUMER_MODE", "embedded")
+if CONSUMER_MODE not in ("embedded", "external"):
+    raise RuntimeError(f"CONSUMER_MODE must be 'embedded' or 'external', got '{CONSUMER_MODE}'")
+
+CONSUMER_BATCH_SIZE = int(os.getenv("CONSUMER_BATCH_SIZE", "500"))
+CONSUMER_BATCH_TIMEOUT_S = float(os.getenv("CONSUMER_BATCH_TIMEOUT_S", "1.0"))
+CONSUMER_PARTITION_CONCURRENCY = int(os.getenv("CONSUMER_PARTITION_CONCURRENCY", "4"))
+CONSUMER_RETRY_BACKOFF_S = float(os.getenv("CONSUMER_RETRY_BACKOFF_S", "1.0"))
+# A consumer that fails to start or dies is restarted, backing off up to the max.
+CONSUMER_RESTART_BACKOFF_S = float(os.getenv("CONSUMER_RESTART_BACKOFF_S", "1.0"))
+CONSUMER_RESTART_MAX_BACKOFF_S = float(os.getenv("CONSUMER_RESTART_MAX_BACKOFF_S", "60"))
+# Prometheus endpoint of the dedicated consumer worker; 0 turns it off.
+CONSUMER_METRICS_PORT = int(os.getenv("CONSUMER_METRICS_PORT", "9100"))
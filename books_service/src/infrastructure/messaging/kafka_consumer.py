@@ -1,30 +1,102 @@
 # src/infrastructure/kafka/consumer.py
+import asyncio
 import json
+import logging
 import time
-from uuid import UUID
-from confluent_kafka import Consumer, KafkaException
-from src.domain.library.entities.member import Member
 from concurrent.futures import ThreadPoolExecutor
-import asyncio
+from uuid import UUID
+from confluent_kafka import Consumer, KafkaException, Producer, TopicPartition
+from src.infrastructure.messaging.config import (
+    KAFKA_BOOTSTRAP_SERVERS,
+    KAFKA_MEMBER_CREATED_TOPIC,
+    KAFKA_CONSUMER_GROUP,
+    KAFKA_DLQ_TOPIC,
+    CONSUMER_BATCH_SIZE,
+    CONSUMER_BATCH_TIMEOUT_S,
+    CONSUMER_PARTITION_CONCURRENCY,
+    CONSUMER_RETRY_BACKOFF_S,
+    CONSUMER_RESTART_BACKOFF_S,
+    CONSUMER_RESTART_MAX_BACKOFF_S,
+)
+from src.infrastructure.observability.metrics import (
+    KAFKA_CONSUMER_BATCH_DURATION,
+    KAFKA_CONSUMER_BATCH_SIZE,
+    KAFKA_CONSUMER_RESTARTS,
+    partition_metrics,
+)
+from src.infrastructure.observability.logs import RateLimitedLogger
+from src.infrastructure.observability.health import OK, DEGRADED, DOWN
+from src.infrastructure.observability.config import HEALTH_MAX_CONSUMER_LAG
+
+
+logger = logging.getLogger(__name__)
+# Per-batch and per-event lines, capped so a backlog replay cannot flood the log.
+_batch_log = RateLimitedLogger(logger)
+_invalid_log = RateLimitedLogger(logger)
+
+DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError, KeyError, ValueError, TypeError, AttributeError)
 
 
 class KafkaConsumerService:
-    """Simple, reliable Kafka consumer for member events."""
+    """Kafka consumer for member events running on the app's event loop.
 
-    def __init__(self, member_repo, bootstrap_servers: str = "kafka:9092"):
-        self.member_repo = member_repo
+    Messages are fetched in batches with ``consume``; the blocking librdkafka
+    calls run on one dedicated thread while decoding and the database write
+    happen on the loop. A batch is split by partition and the partitions are
+    persisted concurrently, each with a single ``INSERT ... ON CONFLICT DO
+    NOTHING``.
+
+    Offsets are committed by hand, per partition, only after that
+    partition's rows are committed to the database (at-least-once).
+    Undecodable events go to a dead-letter topic; a partition whose write
+    fails is rewound and retried.
+
+    ``start`` returns at once: the task waits for the topic and restarts
+    the consumer after failures with exponential backoff, so a missing
+    broker delays ingestion but never the API.
+    """
+
+    def __init__(
+        self,
+        uow_factory,
+        bootstrap_servers: str = KAFKA_BOOTSTRAP_SERVERS,
+        batch_size: int = CONSUMER_BATCH_SIZE,
+        batch_timeout: float = CONSUMER_BATCH_TIMEOUT_S,
+        partition_concurrency: int = CONSUMER_PARTITION_CONCURRENCY,
+    ):
+        self.uow_factory = uow_factory
         self.bootstrap_servers = bootstrap_servers
-        self.topic = "member-created"
-        self.group_id = "books-member-consumer-group"
+        self.topic = KAFKA_MEMBER_CREATED_TOPIC
+        self.group_id = KAFKA_CONSUMER_GROUP
+        self.dlq_topic = KAFKA_DLQ_TOPIC
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
         self.running = False
         self.consumer = None
-        # Thread pool for handling async operations
-        self.executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix="AsyncHandler")
-        
-        print(f"✅ Consumer service initialized")
-        print(f"   Bootstrap: {self.bootstrap_servers}")
-        print(f"   Topic: {self.topic}")
-        print(f"   Group: {self.group_id}")
+        self.dlq_producer = None
+        self.messages_processed = 0
+        self.messages_dead_lettered = 0
+        self.partition_lag = {}
+        self.restarts = 0
+        self.last_error = None
+        self._stopping = asyncio.Event()
+        self._partition_slots = asyncio.Semaphore(partition_concurrency)
+        self._task = None
+        # librdkafka calls block, so they get one thread of their own.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="KafkaConsumer")
+        logger.info(
+            "Consumer service initialized",
+            extra={
+                "bootstrap": self.bootstrap_servers,
+                "topic": self.topic,
+                "group": self.group_id,
+                "batch_size": batch_size,
+                "partition_concurrency": partition_concurrency,
+            },
+        )
+
+    async def _call(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
 
     def _initialize_consumer(self):
         """Initialize Kafka consumer with minimal, reliable configuration."""
@@ -32,158 +104,272 @@ class KafkaConsumerService:
             "bootstrap.servers": self.bootstrap_servers,
             "group.id": self.group_id,
             "auto.offset.reset": "earliest",
-            "enable.auto.commit": True,
-            "auto.commit.interval.ms": 5000,
+            # Offsets are committed explicitly once a batch is persisted.
+            "enable.auto.commit": False,
+            # librdkafka's own log lines go through the log queue, served by consume().
+            "logger": logging.getLogger("librdkafka"),
         }
 
         try:
             self.consumer = Consumer(config)
-            print(f"✅ Kafka consumer initialized")
-        except KafkaException as e:
-            print(f"❌ Failed to initialize consumer: {e}")
+            self.dlq_producer = Producer({
+                "bootstrap.servers": self.bootstrap_servers,
+                "acks": "all",
+                "enable.idempotence": True,
+                "logger": logging.getLogger("librdkafka"),
+            })
+            logger.info("Kafka consumer initialized")
+        except KafkaException:
+            logger.exception("Failed to initialize consumer")
             raise
 
-    def _wait_for_topic(self, timeout: int = 60):
-        """Wait for topic to be available."""
+    async def _sleep(self, delay: float):
+        """Sleep that ends early when ``stop`` is called."""
+        try:
+            await asyncio.wait_for(self._stopping.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+
+    def _backoff(self, attempt: int) -> float:
+        # The exponent is clamped first: 2.0 ** 1024 overflows a float.
+        return min(CONSUMER_RESTART_BACKOFF_S * 2 ** min(attempt, 16), CONSUMER_RESTART_MAX_BACKOFF_S)
+
+    async def _wait_for_topic(self):
+        """Poll broker metadata, backing off, until the topic exists or we stop."""
         from confluent_kafka.admin import AdminClient
         
-        admin = AdminClient({"bootstrap.servers": self.bootstrap_servers})
-        start = time.time()
-
-        print(f"⏳ Waiting for topic '{self.topic}'...")
+        admin = AdminClient({
+            "bootstrap.servers": self.bootstrap_servers,
+            "logger": logging.getLogger("librdkafka"),
+        })
+        logger.info("Waiting for topic", extra={"topic": self.topic})
         
-        while time.time() - start < timeout:
+        attempt = 0
+        while self.running:
             try:
-                metadata = admin.list_topics(timeout=5)
+                metadata = await self._call(lambda: admin.list_topics(timeout=2))
                 if self.topic in metadata.topics:
-                    print(f"✅ Topic '{self.topic}' is ready")
+                    logger.info("Topic is ready", extra={"topic": self.topic})
                     return True
-            except:
-                pass
+            except Exception as e:
+                self.last_error = str(e)
             
-            time.sleep(2)
-
-        print(f"❌ Topic not available after {timeout}s")
+            await self._sleep(self._backoff(attempt))
+            attempt += 1
         return False
 
-    def _run_async_in_thread(self, member_id: UUID):
-        """
-        Run async operation in a separate thread with its own event loop.
-        This is the worker function for the thread pool.
+    @staticmethod
+    def _decode(msg):
+        event = json.loads(msg.value().decode('utf-8'))
+        return UUID(event["member_id"])
+
+    async def _process_partition(self, messages):
+        """Persist one partition's slice of a batch.
+
+        Returns ``(stored, created, dead_letters)``; raises if the database
+        write fails so the caller can rewind the partition.
         """
-        # Create a new event loop for this thread
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            # Run the async operation
-            result = loop.run_until_complete(self._handle_member_async(member_id))
-            return result
-        finally:
-            loop.close()
-
-    async def _handle_member_async(self, member_id: UUID):
-        """Handle member-created event - async version."""
-        try:
-            print(f"🔍 Checking if member exists: {member_id}")
-            existing = await self.member_repo.get_by_id(member_id)
-
-            if not existing:
-                print(f"💾 Creating member: {member_id}")
-                member = Member(id=member_id)
-                await self.member_repo.create(member)
-                print(f"✅ Member created: {member_id}")
-            else:
-                print(f"ℹ️  Member already exists: {member_id}")
-                
-        except Exception as e:
-            print(f"❌ Error in async handler: {e}")
-            import traceback
-            traceback.print_exc()
+        async with self._partition_slots:
+            member_ids, dead_letters = [], []
+            for msg in messages:
+                try:
+                    member_ids.append(self._decode(msg))
+                except DECODE_ERRORS as e:
+                    dead_letters.append((msg, e))
+
+            created = 0
+            if member_ids:
+                async with self.uow_factory() as uow:
+                    created = await uow.members.create_many(list(dict.fromkeys(member_ids)))
+                    await uow.commit()
+            return len(member_ids), created, dead_letters
+
+    def _send_dead_letters(self, dead_letters) -> int:
+        """Runs on the consumer thread. Returns how many were not delivered."""
+        for msg, error in dead_letters:
+            self.dlq_producer.produce(
+                self.dlq_topic,
+                key=msg.key(),
+                value=msg.value(),
+                headers={
+                    "dlq.error": str(error),
+                    "dlq.source.topic": msg.topic(),
+                    "dlq.source.partition": str(msg.partition()),
+                    "dlq.source.offset": str(msg.offset()),
+                },
+            )
+        return self.dlq_producer.flush(10)
+
+    def _commit(self, offsets):
+        """Runs on the consumer thread: commit, then refresh the lag gauges."""
+        self.consumer.commit(offsets=offsets, asynchronous=False)
+        for tp in offsets:
+            # The cached watermark comes from the last fetch; no broker round trip.
+            _, high = self.consumer.get_watermark_offsets(tp, cached=True)
+            if high >= 0:
+                lag = max(high - tp.offset, 0)
+                self.partition_lag[(tp.topic, tp.partition)] = lag
+                partition_metrics(tp.topic, tp.partition).lag.set(lag)
+
+    async def _handle_batch(self, messages):
+        """Persist a batch partition by partition and commit what succeeded."""
+        started = time.perf_counter()
+        by_partition = {}
+        for msg in messages:
+            if msg.error():
+                logger.error("Kafka error", extra={"error": str(msg.error())})
+                continue
+            by_partition.setdefault((msg.topic(), msg.partition()), []).append(msg)
+
+        partitions = list(by_partition.items())
+        results = await asyncio.gather(
+            *(self._process_partition(msgs) for _, msgs in partitions),
+            return_exceptions=True,
+        )
+
+        to_commit, to_rewind, failed = [], [], False
+        for ((topic, partition), msgs), result in zip(partitions, results):
+            metrics = partition_metrics(topic, partition)
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Failed to persist partition batch, rewinding",
+                    exc_info=result,
+                    extra={"topic": topic, "partition": partition, "offset": msgs[0].offset()},
+                )
+                to_rewind.append(TopicPartition(topic, partition, msgs[0].offset()))
+                metrics.retries.inc()
+                failed = True
+                continue
+
+            stored, created, dead_letters = result
+            if dead_letters:
+                for msg, error in dead_letters:
+                    _invalid_log.warning(
+                        "Invalid event, sending to dead-letter topic",
+                        extra={"topic": topic, "partition": partition, "offset": msg.offset(), "error": str(error)},
+                    )
+                undelivered = await self._call(self._send_dead_letters, dead_letters)
+                if undelivered:
+                    logger.error("Dead-letter publish failed", extra={"topic": topic, "partition": partition})
+                    to_rewind.append(TopicPartition(topic, partition, msgs[0].offset()))
+                    metrics.retries.inc()
+                    failed = True
+                    continue
+                self.messages_dead_lettered += len(dead_letters)
+                metrics.dead_letters.inc(len(dead_letters))
+
+            self.messages_processed += stored
+            metrics.messages.inc(stored)
+            to_commit.append(TopicPartition(topic, partition, msgs[-1].offset() + 1))
+            _batch_log.info(
+                "Persisted partition batch",
+                extra={
+                    "topic": topic,
+                    "partition": partition,
+                    "events": stored,
+                    "new_members": created,
+                    "total": self.messages_processed,
+                },
+            )
+
+        if to_commit:
+            await self._call(self._commit, to_commit)
+        for tp in to_rewind:
+            # Rewinding makes the next consume() deliver the partition again.
+            await self._call(self.consumer.seek, tp)
+        KAFKA_CONSUMER_BATCH_SIZE.observe(len(messages))
+        KAFKA_CONSUMER_BATCH_DURATION.observe(time.perf_counter() - started)
+        if failed:
+            await asyncio.sleep(CONSUMER_RETRY_BACKOFF_S)
+
+    async def _consume(self):
+        """One consumer lifetime: wait for the topic, subscribe, consume until stopped."""
+        if not await self._wait_for_topic():
+            return
+
+        await self._call(self._initialize_consumer)
+        await self._call(self.consumer.subscribe, [self.topic])
+        logger.info("Subscribed", extra={"topic": self.topic})
+        self.last_error = None
+
+        while self.running:
+            try:
+                messages = await self._call(self.consumer.consume, self.batch_size, self.batch_timeout)
+                if messages:
+                    await self._handle_batch(messages)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e)
+                logger.exception("Error in consumer loop")
+                await self._sleep(CONSUMER_RESTART_BACKOFF_S)
+
+    async def run(self):
+        """Supervise the consumer: restart it with backoff until stopped."""
+        logger.info("Starting Kafka consumer")
+
+        failures = 0
+        while self.running:
+            try:
+                await self._consume()
+                failures = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e)
+                failures += 1
+                self.restarts += 1
+                KAFKA_CONSUMER_RESTARTS.inc()
+                logger.exception("Consumer failed, restarting", extra={"attempt": failures})
+            finally:
+                await self._close()
+
+            if self.running and failures:
+                await self._sleep(self._backoff(failures - 1))
 
     def start(self):
-        """Start consuming messages."""
-        print("🔥 Starting Kafka consumer...")
+        """Start consuming as a background task on the running loop; returns immediately."""
         self.running = True
+        self._stopping.clear()
+        self._task = asyncio.create_task(self.run(), name="KafkaConsumer")
+        return self._task
 
-        try:
-            # Wait for topic
-            if not self._wait_for_topic():
-                return
+    def is_alive(self) -> bool:
+        return self._task is not None and not self._task.done()
 
-            # Initialize consumer
-            self._initialize_consumer()
+    async def health(self):
+        """Readiness probe: is the consumer running, and how far behind is it?"""
+        if not self.is_alive():
+            return DOWN, "consumer task is not running"
+        if self.consumer is None:
+            return DEGRADED, {"state": "waiting for topic", "restarts": self.restarts, "error": self.last_error}
+        max_lag = max(self.partition_lag.values(), default=0)
+        detail = {"max_lag": max_lag, "processed": self.messages_processed}
+        if max_lag > HEALTH_MAX_CONSUMER_LAG:
+            return DEGRADED, detail
+        return OK, detail
 
-            # Subscribe
-            self.consumer.subscribe([self.topic])
-            print(f"✅ Subscribed to '{self.topic}'")
-            print("⏳ Waiting for messages...")
+    async def _close(self):
+        if self.dlq_producer:
+            producer, self.dlq_producer = self.dlq_producer, None
+            await self._call(producer.flush, 10)
 
-            messages_processed = 0
+        if self.consumer:
+            consumer, self.consumer = self.consumer, None
+            try:
+                await self._call(consumer.close)
+                logger.info("Consumer closed")
+            except Exception:
+                logger.warning("Error closing consumer", exc_info=True)
 
-            while self.running:
-                try:
-                    msg = self.consumer.poll(timeout=1.0)
-
-                    if msg is None:
-                        continue
-
-                    if msg.error():
-                        print(f"❌ Kafka error: {msg.error()}")
-                        continue
-
-                    # Process message
-                    print(f"\n📥 Message received")
-                    print(f"   Partition: {msg.partition()}, Offset: {msg.offset()}")
-
-                    try:
-                        event = json.loads(msg.value().decode('utf-8'))
-                        member_id = UUID(event["member_id"])
-                        
-                        print(f"   Member ID: {member_id}")
-                        
-                        # Submit to thread pool and wait for completion
-                        future = self.executor.submit(self._run_async_in_thread, member_id)
-                        # Wait for the result (blocking, but that's OK in consumer thread)
-                        future.result(timeout=30)
-                        
-                        messages_processed += 1
-                        print(f"✅ Processed (total: {messages_processed})\n")
-
-                    except (json.JSONDecodeError, KeyError, ValueError) as e:
-                        print(f"❌ Invalid message: {e}")
-                    except Exception as e:
-                        print(f"❌ Error processing message: {e}")
-                        import traceback
-                        traceback.print_exc()
-
-                except KeyboardInterrupt:
-                    print("\n⚠️  Interrupted")
-                    break
-                except Exception as e:
-                    print(f"❌ Error in loop: {e}")
-                    time.sleep(5)
-
-        except Exception as e:
-            print(f"❌ Fatal error: {e}")
-            import traceback
-            traceback.print_exc()
-        finally:
-            self.stop()
-
-    def stop(self):
-        """Stop the consumer."""
-        print("🔄 Stopping consumer...")
+    async def stop(self):
+        """Stop the consumer and wait for the current batch to finish."""
+        logger.info("Stopping consumer")
         self.running = False
+        self._stopping.set()
 
-        if self.consumer:
-            try:
-                self.consumer.close()
-                print("✅ Consumer closed")
-            except Exception as e:
-                print(f"⚠️  Error closing: {e}")
-        
-        if self.executor:
-            print("🔄 Shutting down thread pool...")
-            self.executor.shutdown(wait=True, cancel_futures=False)
-            print("✅ Thread pool closed")
\ No newline at end of file
+        if self._task:
+            await self._task
+            self._task = None
+
+        self._executor.shutdown(wait=True)
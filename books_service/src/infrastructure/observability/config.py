@@ -0,0 +1,28 @@
+import os
+
+
+def _parse_levels(value: str) -> dict:
+    """``"sqlalchemy.engine=INFO,uvicorn.access=WARNING"`` -> {logger: level}."""
+    levels = {}
+    for pair in value.split(","):
+        if not pair.strip():
+            continue
+        name, sep, level = pair.partition("=")
+        if not sep or not name.strip():
+            raise RuntimeError(f"LOG_LEVELS entry must be logger=LEVEL, got '{pair}'")
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_LEVELS = _parse_levels(os.getenv("LOG_LEVELS", ""))
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json")
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+# Cap for per-message events, per call site; 0 logs every one.
+LOG_SAMPLE_RATE_PER_S = float(os.getenv("LOG_SAMPLE_RATE_PER_S", "1"))
+
+# Readiness results are reused for this long so orchestrator probes add no DB load.
+HEALTH_CACHE_TTL_S = float(os.getenv("HEALTH_CACHE_TTL_S", "2"))
+HEALTH_CHECK_TIMEOUT_S = float(os.getenv("HEALTH_CHECK_TIMEOUT_S", "1"))
+HEALTH_POOL_DEGRADED_RATIO = float(os.getenv("HEALTH_POOL_DEGRADED_RATIO", "0.9"))
+HEALTH_MAX_CONSUMER_LAG = int(os.getenv("HEALTH_MAX_CONSUMER_LAG", "10000"))
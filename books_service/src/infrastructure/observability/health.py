@@ -0,0 +1,106 @@
+"""Dependency health checks behind the readiness probe.
+
+A probe is an async callable returning ``(status, detail)``. Probes run
+concurrently, each under its own timeout; a probe that raises or times
+out counts as down. The combined report is reused for a short window so
+frequent orchestrator probes do not turn into database load.
+"""
+import asyncio
+import time
+from sqlalchemy import text
+from src.infrastructure.db.pool import pool_snapshot
+from src.infrastructure.observability.config import (
+    HEALTH_CACHE_TTL_S,
+    HEALTH_CHECK_TIMEOUT_S,
+    HEALTH_POOL_DEGRADED_RATIO,
+)
+
+OK, DEGRADED, DOWN = "ok", "degraded", "down"
+
+
+class HealthCheck:
+    """A named probe. Only critical checks can make the service unready."""
+
+    def __init__(self, name: str, probe, critical: bool = True, timeout: float = HEALTH_CHECK_TIMEOUT_S):
+        self.name = name
+        self.probe = probe
+        self.critical = critical
+        self.timeout = timeout
+
+    async def run(self) -> dict:
+        started = time.perf_counter()
+        try:
+            status, detail = await asyncio.wait_for(self.probe(), self.timeout)
+        except asyncio.TimeoutError:
+            status, detail = DOWN, f"timed out after {self.timeout}s"
+        except Exception as e:
+            status, detail = DOWN, str(e) or type(e).__name__
+        return {
+            "status": status,
+            "critical": self.critical,
+            "detail": detail,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+
+class HealthMonitor:
+    """Runs the registered checks and caches the combined report."""
+
+    def __init__(self, ttl: float = HEALTH_CACHE_TTL_S):
+        self.ttl = ttl
+        self.checks = {}
+        self.draining = False
+        self._report = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def add(self, name: str, probe, critical: bool = True):
+        self.checks[name] = HealthCheck(name, probe, critical)
+        self._report = None
+
+    def reset(self):
+        """Forget checks and state; called when the app starts."""
+        self.checks.clear()
+        self.draining = False
+        self._report = None
+        self._lock = asyncio.Lock()
+
+    async def report(self) -> dict:
+        if self.draining:
+            return {"status": DOWN, "draining": True, "checks": {}}
+        # Concurrent probes wait for one run instead of starting their own.
+        async with self._lock:
+            if self._report is None or time.monotonic() - self._checked_at >= self.ttl:
+                self._report = await self._run_checks()
+                self._checked_at = time.monotonic()
+            return self._report
+
+    async def _run_checks(self) -> dict:
+        checks = list(self.checks.values())
+        results = await asyncio.gather(*(check.run() for check in checks))
+        by_name = {check.name: result for check, result in zip(checks, results)}
+
+        status = OK
+        for check, result in zip(checks, results):
+            if result["status"] == DOWN and check.critical:
+                status = DOWN
+                break
+            if result["status"] != OK:
+                status = DEGRADED
+        return {"status": status, "checks": by_name}
+
+
+async def database_probe(engine, degraded_ratio: float = HEALTH_POOL_DEGRADED_RATIO):
+    """Round-trips ``SELECT 1`` and flags a nearly exhausted pool as degraded."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    snapshot = pool_snapshot(engine.pool)
+    detail = {"checked_out": snapshot["checked_out"], "capacity": snapshot["capacity"]}
+    capacity = snapshot["capacity"]
+    if capacity and snapshot["checked_out"] >= capacity * degraded_ratio:
+        return DEGRADED, detail
+    return OK, detail
+
+
+# One monitor per process; main.py registers the checks at startup.
+health = HealthMonitor()
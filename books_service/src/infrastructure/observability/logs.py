@@ -0,0 +1,146 @@
+"""Structured logging written off the event loop.
+
+Every logger feeds one bounded queue; a listener thread formats the
+records as JSON lines and writes them to stdout, so a slow or full pipe
+never blocks a request. When the queue is full, records are dropped and
+counted rather than waited on.
+"""
+import atexit
+import copy
+import logging
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+import orjson
+from src.infrastructure.observability.config import (
+    LOG_FORMAT,
+    LOG_LEVEL,
+    LOG_LEVELS,
+    LOG_QUEUE_SIZE,
+    LOG_SAMPLE_RATE_PER_S,
+)
+from src.infrastructure.observability.metrics import LOG_RECORDS_DROPPED
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+# Attributes every LogRecord has; anything else arrived through ``extra``.
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, with ``extra`` fields at the top level."""
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return orjson.dumps(entry, default=str).decode("utf-8")
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of waiting on a full queue."""
+
+    def prepare(self, record):
+        # Resolve the message and traceback now: args and exc_info may not be
+        # safe to touch later, on the listener thread.
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg, record.args, record.exc_info = record.message, None, None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc()
+
+
+class DrainingQueueListener(QueueListener):
+    """Waits for room for the stop sentinel, so queued records are still written at exit."""
+
+    def enqueue_sentinel(self):
+        try:
+            self.queue.put(self._sentinel, timeout=5)
+        except queue.Full:
+            pass
+
+
+class RateLimitedLogger:
+    """Wraps a logger for per-message events.
+
+    At most ``rate`` records a second get through; the rest are dropped
+    and the next record that passes carries their count as ``suppressed``.
+    A rate of 0 lets everything through.
+    """
+
+    def __init__(self, logger: logging.Logger, rate: float = LOG_SAMPLE_RATE_PER_S):
+        self.logger = logger
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+        self._suppressed = 0
+
+    def log(self, level: int, msg: str, *args, extra=None, **kwargs):
+        if not self.logger.isEnabledFor(level):
+            return
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_at:
+                self._suppressed += 1
+                return
+            self._next_at = now + self.interval
+            suppressed, self._suppressed = self._suppressed, 0
+        if suppressed:
+            extra = {**(extra or {}), "suppressed": suppressed}
+        self.logger.log(level, msg, *args, extra=extra, **kwargs)
+
+    def info(self, msg: str, *args, **kwargs):
+        self.log(logging.INFO, msg, *args, **kwargs)
+
+    def warning(self, msg: str, *args, **kwargs):
+        self.log(logging.WARNING, msg, *args, **kwargs)
+
+
+def configure_logging():
+    """Send every logger through the queue. Calling it again is a no-op."""
+    global _listener
+    if _listener is not None:
+        return
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(JsonFormatter() if LOG_FORMAT == "json" else logging.Formatter(TEXT_FORMAT))
+    log_queue = queue.Queue(LOG_QUEUE_SIZE)
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(NonBlockingQueueHandler(log_queue))
+    root.setLevel(LOG_LEVEL)
+
+    # uvicorn installs its own stdout handlers; route its records through the queue too.
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        logger = logging.getLogger(name)
+        logger.handlers.clear()
+        logger.propagate = True
+
+    for name, level in LOG_LEVELS.items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = DrainingQueueListener(log_queue, stream)
+    _listener.start()
+    atexit.register(_listener.stop)
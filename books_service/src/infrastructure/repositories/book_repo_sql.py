@@ -1,97 +1,325 @@
 from src.domain.library.repositories.book_repository import BookRepository
 from src.domain.library.entities.book import Book
-from src.infrastructure.db.session import db_async_session
-from src.infrastructure.db.models import BookModel
-from sqlalchemy import select
+from src.infrastructure.db.models import SEARCH_DOCUMENT, BookModel, LoanModel, MemberModel
+from sqlalchemy import select, update, delete, exists, func, any_, bindparam, and_, or_, cast, literal, REAL
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Set, Tuple
 from uuid import UUID
+from src.infrastructure.observability.metrics import timed_queries
 
 
+# Keeps each multi-row statement well below asyncpg's 32767 bind parameter cap.
+BULK_CHUNK_SIZE = 1000
+
+_books = BookModel.__table__
+
+# Plain Core reads of just these columns skip ORM instance construction and
+# the identity map; rows expose the same attribute names as a Book.
+BOOK_ROW_COLUMNS = (
+    _books.c.book_id,
+    _books.c.title,
+    _books.c.author,
+    _books.c.is_borrowed,
+    _books.c.borrowed_by,
+    _books.c.borrowed_date,
+    _books.c.version,
+)
+
+
+@timed_queries("books")
 class BookRepositorySQL(BookRepository):
 
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def _to_entity(row) -> Book:
+        book = Book(
+            book_id=row.book_id,
+            title=row.title,
+            author=row.author,
+        )
+        book.borrowed_by = row.borrowed_by
+        book.borrowed_date = row.borrowed_date
+        book.version = row.version
+        return book
+
     async def get_by_id(self, book_id: UUID):
-        async with db_async_session() as db:
-            result = await db.execute(
-                select(BookModel).where(BookModel.book_id == book_id)
-            )
-            row = result.scalars().first()
+        # session.get() answers from the identity map when the row was
+        # already loaded in this unit of work, saving a round trip.
+        row = await self.session.get(BookModel, book_id)
 
-            if not row:
-                return None
+        if not row:
+            return None
 
-            book = Book(
-                book_id=row.book_id,
-                title=row.title,
-                author=row.author,
-            )
-            book.borrowed_by = row.borrowed_by
-            book.borrowed_date = row.borrowed_date
-
-            return book
-
-    async def list(self):
-        async with db_async_session() as db:
-            result = await db.execute(select(BookModel))
-            rows = result.scalars().all()
-
-            books = []
-            for row in rows:
-                book = Book(
-                    book_id=row.book_id,
-                    title=row.title,
-                    author=row.author,
+        return self._to_entity(row)
+
+    async def get_for_update(self, book_id: UUID):
+        # Read from the table, never a cache, and hold the row lock so a
+        # read-modify-write cannot overwrite an update committed meanwhile.
+        result = await self.session.execute(
+            select(*BOOK_ROW_COLUMNS).where(_books.c.book_id == book_id).with_for_update()
+        )
+        row = result.first()
+        return self._to_entity(row) if row else None
+
+    async def get_many(self, book_ids: List[UUID]) -> List[Book]:
+        # A single array parameter keeps the statement text identical for any
+        # number of ids, unlike IN (...), so its prepared plan is reused.
+        result = await self.session.execute(
+            select(*BOOK_ROW_COLUMNS).where(
+                _books.c.book_id == any_(
+                    bindparam("book_ids", list(book_ids), type_=ARRAY(PG_UUID(as_uuid=True)))
                 )
-                book.borrowed_by = row.borrowed_by
-                book.borrowed_date = row.borrowed_date
-                books.append(book)
+            )
+        )
+        return [self._to_entity(row) for row in result]
+
+    async def list(
+        self,
+        limit: int,
+        after: Optional[UUID] = None,
+        author: Optional[str] = None,
+        title_prefix: Optional[str] = None,
+        is_borrowed: Optional[bool] = None,
+        borrowed_by: Optional[UUID] = None,
+    ):
+        rows = await self.list_rows(limit, after, author, title_prefix, is_borrowed, borrowed_by)
+        return [self._to_entity(row) for row in rows]
+
+    async def list_rows(
+        self,
+        limit: int,
+        after: Optional[UUID] = None,
+        author: Optional[str] = None,
+        title_prefix: Optional[str] = None,
+        is_borrowed: Optional[bool] = None,
+        borrowed_by: Optional[UUID] = None,
+    ):
+        stmt = select(*BOOK_ROW_COLUMNS).order_by(_books.c.book_id).limit(limit)
+
+        if after is not None:
+            stmt = stmt.where(_books.c.book_id > after)
+        if author is not None:
+            stmt = stmt.where(_books.c.author == author)
+        if title_prefix:
+            stmt = stmt.where(_books.c.title.startswith(title_prefix, autoescape=True))
+        if is_borrowed is not None:
+            stmt = stmt.where(_books.c.is_borrowed.is_(is_borrowed))
+        if borrowed_by is not None:
+            stmt = stmt.where(_books.c.borrowed_by == borrowed_by)
+
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def search(
+        self,
+        query: str,
+        limit: int,
+        prefix: bool = False,
+        after: Optional[Tuple] = None,
+    ):
+        if prefix:
+            return await self._search_title_prefix(query, limit, after)
+        return await self._search_ranked(query, limit, after)
+
+    async def _search_ranked(self, query, limit, after):
+        tsquery = func.websearch_to_tsquery("simple", query)
+        rank = func.ts_rank_cd(SEARCH_DOCUMENT, tsquery)
+        stmt = (
+            select(*BOOK_ROW_COLUMNS, rank)
+            .where(SEARCH_DOCUMENT.bool_op("@@")(tsquery))
+            .order_by(rank.desc(), BookModel.book_id)
+            .limit(limit)
+        )
+        if after is not None:
+            last_rank, last_id = after
+            # ts_rank_cd returns real; compare in real so the cursor is exact.
+            last_rank = cast(literal(last_rank), REAL)
+            stmt = stmt.where(or_(
+                rank < last_rank,
+                and_(rank == last_rank, BookModel.book_id > last_id),
+            ))
+
+        result = await self.session.execute(stmt)
+        return [(self._to_entity(row), row[-1]) for row in result]
 
-            return books
+    async def _search_title_prefix(self, query, limit, after):
+        # Served by ix_books_title_lower_c: one index range scan in key order,
+        # so the cost depends on the page size, not the catalogue size.
+        key = func.lower(BookModel.title).collate("C")
+        stmt = (
+            select(*BOOK_ROW_COLUMNS, key)
+            .where(key.startswith(query.lower(), autoescape=True))
+            .order_by(key, BookModel.book_id)
+            .limit(limit)
+        )
+        if after is not None:
+            last_key, last_id = after
+            stmt = stmt.where(or_(
+                key > last_key,
+                and_(key == last_key, BookModel.book_id > last_id),
+            ))
+
+        result = await self.session.execute(stmt)
+        return [(self._to_entity(row), row[-1]) for row in result]
+
+    async def stream_rows(self, batch_size: int):
+        """Yield every book as plain row tuples, ``batch_size`` rows at a time.
+
+        Rows come from a server-side cursor, so memory stays bounded by one
+        batch no matter how large the table is.
+        """
+        result = await self.session.stream(
+            select(*BOOK_ROW_COLUMNS[:-1])
+            .order_by(_books.c.book_id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for rows in result.partitions():
+            yield rows
 
     async def create(self, book: Book):
-        async with db_async_session() as db:
-            db.add(
-                BookModel(
-                    book_id=book.book_id,
-                    title=book.title,
-                    author=book.author,
-                    borrowed_by=None,
-                    borrowed_date=None,
-                    is_borrowed=False,
-                )
+        self.session.add(
+            BookModel(
+                book_id=book.book_id,
+                title=book.title,
+                author=book.author,
+                borrowed_by=None,
+                borrowed_date=None,
+                is_borrowed=False,
+            )
+        )
+
+    async def create_many(self, books: List[Book]) -> Set[UUID]:
+        """Insert books with one INSERT ... ON CONFLICT DO NOTHING per chunk.
+
+        Returns the ids that were actually inserted; ids that already exist
+        are skipped.
+        """
+        table = BookModel.__table__
+        created = set()
+        for start in range(0, len(books), BULK_CHUNK_SIZE):
+            chunk = books[start:start + BULK_CHUNK_SIZE]
+            result = await self.session.execute(
+                insert(table)
+                .values([
+                    {
+                        "book_id": book.book_id,
+                        "title": book.title,
+                        "author": book.author,
+                        "is_borrowed": False,
+                    }
+                    for book in chunk
+                ])
+                .on_conflict_do_nothing(index_elements=[table.c.book_id])
+                .returning(table.c.book_id)
             )
+            created.update(result.scalars())
+        return created
 
-    async def update(self, book: Book):
-        async with db_async_session() as db:
-            result = await db.execute(
-                select(BookModel).where(BookModel.book_id == book.book_id)
+    async def delete_many(self, book_ids: List[UUID]) -> Set[UUID]:
+        """Delete the given books, returning the ids that existed."""
+        table = BookModel.__table__
+        deleted = set()
+        for start in range(0, len(book_ids), BULK_CHUNK_SIZE):
+            result = await self.session.execute(
+                delete(table)
+                .where(table.c.book_id.in_(book_ids[start:start + BULK_CHUNK_SIZE]))
+                .returning(table.c.book_id)
             )
-            row = result.scalars().first()
+            deleted.update(result.scalars())
+        return deleted
 
-            if not row:
-                return
+    async def update(self, book: Book, expected_version: Optional[int] = None):
+        stmt = (
+            update(BookModel)
+            .where(BookModel.book_id == book.book_id)
+            .values(
+                title=book.title,
+                author=book.author,
+                version=BookModel.version + 1,
+            )
+            .returning(BookModel.version)
+        )
+        if expected_version is not None:
+            stmt = stmt.where(BookModel.version == expected_version)
 
-            row.title = book.title
-            row.author = book.author
+        result = await self.session.execute(stmt)
+        version = result.scalar()
 
-    async def update_state(self, book: Book):
-        async with db_async_session() as db:
-            result = await db.execute(
-                select(BookModel).where(BookModel.book_id == book.book_id)
+        if version is not None:
+            book.version = version
+        return version
+
+    async def borrow(self, book_id: UUID, member_id: UUID):
+        # Availability and member existence are checked by the UPDATE itself,
+        # so two concurrent borrowers can never both win. The loan history
+        # row is written in the same transaction.
+        result = await self.session.execute(
+            update(BookModel)
+            .where(
+                BookModel.book_id == book_id,
+                BookModel.is_borrowed.is_(False),
+                exists().where(MemberModel.member_id == member_id),
+            )
+            .values(
+                borrowed_by=member_id,
+                borrowed_date=func.now(),
+                is_borrowed=True,
+                version=BookModel.version + 1,
             )
-            row = result.scalars().first()
+            .returning(BookModel)
+            .execution_options(populate_existing=True)
+        )
+        row = result.scalars().first()
 
-            if not row:
-                return
+        if not row:
+            return None
 
-            row.borrowed_by = book.borrowed_by
-            row.borrowed_date = book.borrowed_date
-            row.is_borrowed = book.borrowed_by is not None
+        self.session.add(
+            LoanModel(
+                book_id=row.book_id,
+                member_id=row.borrowed_by,
+                borrowed_at=row.borrowed_date,
+            )
+        )
+        return self._to_entity(row)
 
-    async def delete(self, book_id: UUID):
-        async with db_async_session() as db:
-            result = await db.execute(
-                select(BookModel).where(BookModel.book_id == book_id)
+    async def return_book(self, book_id: UUID):
+        result = await self.session.execute(
+            update(BookModel)
+            .where(
+                BookModel.book_id == book_id,
+                BookModel.is_borrowed.is_(True),
             )
-            row = result.scalars().first()
+            .values(
+                borrowed_by=None,
+                borrowed_date=None,
+                is_borrowed=False,
+                version=BookModel.version + 1,
+            )
+            .returning(BookModel)
+            .execution_options(populate_existing=True)
+        )
+        row = result.scalars().first()
+
+        if not row:
+            return None
+
+        await self.session.execute(
+            update(LoanModel)
+            .where(
+                LoanModel.book_id == book_id,
+                LoanModel.returned_at.is_(None),
+            )
+            .values(returned_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        return self._to_entity(row)
+
+    async def delete(self, book_id: UUID):
+        row = await self.session.get(BookModel, book_id)
 
-            if row:
-                await db.delete(row)
+        if row:
+            await self.session.delete(row)
@@ -0,0 +1,62 @@
+from src.domain.library.repositories.loan_repository import LoanRepository
+from src.domain.library.entities.loan import Loan
+from src.infrastructure.db.models import LoanModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from uuid import UUID
+from src.infrastructure.observability.metrics import timed_queries
+
+
+@timed_queries("loans")
+class LoanRepositorySQL(LoanRepository):
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def _to_entity(row: LoanModel) -> Loan:
+        return Loan(
+            loan_id=row.loan_id,
+            book_id=row.book_id,
+            member_id=row.member_id,
+            borrowed_at=row.borrowed_at,
+            returned_at=row.returned_at,
+        )
+
+    async def _list(self, condition, limit, before, active):
+        # Each filter combination is one range scan on an index ending in
+        # loan_id, so a page costs O(log n) however long the history is.
+        stmt = (
+            select(LoanModel)
+            .where(condition)
+            .order_by(LoanModel.loan_id.desc())
+            .limit(limit)
+        )
+        if before is not None:
+            stmt = stmt.where(LoanModel.loan_id < before)
+        if active is True:
+            stmt = stmt.where(LoanModel.returned_at.is_(None))
+        elif active is False:
+            stmt = stmt.where(LoanModel.returned_at.is_not(None))
+
+        result = await self.session.execute(stmt)
+        return [self._to_entity(row) for row in result.scalars()]
+
+    async def list_for_book(
+        self,
+        book_id: UUID,
+        limit: int,
+        before: Optional[int] = None,
+        active: Optional[bool] = None,
+    ):
+        return await self._list(LoanModel.book_id == book_id, limit, before, active)
+
+    async def list_for_member(
+        self,
+        member_id: UUID,
+        limit: int,
+        before: Optional[int] = None,
+        active: Optional[bool] = None,
+    ):
+        return await self._list(LoanModel.member_id == member_id, limit, before, active)
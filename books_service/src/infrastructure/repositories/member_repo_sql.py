@@ -1,27 +1,52 @@
 from uuid import UUID
+from typing import List
 from sqlalchemy import select, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.domain.library.entities.member import Member
 from src.domain.library.repositories.member_repository import MemberRepository
-from src.infrastructure.db.session import db_async_session
-from src.infrastructure.db.tables import members
+from src.infrastructure.db.models import MemberModel
+from src.infrastructure.observability.metrics import timed_queries
+from src.infrastructure.repositories.book_repo_sql import BULK_CHUNK_SIZE
 
 
+_members = MemberModel.__table__
+
+
+@timed_queries("members")
 class MemberRepositorySQL(MemberRepository):
 
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
     async def create(self, member: Member):
-        async with db_async_session() as session:
-            stmt = insert(members).values(member_id=member.member_id)
-            await session.execute(stmt)
-            await session.commit()
-            return member
+        stmt = insert(_members).values(member_id=member.member_id)
+        await self.session.execute(stmt)
+        return member
 
     async def get_by_id(self, member_id: UUID):
-        async with db_async_session() as session:
-            stmt = select(members).where(members.c.member_id == member_id)
-            result = await session.execute(stmt)
-            row = result.first()
+        stmt = select(_members).where(_members.c.member_id == member_id)
+        result = await self.session.execute(stmt)
+        row = result.first()
+
+        if row:
+            return Member(row.member_id)
+
+        return None
 
-            if row:
-                return Member(row.member_id)
+    async def create_many(self, member_ids: List[UUID]) -> int:
+        """Insert member ids, ignoring ones already stored.
 
-            return None
+        Large batches go in BULK_CHUNK_SIZE rows per statement. Returns how
+        many were new.
+        """
+        created = 0
+        for start in range(0, len(member_ids), BULK_CHUNK_SIZE):
+            result = await self.session.execute(
+                pg_insert(_members)
+                .values([{"member_id": member_id} for member_id in member_ids[start:start + BULK_CHUNK_SIZE]])
+                .on_conflict_do_nothing(index_elements=[_members.c.member_id])
+                .returning(_members.c.member_id)
+            )
+            created += len(result.all())
+        return created
@@ -1,76 +1,87 @@
+import logging
+from functools import partial
 from fastapi import FastAPI
-from src.presentation.routers import books
-from src.infrastructure.db.init_db import init_db
+from src.presentation.routers import books, members, metrics, health as health_routes
+from src.infrastructure.db.migrate import migrate
 from contextlib import asynccontextmanager
 from src.infrastructure.messaging.kafka_consumer import KafkaConsumerService
-from src.infrastructure.repositories.member_repo_sql import MemberRepositorySQL
-import threading
+from src.infrastructure.db.unit_of_work_sql import UnitOfWorkSQL
+from src.infrastructure.cache.caches import start_caches, close_caches
+from src.presentation.responses import FastJSONResponse
+from src.presentation.request_metrics import RequestMetricsMiddleware
+from src.infrastructure.observability.logs import configure_logging
+from src.infrastructure.observability.health import health, database_probe
+from src.infrastructure.observability.metrics import mark_worker_stopped
+from src.infrastructure.db.connection import engine
+from src.infrastructure.db.config import DB_MIGRATE_ON_STARTUP
+from src.infrastructure.messaging.config import CONSUMER_MODE
 
 
+configure_logging()
+logger = logging.getLogger(__name__)
+
 consumer_service = None
-consumer_thread = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    print("🚀 Starting books service...")
+    logger.info("Starting books service")
+    health.reset()
+    
+    if DB_MIGRATE_ON_STARTUP:
+        try:
+            await migrate()
+            logger.info("Database migrated")
+        except Exception:
+            logger.exception("Database migration failed")
+            raise
     
-    try:
-        await init_db()
-        print("✅ Database initialized")
-    except Exception as e:
-        print(f"❌ Database init failed: {e}")
-        raise
+    await start_caches()
+    logger.info("Caches ready")
+    health.add("database", partial(database_probe, engine))
     
-    try:
-        # Create repository - it creates its own sessions
-        member_repo = MemberRepositorySQL()
-        print(f"✅ Member repository created: {member_repo}")
-        
-        # Initialize consumer
-        global consumer_service, consumer_thread
-        consumer_service = KafkaConsumerService(member_repo, bootstrap_servers="kafka:9092")
-        print(f"✅ Consumer service created: {consumer_service}")
-        
-        # Start consumer in thread (Kafka consumer is blocking)
-        consumer_thread = threading.Thread(
-            target=consumer_service.start,
-            daemon=True,
-            name="KafkaConsumerThread"
-        )
-        consumer_thread.start()
-        print("✅ Kafka consumer thread started")
-        
-        # Give thread a moment to start
-        import time
-        time.sleep(1)
-        
-        if consumer_thread.is_alive():
-            print("✅ Consumer thread is running")
-        else:
-            print("⚠️  WARNING: Consumer thread died immediately")
-        
-        print("✅ Books service ready\n")
-        
-    except Exception as e:
-        print(f"❌ Consumer initialization failed: {e}")
-        import traceback
-        traceback.print_exc()
-        raise
+    if CONSUMER_MODE == "embedded":
+        try:
+            # Each batch of events gets its own unit of work from the shared pool
+            global consumer_service
+            consumer_service = KafkaConsumerService(UnitOfWorkSQL)
+            
+            # Consume on this event loop; blocking librdkafka calls use a helper thread.
+            # The task waits for Kafka on its own, so the API serves right away.
+            consumer_service.start()
+
+            # The API keeps serving while the consumer is down, so it only degrades readiness.
+            health.add("kafka_consumer", consumer_service.health, critical=False)
+            
+        except Exception:
+            logger.exception("Consumer initialization failed")
+            raise
+    else:
+        logger.info("Member events are consumed by a dedicated worker")
+    logger.info("Books service ready", extra={"consumer_mode": CONSUMER_MODE})
     
     yield
     
     # Shutdown
-    print("🔄 Shutting down books service...")
+    logger.info("Shutting down books service")
+    health.draining = True
     if consumer_service:
-        consumer_service.stop()
-    print("✅ Books service stopped")
+        await consumer_service.stop()
+    await close_caches()
+    mark_worker_stopped()
+    logger.info("Books service stopped")
 
 
 app = FastAPI(
     title="Books Service",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
+app.add_middleware(RequestMetricsMiddleware)
+
 app.include_router(books.router)
+app.include_router(members.router)
+app.include_router(metrics.router)
+app.include_router(health_routes.router)
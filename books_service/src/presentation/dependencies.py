@@ -1,12 +1,20 @@
+from fastapi import Depends
 from src.application.library.book_service import BookService
-from src.infrastructure.repositories.book_repo_sql import BookRepositorySQL
-from src.infrastructure.repositories.member_repo_sql import MemberRepositorySQL
+from src.application.library.loan_service import LoanService
+from src.infrastructure.db.unit_of_work_sql import UnitOfWorkSQL
 
 
-def get_book_service() -> BookService:
-    book_repo = BookRepositorySQL()
-    member_repo = MemberRepositorySQL()
-    return BookService(book_repo, member_repo)
+async def get_unit_of_work():
+    """One session and one transaction for the whole request."""
+    async with UnitOfWorkSQL() as uow:
+        yield uow
 
-def get_member_repository():
-    return MemberRepositorySQL()
\ No newline at end of file
+
+def get_book_service(uow = Depends(get_unit_of_work)) -> BookService:
+    return BookService(uow)
+
+def get_loan_service(uow = Depends(get_unit_of_work)) -> LoanService:
+    return LoanService(uow)
+
+def get_member_repository(uow = Depends(get_unit_of_work)):
+    return uow.members
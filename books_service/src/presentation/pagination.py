@@ -0,0 +1,67 @@
+import base64
+import binascii
+import json
+from typing import Optional, Tuple
+from uuid import UUID
+from fastapi import HTTPException, status
+
+
+def encode_cursor(last_id: Optional[UUID]) -> Optional[str]:
+    """Opaque, URL-safe cursor pointing just after ``last_id``."""
+    if last_id is None:
+        return None
+    return base64.urlsafe_b64encode(last_id.bytes).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[UUID]:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return UUID(bytes=base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def encode_seq_cursor(last_id: Optional[int]) -> Optional[str]:
+    """Opaque cursor for pages keyed by a bigint sequence id."""
+    if last_id is None:
+        return None
+    return base64.urlsafe_b64encode(last_id.to_bytes(8, "big")).rstrip(b"=").decode("ascii")
+
+
+def decode_seq_cursor(cursor: Optional[str]) -> Optional[int]:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded)
+    except (binascii.Error, ValueError):
+        raw = b""
+    if len(raw) != 8:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return int.from_bytes(raw, "big")
+
+
+def encode_search_cursor(position: Optional[Tuple]) -> Optional[str]:
+    """Cursor for pages ordered by ``(sort_key, id)``, e.g. search results."""
+    if position is None:
+        return None
+    sort_key, last_id = position
+    raw = json.dumps([sort_key, last_id.hex], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_search_cursor(cursor: Optional[str], key_type: type) -> Optional[Tuple]:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_key, last_id = json.loads(base64.urlsafe_b64decode(padded))
+        if key_type is float and isinstance(sort_key, int):
+            sort_key = float(sort_key)
+        if not isinstance(sort_key, key_type):
+            raise ValueError(sort_key)
+        return sort_key, UUID(hex=last_id)
+    except (binascii.Error, ValueError, TypeError, AttributeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
@@ -1,13 +1,46 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import Annotated, TypeAlias
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from typing import Annotated, Literal, Optional, TypeAlias
 from uuid import UUID, uuid4
-from src.presentation.schemas import BookCreate, BookResponse, BookUpdate
-from src.presentation.dependencies import get_book_service
+from src.presentation.schemas import (
+    BookBatch,
+    BookBatchGet,
+    BookBulkCreate,
+    BookBulkDelete,
+    BookBulkResult,
+    BookCreate,
+    BookPage,
+    BookResponse,
+    BookUpdate,
+    LoanPage,
+)
+from src.presentation.pagination import (
+    decode_cursor,
+    decode_search_cursor,
+    decode_seq_cursor,
+    encode_cursor,
+    encode_search_cursor,
+    encode_seq_cursor,
+)
+from src.presentation.export import EXPORT_MEDIA_TYPES, encode_export
+from src.presentation.conditional import (
+    if_match,
+    list_etag,
+    none_match,
+    not_modified,
+    set_validators,
+    validator_headers,
+    version_etag,
+)
+from src.presentation.responses import FastJSONResponse, rows_to_items
+from src.presentation.dependencies import get_book_service, get_loan_service
 from src.domain.library.entities.book import Book
-from src.application.library.book_service import BookService
+from src.application.library.book_service import BookService, BookStateConflict, PreconditionFailed
+from src.application.library.loan_service import LoanService
 
 router = APIRouter(prefix="/books", tags=["Books"])
 BookServiceDep: TypeAlias = Annotated[BookService, Depends(get_book_service)]
+LoanServiceDep: TypeAlias = Annotated[LoanService, Depends(get_loan_service)]
 
 @router.post("/", response_model=BookResponse, status_code=status.HTTP_201_CREATED)
 async def create_books( data: BookCreate, service: BookServiceDep):
@@ -19,26 +52,142 @@ async def create_books( data: BookCreate, service: BookServiceDep):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/", response_model= list[BookResponse], status_code=status.HTTP_200_OK)
-async def get_all_books(service: BookServiceDep):
-    books = service.list_books()
-    return await books
+@router.post("/bulk", response_model=list[BookBulkResult], status_code=status.HTTP_200_OK)
+async def create_books_bulk(data: BookBulkCreate, service: BookServiceDep):
+    books = [Book(item.book_id or uuid4(), item.title, item.author) for item in data]
+    results = await service.create_books(books)
+    return [{"book_id": book.book_id, "status": result} for book, result in results]
+
+
+@router.post("/bulk/delete", response_model=list[BookBulkResult], status_code=status.HTTP_200_OK)
+async def delete_books_bulk(book_ids: BookBulkDelete, service: BookServiceDep):
+    results = await service.delete_books(book_ids)
+    return [{"book_id": book_id, "status": result} for book_id, result in results]
+
+
+@router.post("/batch-get", response_model=BookBatch, status_code=status.HTTP_200_OK)
+async def get_books_batch(book_ids: BookBatchGet, service: BookServiceDep):
+    books, missing = await service.get_books(book_ids)
+    return {"items": books, "missing": missing}
+
+
+# Field order of BookResponse; list and export rows come back in this order.
+BOOK_COLUMNS = ("book_id", "title", "author", "is_borrowed", "borrowed_by", "borrowed_date")
+
+
+@router.get("/", response_model=BookPage, status_code=status.HTTP_200_OK)
+async def get_all_books(
+    service: BookServiceDep,
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+    cursor: Optional[str] = None,
+    author: Optional[str] = None,
+    title_prefix: Optional[str] = None,
+    is_borrowed: Optional[bool] = None,
+    borrowed_by: Optional[UUID] = None,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+):
+    rows, last_id = await service.list_books(
+        limit,
+        decode_cursor(cursor),
+        author=author,
+        title_prefix=title_prefix,
+        is_borrowed=is_borrowed,
+        borrowed_by=borrowed_by,
+    )
+    next_cursor = encode_cursor(last_id)
+    etag = list_etag(rows, "book_id", next_cursor)
+    if none_match(if_none_match, etag):
+        return not_modified(etag)
+    # Rows go straight to orjson; response_model still documents the shape.
+    return FastJSONResponse(
+        {"items": rows_to_items(rows, BOOK_COLUMNS), "next_cursor": next_cursor},
+        headers=validator_headers(etag),
+    )
+
+
+# "fulltext" takes web-search syntax over titles and authors and ranks by
+# relevance; "prefix" autocompletes from the start of the title.
+@router.get("/search", response_model=BookPage, status_code=status.HTTP_200_OK)
+async def search_books(
+    service: BookServiceDep,
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    mode: Literal["fulltext", "prefix"] = "fulltext",
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: Optional[str] = None,
+):
+    prefix = mode == "prefix"
+    after = decode_search_cursor(cursor, str if prefix else float)
+    books, position = await service.search_books(q, limit, prefix, after)
+    return {"items": books, "next_cursor": encode_search_cursor(position)}
+
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_books(
+    service: BookServiceDep,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    gzip: bool = False,
+    batch_size: Annotated[int, Query(ge=100, le=10000)] = 1000,
+):
+    body = encode_export(BOOK_COLUMNS, service.export_books(batch_size), format, gzip)
+    headers = {"Content-Disposition": f'attachment; filename="books.{format}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=EXPORT_MEDIA_TYPES[format], headers=headers)
 
 
 @router.get("/{book_id}", response_model=BookResponse, status_code=status.HTTP_200_OK)
-async def get_book_by_id(book_id: UUID, service: BookServiceDep):
+async def get_book_by_id(
+    book_id: UUID,
+    service: BookServiceDep,
+    response: Response,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+):
     try: 
-        return await service.get_book_by_id(book_id)
+        book = await service.get_book_by_id(book_id)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    etag = version_etag(book.version)
+    if none_match(if_none_match, etag):
+        return not_modified(etag)
+    set_validators(response, etag)
+    return book
+
+
+@router.get("/{book_id}/loans", response_model=LoanPage, status_code=status.HTTP_200_OK)
+async def get_book_loans(
+    book_id: UUID,
+    service: LoanServiceDep,
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+    cursor: Optional[str] = None,
+    active: Optional[bool] = None,
+):
+    before = decode_seq_cursor(cursor)
+    try:
+        loans, last_id = await service.list_book_loans(book_id, limit, before, active)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return {"items": loans, "next_cursor": encode_seq_cursor(last_id)}
 
 
 @router.put("/{book_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def update_book( book_id: UUID, data: BookUpdate, serivce: BookServiceDep):
+async def update_book(
+    book_id: UUID,
+    data: BookUpdate,
+    serivce: BookServiceDep,
+    response: Response,
+    if_match_header: Annotated[Optional[str], Header(alias="If-Match")] = None,
+):
+    precondition = None
+    if if_match_header:
+        precondition = lambda version: if_match(if_match_header, version_etag(version))
     try:
-        return await serivce.update_book(book_id, data)
+        book = await serivce.update_book(book_id, data, precondition)
+    except PreconditionFailed as e:
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    response.headers["ETag"] = version_etag(book.version)
 
 
 @router.delete("/{book_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -53,6 +202,8 @@ async def delete_book(book_id: UUID, service: BookServiceDep):
 async def borrow_book(book_id:UUID, member_id: UUID, service: BookServiceDep):
     try:
         await service.borrow_book(book_id,member_id)
+    except BookStateConflict as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     
@@ -61,5 +212,7 @@ async def borrow_book(book_id:UUID, member_id: UUID, service: BookServiceDep):
 async def return_book(book_id: UUID, service: BookServiceDep):
     try:
         await service.return_book(book_id)
+    except BookStateConflict as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code = status.HTTP_404_NOT_FOUND, detail = str(e))
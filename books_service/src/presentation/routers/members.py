@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Annotated, Optional, TypeAlias
+from uuid import UUID
+from src.presentation.schemas import LoanPage
+from src.presentation.pagination import decode_seq_cursor, encode_seq_cursor
+from src.presentation.dependencies import get_loan_service
+from src.application.library.loan_service import LoanService
+
+# Member data is owned by the members service; this router only serves the
+# loan history, which lives here next to the books.
+router = APIRouter(prefix="/members", tags=["Members"])
+LoanServiceDep: TypeAlias = Annotated[LoanService, Depends(get_loan_service)]
+
+
+@router.get("/{member_id}/loans", response_model=LoanPage, status_code=status.HTTP_200_OK)
+async def get_member_loans(
+    member_id: UUID,
+    service: LoanServiceDep,
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+    cursor: Optional[str] = None,
+    active: Optional[bool] = None,
+):
+    before = decode_seq_cursor(cursor)
+    try:
+        loans, last_id = await service.list_member_loans(member_id, limit, before, active)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return {"items": loans, "next_cursor": encode_seq_cursor(last_id)}
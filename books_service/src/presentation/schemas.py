@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Literal, Optional
 
 
 class BookCreate(BaseModel):
@@ -18,7 +18,52 @@ class BookResponse(BaseModel):
     borrowed_date: Optional[datetime]
 
 
+class BookPage(BaseModel):
+    items: list[BookResponse]
+    next_cursor: Optional[str] = None
+
+
+class LoanResponse(BaseModel):
+    loan_id: int
+    book_id: UUID
+    member_id: UUID
+    borrowed_at: datetime
+    returned_at: Optional[datetime]
+
+
+class LoanPage(BaseModel):
+    items: list[LoanResponse]
+    next_cursor: Optional[str] = None
+
+
 class BookUpdate(BaseModel):
     title: Optional[str] = None
     author: Optional[str] = None
 
+
+
+BULK_MAX_ITEMS = 10000
+
+
+class BookBulkItem(BookCreate):
+    # Supplying the id makes re-running an import idempotent.
+    book_id: Optional[UUID] = None
+
+
+BookBulkCreate = Annotated[list[BookBulkItem], Field(min_length=1, max_length=BULK_MAX_ITEMS)]
+BookBulkDelete = Annotated[list[UUID], Field(min_length=1, max_length=BULK_MAX_ITEMS)]
+
+
+BATCH_GET_MAX_ITEMS = 1000
+
+BookBatchGet = Annotated[list[UUID], Field(min_length=1, max_length=BATCH_GET_MAX_ITEMS)]
+
+
+class BookBatch(BaseModel):
+    items: list[BookResponse]
+    missing: list[UUID]
+
+
+class BookBulkResult(BaseModel):
+    book_id: UUID
+    status: Literal["created", "conflict", "deleted", "not_found"]
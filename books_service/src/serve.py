@@ -0,0 +1,58 @@
+"""Run the API under uvicorn with WEB_CONCURRENCY worker processes.
+
+    python -m src.serve
+
+uvicorn spawns its workers rather than forking them, so each one imports
+the app afresh and opens its own database pool, caches and Kafka
+clients in the lifespan. With more than one worker, Prometheus samples
+go to PROMETHEUS_MULTIPROC_DIR (a new temporary directory unless set)
+and /metrics aggregates every worker's. Caches must then be shared
+(CACHE_BACKEND=redis) or turned off.
+"""
+import glob
+import logging
+import os
+import tempfile
+import uvicorn
+from src.infrastructure.cache.config import CACHE_BACKEND, CACHE_ENABLED
+from src.infrastructure.messaging.config import CONSUMER_MODE
+from src.presentation.config import HOST, PORT, WEB_CONCURRENCY
+
+
+def _prepare_multiprocess_metrics():
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if path:
+        os.makedirs(path, exist_ok=True)
+        # Samples left by a previous run would be added to this one's.
+        for stale in glob.glob(os.path.join(path, "*.db")):
+            os.remove(stale)
+    else:
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="prometheus-")
+
+
+def main():
+    if WEB_CONCURRENCY > 1 and CONSUMER_MODE == "embedded":
+        # Every worker would join the consumer group with a consumer of its own.
+        raise SystemExit(
+            "CONSUMER_MODE=embedded runs one consumer per API worker; with WEB_CONCURRENCY > 1 "
+            "set CONSUMER_MODE=external and run the consumer with python -m src.worker"
+        )
+    if WEB_CONCURRENCY > 1 and CACHE_ENABLED and CACHE_BACKEND != "redis":
+        # Each worker would keep its own cache, invalidated only by its own
+        # writes, and serve stale rows and ETags after another worker's.
+        raise SystemExit(
+            f"CACHE_BACKEND={CACHE_BACKEND} keeps a separate cache in every API worker; with "
+            "WEB_CONCURRENCY > 1 set CACHE_BACKEND=redis or CACHE_ENABLED=false"
+        )
+    if WEB_CONCURRENCY > 1:
+        _prepare_multiprocess_metrics()
+    # prometheus_client reads PROMETHEUS_MULTIPROC_DIR on import, so this comes after.
+    from src.infrastructure.observability.logs import configure_logging
+
+    configure_logging()
+    logging.getLogger(__name__).info("Starting API", extra={"workers": WEB_CONCURRENCY, "port": PORT})
+    uvicorn.run("src.main:app", host=HOST, port=PORT, workers=WEB_CONCURRENCY, log_config=None)
+
+
+if __name__ == "__main__":
+    main()
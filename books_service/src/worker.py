@@ -0,0 +1,91 @@
+"""Dedicated member-event consumer, for CONSUMER_MODE=external.
+
+    python -m src.worker [--batch-size 500] [--partition-concurrency 4] [--metrics-port 9100]
+
+Runs the same pipeline the API embeds, in a process of its own, so
+replication workers scale with the topic's partitions and API workers
+with traffic. SIGTERM or SIGINT lets the current batch finish and commit
+before the process exits; Prometheus metrics are served on their own port.
+"""
+import argparse
+import asyncio
+import logging
+import signal
+import sys
+from prometheus_client import REGISTRY, start_http_server
+from src.infrastructure.cache.caches import CACHES, start_caches, close_caches
+from src.infrastructure.db.connection import engine
+from src.infrastructure.db.pool import pool_snapshot
+from src.infrastructure.db.unit_of_work_sql import UnitOfWorkSQL
+from src.infrastructure.messaging.config import (
+    CONSUMER_BATCH_SIZE,
+    CONSUMER_BATCH_TIMEOUT_S,
+    CONSUMER_METRICS_PORT,
+    CONSUMER_PARTITION_CONCURRENCY,
+)
+from src.infrastructure.messaging.kafka_consumer import KafkaConsumerService
+from src.infrastructure.observability.logs import configure_logging
+from src.infrastructure.observability.metrics import StatsCollector
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="Replicate member events into the books database.")
+    parser.add_argument("--batch-size", type=int, default=CONSUMER_BATCH_SIZE)
+    parser.add_argument("--batch-timeout", type=float, default=CONSUMER_BATCH_TIMEOUT_S)
+    parser.add_argument(
+        "--partition-concurrency", type=int, default=CONSUMER_PARTITION_CONCURRENCY,
+        help="partitions of one batch written to the database at the same time",
+    )
+    parser.add_argument("--metrics-port", type=int, default=CONSUMER_METRICS_PORT, help="0 turns the endpoint off")
+    return parser.parse_args()
+
+
+async def main(args) -> int:
+    loop = asyncio.get_running_loop()
+    stopping = asyncio.Event()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stopping.set)
+
+    metrics_server = None
+    if args.metrics_port:
+        REGISTRY.register(StatsCollector(lambda: pool_snapshot(engine.pool), CACHES))
+        metrics_server, _ = start_http_server(args.metrics_port)
+
+    # Replicated members invalidate cached lookups, so the caches are opened here too.
+    await start_caches()
+    consumer = KafkaConsumerService(
+        UnitOfWorkSQL,
+        batch_size=args.batch_size,
+        batch_timeout=args.batch_timeout,
+        partition_concurrency=args.partition_concurrency,
+    )
+    task = consumer.start()
+    logger.info("Consumer worker started", extra={"metrics_port": args.metrics_port or None})
+
+    exit_code = 0
+    try:
+        stop_requested = asyncio.create_task(stopping.wait())
+        await asyncio.wait({task, stop_requested}, return_when=asyncio.FIRST_COMPLETED)
+        stop_requested.cancel()
+        if not task.done():
+            logger.info("Shutdown requested, finishing the current batch")
+        try:
+            await consumer.stop()
+        except Exception:
+            # The task restarts the consumer itself, so failing out of it is a bug.
+            logger.exception("Consumer task ended unexpectedly")
+            exit_code = 1
+    finally:
+        await close_caches()
+        await engine.dispose()
+        if metrics_server is not None:
+            metrics_server.shutdown()
+        logger.info("Consumer worker stopped", extra={"processed": consumer.messages_processed})
+    return exit_code
+
+
+if __name__ == "__main__":
+    configure_logging()
+    sys.exit(asyncio.run(main(_parse_args())))
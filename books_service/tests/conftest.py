@@ -0,0 +1,26 @@
+import pytest
+from src.infrastructure.cache.backends import FakeNetwork, FakeNetworkCacheBackend, MemoryCacheBackend
+from src.infrastructure.cache.codecs import BookCodec
+from src.infrastructure.cache.entity_cache import EntityCache
+
+
+@pytest.fixture
+def network():
+    # Not FakeNetworkCacheBackend.default_network, so tests never share entries.
+    return FakeNetwork()
+
+
+@pytest.fixture
+def make_book_cache(network):
+    """Build book caches the way separate replicas would, on one shared store."""
+    def make():
+        return EntityCache(
+            "books",
+            "test",
+            BookCodec,
+            FakeNetworkCacheBackend(network),
+            30,
+            near=MemoryCacheBackend(100),
+            near_ttl=30,
+        )
+    return make
@@ -0,0 +1,123 @@
+import asyncio
+import copy
+from uuid import uuid4
+from src.domain.library.entities.book import Book
+from src.infrastructure.cache.cached_repositories import CachedBookRepository
+
+
+class InMemoryBookRepository:
+    """The slice of BookRepositorySQL the cache wraps, over a dict."""
+
+    def __init__(self):
+        self.rows = {}
+        self.reads = 0
+
+    async def get_by_id(self, book_id):
+        self.reads += 1
+        book = self.rows.get(book_id)
+        return copy.copy(book) if book else None
+
+    async def get_many(self, book_ids):
+        self.reads += 1
+        return [copy.copy(self.rows[book_id]) for book_id in book_ids if book_id in self.rows]
+
+    async def update(self, book, expected_version=None):
+        book.version += 1
+        self.rows[book.book_id] = copy.copy(book)
+        return book.version
+
+    async def delete(self, book_id):
+        self.rows.pop(book_id, None)
+
+
+class UnitOfWork:
+    """Runs the commit hooks the cached repository registers."""
+
+    def __init__(self, repo, cache):
+        self._hooks = []
+        self.books = CachedBookRepository(repo, cache, self._hooks.append)
+
+    async def commit(self):
+        for hook in self._hooks:
+            await hook()
+
+
+def _stored_book(repo):
+    book = Book(book_id=uuid4(), title="Dune", author="Herbert")
+    repo.rows[book.book_id] = book
+    return book
+
+
+def test_reads_are_served_from_cache(make_book_cache):
+    repo = InMemoryBookRepository()
+    book = _stored_book(repo)
+
+    async def scenario():
+        uow = UnitOfWork(repo, make_book_cache())
+        return [await uow.books.get_by_id(book.book_id) for _ in range(3)]
+
+    results = asyncio.run(scenario())
+
+    assert repo.reads == 1
+    assert [result.title for result in results] == ["Dune"] * 3
+
+
+def test_update_drops_the_cached_book_on_every_replica(make_book_cache):
+    repo = InMemoryBookRepository()
+    book = _stored_book(repo)
+
+    async def scenario():
+        writer_cache, reader_cache = make_book_cache(), make_book_cache()
+        for cache in (writer_cache, reader_cache):
+            await cache.start()
+        writer, reader = UnitOfWork(repo, writer_cache), UnitOfWork(repo, reader_cache)
+        await writer.books.get_by_id(book.book_id)
+        await reader.books.get_by_id(book.book_id)
+
+        changed = await writer.books.get_by_id(book.book_id)
+        changed.title = "Dune Messiah"
+        await writer.books.update(changed)
+        await writer.commit()
+        return await writer.books.get_by_id(book.book_id), await reader.books.get_by_id(book.book_id)
+
+    seen_by_writer, seen_by_reader = asyncio.run(scenario())
+
+    assert (seen_by_writer.title, seen_by_writer.version) == ("Dune Messiah", 2)
+    assert (seen_by_reader.title, seen_by_reader.version) == ("Dune Messiah", 2)
+
+
+def test_delete_drops_the_cached_book(make_book_cache):
+    repo = InMemoryBookRepository()
+    book = _stored_book(repo)
+
+    async def scenario():
+        uow = UnitOfWork(repo, make_book_cache())
+        await uow.books.get_by_id(book.book_id)
+        await uow.books.delete(book.book_id)
+        await uow.commit()
+        return await uow.books.get_by_id(book.book_id), await uow.books.get_many([book.book_id])
+
+    by_id, many = asyncio.run(scenario())
+
+    assert by_id is None
+    assert many == []
+
+
+def test_read_racing_the_write_is_dropped_at_commit(make_book_cache):
+    repo = InMemoryBookRepository()
+    book = _stored_book(repo)
+
+    async def scenario():
+        cache = make_book_cache()
+        uow = UnitOfWork(repo, cache)
+        changed = await uow.books.get_by_id(book.book_id)
+        changed.title = "Children of Dune"
+        await uow.books.update(changed)
+        # Another request reads before the commit and caches the old row.
+        repo.rows[book.book_id] = book
+        await UnitOfWork(repo, cache).books.get_by_id(book.book_id)
+        repo.rows[book.book_id] = changed
+        await uow.commit()
+        return await uow.books.get_by_id(book.book_id)
+
+    assert asyncio.run(scenario()).title == "Children of Dune"
@@ -0,0 +1,193 @@
+import asyncio
+from datetime import datetime, timezone
+from uuid import uuid4
+import pytest
+from src.domain.library.entities.book import Book
+from src.infrastructure.cache.codecs import BookCodec
+
+
+async def settle():
+    """Let every runnable task advance until it blocks."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def _book(title="Dune"):
+    return Book(book_id=uuid4(), title=title, author="Herbert")
+
+
+class GatedLoader:
+    """Loader that counts its calls and blocks until ``release`` is set."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def test_concurrent_misses_share_one_load(make_book_cache):
+    book = _book()
+
+    async def scenario():
+        cache = make_book_cache()
+        loader = GatedLoader(book)
+        readers = [asyncio.create_task(cache.get_or_load(book.book_id, loader)) for _ in range(10)]
+        await settle()
+        loader.release.set()
+        return cache, loader, await asyncio.gather(*readers)
+
+    cache, loader, results = asyncio.run(scenario())
+
+    assert loader.calls == 1
+    assert cache.misses == 10
+    assert cache.coalesced == 9
+    assert [result.title for result in results] == ["Dune"] * 10
+
+
+def test_loaded_entity_is_served_from_cache(make_book_cache):
+    book = _book()
+
+    async def scenario():
+        cache = make_book_cache()
+        loader = GatedLoader(book)
+        loader.release.set()
+        await cache.get_or_load(book.book_id, loader)
+        cached = await cache.get_or_load(book.book_id, loader)
+        return cache, loader, cached
+
+    cache, loader, cached = asyncio.run(scenario())
+
+    assert loader.calls == 1
+    assert cache.hits == 1
+    assert cached.title == "Dune" and cached is not book
+
+
+def test_batch_lookup_joins_a_load_in_flight(make_book_cache):
+    first, second = _book("First"), _book("Second")
+    batches = []
+
+    async def load_many(book_ids):
+        batches.append(list(book_ids))
+        return {book.book_id: book for book in (first, second) if book.book_id in book_ids}
+
+    async def scenario():
+        cache = make_book_cache()
+        loader = GatedLoader(first)
+        single = asyncio.create_task(cache.get_or_load(first.book_id, loader))
+        await settle()
+        batch = asyncio.create_task(cache.get_many_or_load([first.book_id, second.book_id], load_many))
+        await settle()
+        loader.release.set()
+        await single
+        return cache, loader, await batch
+
+    cache, loader, found = asyncio.run(scenario())
+
+    assert loader.calls == 1
+    assert batches == [[second.book_id]]
+    assert cache.coalesced == 1
+    assert {book_id: book.title for book_id, book in found.items()} == {
+        first.book_id: "First",
+        second.book_id: "Second",
+    }
+
+
+def test_failed_load_reaches_every_caller_and_is_not_cached(make_book_cache):
+    book = _book()
+
+    async def scenario():
+        cache = make_book_cache()
+        loader = GatedLoader(RuntimeError("database down"))
+        readers = [asyncio.create_task(cache.get_or_load(book.book_id, loader)) for _ in range(3)]
+        await settle()
+        loader.release.set()
+        outcomes = await asyncio.gather(*readers, return_exceptions=True)
+
+        loader.result = book
+        retried = await cache.get_or_load(book.book_id, loader)
+        return loader, outcomes, retried
+
+    loader, outcomes, retried = asyncio.run(scenario())
+
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+    assert loader.calls == 2
+    assert retried.title == "Dune"
+
+
+def test_missing_entity_is_not_cached(make_book_cache):
+    book_id = uuid4()
+
+    async def scenario():
+        cache = make_book_cache()
+        loader = GatedLoader(None)
+        loader.release.set()
+        return loader, [await cache.get_or_load(book_id, loader) for _ in range(2)]
+
+    loader, results = asyncio.run(scenario())
+
+    assert results == [None, None]
+    assert loader.calls == 2
+
+
+def test_invalidation_during_load_keeps_the_result_out(make_book_cache):
+    book = _book("Stale")
+
+    async def scenario():
+        cache = make_book_cache()
+        loader = GatedLoader(book)
+        reader = asyncio.create_task(cache.get_or_load(book.book_id, loader))
+        await settle()
+        await cache.invalidate(book.book_id)
+        loader.release.set()
+        await reader
+
+        loader.result = _book("Fresh")
+        return loader, await cache.get_or_load(book.book_id, loader)
+
+    loader, reloaded = asyncio.run(scenario())
+
+    assert loader.calls == 2
+    assert reloaded.title == "Fresh"
+
+
+def test_invalidation_reaches_other_replicas(make_book_cache):
+    book = _book("Old")
+
+    async def scenario():
+        writer, reader = make_book_cache(), make_book_cache()
+        for cache in (writer, reader):
+            await cache.start()
+        loader = GatedLoader(book)
+        loader.release.set()
+        await writer.get_or_load(book.book_id, loader)
+        await reader.get_or_load(book.book_id, loader)
+
+        await writer.invalidate(book.book_id)
+        loader.result = _book("New")
+        return loader, await reader.get_or_load(book.book_id, loader)
+
+    loader, seen = asyncio.run(scenario())
+
+    # The reader's near-cache copy was dropped, so it went back to the loader.
+    assert loader.calls == 2
+    assert seen.title == "New"
+
+
+@pytest.mark.parametrize("borrowed", [False, True])
+def test_book_codec_round_trip(borrowed):
+    book = _book()
+    book.version = 7
+    if borrowed:
+        book.borrowed_by = uuid4()
+        book.borrowed_date = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+
+    decoded = BookCodec.decode(BookCodec.encode(book))
+
+    assert [getattr(decoded, slot) for slot in Book.__slots__] == [getattr(book, slot) for slot in Book.__slots__]
@@ -0,0 +1,73 @@
+from uuid import uuid4
+import pytest
+from fastapi import HTTPException
+from src.presentation.pagination import (
+    decode_cursor,
+    decode_search_cursor,
+    decode_seq_cursor,
+    encode_cursor,
+    encode_search_cursor,
+    encode_seq_cursor,
+)
+
+
+def _assert_rejected(decode, *args):
+    with pytest.raises(HTTPException) as raised:
+        decode(*args)
+    assert raised.value.status_code == 400
+
+
+def test_cursor_round_trip():
+    book_id = uuid4()
+    cursor = encode_cursor(book_id)
+
+    assert decode_cursor(cursor) == book_id
+    assert cursor.isascii() and "=" not in cursor
+
+
+def test_no_cursor_means_first_page():
+    assert encode_cursor(None) is None
+    assert decode_cursor(None) is None
+    assert decode_cursor("") is None
+
+
+@pytest.mark.parametrize("tamper", [lambda c: c[:-2], lambda c: c + "AAAA", lambda c: "%%" + c])
+def test_tampered_cursor_is_rejected(tamper):
+    _assert_rejected(decode_cursor, tamper(encode_cursor(uuid4())))
+
+
+@pytest.mark.parametrize("loan_id", [1, 2**31, 2**63 - 1])
+def test_seq_cursor_round_trip(loan_id):
+    assert decode_seq_cursor(encode_seq_cursor(loan_id)) == loan_id
+
+
+@pytest.mark.parametrize("cursor", ["AAAA", encode_cursor(uuid4()), "not a cursor"])
+def test_malformed_seq_cursor_is_rejected(cursor):
+    _assert_rejected(decode_seq_cursor, cursor)
+
+
+@pytest.mark.parametrize("sort_key, key_type", [(0.0625, float), ("dune messiah", str)])
+def test_search_cursor_round_trip(sort_key, key_type):
+    position = (sort_key, uuid4())
+
+    assert decode_search_cursor(encode_search_cursor(position), key_type) == position
+
+
+def test_search_cursor_accepts_integral_rank():
+    position = (1, uuid4())
+
+    assert decode_search_cursor(encode_search_cursor(position), float) == (1.0, position[1])
+
+
+@pytest.mark.parametrize(
+    "cursor, key_type",
+    [
+        (encode_search_cursor(("dune", uuid4())), float),
+        (encode_search_cursor((0.5, uuid4())), str),
+        (encode_cursor(uuid4()), float),
+        ("W1td", float),
+        ("not a cursor", str),
+    ],
+)
+def test_malformed_search_cursor_is_rejected(cursor, key_type):
+    _assert_rejected(decode_search_cursor, cursor, key_type)
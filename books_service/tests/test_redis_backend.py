@@ -0,0 +1,95 @@
+import asyncio
+from uuid import uuid4
+import pytest
+from src.infrastructure.cache import backends
+from src.infrastructure.cache.backends import MemoryCacheBackend, RedisCacheBackend
+from src.infrastructure.cache.codecs import BookCodec
+from src.infrastructure.cache.entity_cache import EntityCache
+
+pytest.importorskip("redis")
+
+
+class StandInPubSub:
+    """One subscription: yields ``events`` in order, raising any exception among them."""
+
+    def __init__(self, *events):
+        self.events = events
+        self.closed = False
+
+    async def subscribe(self, channel):
+        self.channel = channel
+
+    async def listen(self):
+        for event in self.events:
+            if isinstance(event, Exception):
+                raise event
+            yield {"type": "message", "data": event}
+        await asyncio.Event().wait()
+
+    async def aclose(self):
+        self.closed = True
+
+
+class StandInRedis:
+    """Hands out the given subscriptions one connection at a time."""
+
+    def __init__(self, *subscriptions):
+        self.subscriptions = list(subscriptions)
+
+    def pubsub(self, ignore_subscribe_messages):
+        return self.subscriptions.pop(0)
+
+    async def aclose(self):
+        pass
+
+
+def _backend(*subscriptions):
+    backend = RedisCacheBackend("redis://localhost:6379/0", "invalidations")
+    backend._client = StandInRedis(*subscriptions)
+    return backend
+
+
+async def _wait_for(condition):
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+@pytest.fixture(autouse=True)
+def no_resubscribe_delay(monkeypatch):
+    monkeypatch.setattr(backends, "CACHE_RESUBSCRIBE_BACKOFF_S", 0)
+
+
+def test_listener_resubscribes_after_the_connection_drops():
+    lost = StandInPubSub(b"books:b2:1", ConnectionError("connection reset"))
+    restored = StandInPubSub(b"books:b2:2\nbooks:b2:3")
+    received, reconnects = [], []
+
+    async def scenario():
+        backend = _backend(lost, restored)
+        await backend.subscribe(received.append, lambda: reconnects.append(True))
+        await _wait_for(lambda: len(received) == 2)
+        await backend.close()
+
+    asyncio.run(scenario())
+
+    assert received == [["books:b2:1"], ["books:b2:2", "books:b2:3"]]
+    assert reconnects == [True]
+    assert lost.closed
+
+
+def test_near_cache_is_dropped_after_resubscribing():
+    book_id = uuid4()
+
+    async def scenario():
+        near = MemoryCacheBackend(100)
+        backend = _backend(StandInPubSub(ConnectionError("connection reset")), StandInPubSub())
+        cache = EntityCache("books", "test", BookCodec, backend, 30, near=near, near_ttl=30)
+        await near.set(cache.key(book_id), b"possibly stale", 30)
+        await cache.start()
+        await _wait_for(lambda: len(near) == 0)
+        await cache.close()
+
+    asyncio.run(scenario())
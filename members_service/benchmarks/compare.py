@@ -0,0 +1,50 @@
+"""Print the change between two benchmark reports.
+
+    python -m benchmarks.compare before.json after.json
+"""
+import argparse
+import json
+
+METRICS = (
+    ("rps", lambda s: s["rps"], True),
+    ("events/s", lambda s: s.get("events_per_s"), True),
+    ("p50 ms", lambda s: s["latency_ms"]["p50"], False),
+    ("p95 ms", lambda s: s["latency_ms"]["p95"], False),
+    ("p99 ms", lambda s: s["latency_ms"]["p99"], False),
+)
+
+
+def _delta(before, after, higher_is_better):
+    if not before:
+        return "    n/a"
+    change = (after - before) / before * 100
+    marker = "✅" if change == 0 or (change > 0) == higher_is_better else "⚠️ "
+    return f"{change:+7.1f}% {marker}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark reports")
+    parser.add_argument("before")
+    parser.add_argument("after")
+    args = parser.parse_args()
+
+    with open(args.before) as f:
+        before = json.load(f)
+    with open(args.after) as f:
+        after = json.load(f)
+
+    print(f"{before.get('git_revision')} -> {after.get('git_revision')}")
+    for name, new in after["scenarios"].items():
+        old = before["scenarios"].get(name)
+        if old is None:
+            print(f"\n{name}: new scenario")
+            continue
+        print(f"\n{name}")
+        for label, value, higher_is_better in METRICS:
+            if value(old) is None or value(new) is None:
+                continue
+            print(f"  {label:<7} {value(old):>10} -> {value(new):>10}  {_delta(value(old), value(new), higher_is_better)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Shared plumbing for the benchmark scenarios: driving, timing, reporting."""
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+
+def check_database(url: str, allow_any: bool = False):
+    """Benchmarks truncate tables, so only run against a *_bench database."""
+    name = urlparse(url.replace("+asyncpg", "")).path.lstrip("/")
+    if not name.endswith("_bench") and not allow_any:
+        raise SystemExit(
+            f"Refusing to benchmark against database '{name}': its tables are "
+            "truncated. Use a database whose name ends in '_bench', or pass --allow-any-db."
+        )
+
+
+def percentile(sorted_values, q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies, elapsed: float, concurrency: int, **extra) -> dict:
+    ordered = sorted(latencies)
+    ms = lambda seconds: round(seconds * 1000, 3)
+    return {
+        "ops": len(ordered),
+        "concurrency": concurrency,
+        "duration_s": round(elapsed, 3),
+        "rps": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": ms(percentile(ordered, 50)),
+            "p95": ms(percentile(ordered, 95)),
+            "p99": ms(percentile(ordered, 99)),
+            "max": ms(ordered[-1]) if ordered else 0.0,
+            "mean": ms(sum(ordered) / len(ordered)) if ordered else 0.0,
+        },
+        **extra,
+    }
+
+
+async def drive(op, ops: int, concurrency: int):
+    """Run ``op(i)`` for i in range(ops) on ``concurrency`` workers.
+
+    Returns per-op latencies (seconds) and the wall-clock duration.
+    """
+    latencies = []
+    counter = iter(range(ops))
+
+    async def worker():
+        for i in counter:
+            started = time.perf_counter()
+            await op(i)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - started
+
+
+async def allocations(op, ops: int) -> dict:
+    """Memory behaviour of ``ops`` sequential calls, traced with tracemalloc.
+
+    Kept apart from the timed run because tracing slows everything down.
+    """
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for i in range(ops):
+            await op(i)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "sample_ops": ops,
+        "retained_bytes_per_op": round((after - before) / ops) if ops else 0,
+        "peak_kib": round((peak - before) / 1024, 1),
+    }
+
+
+async def scenario(name, op, ops: int, concurrency: int, alloc_ops: int = 0, **extra) -> dict:
+    print(f"▶ {name}: {ops} ops x{concurrency}")
+    latencies, elapsed = await drive(op, ops, concurrency)
+    result = summarize(latencies, elapsed, concurrency, **extra)
+    if alloc_ops:
+        result["allocations"] = await allocations(op, alloc_ops)
+    print(
+        f"  {result['rps']} rps  p50 {result['latency_ms']['p50']} ms  "
+        f"p95 {result['latency_ms']['p95']} ms  p99 {result['latency_ms']['p99']} ms"
+    )
+    return result
+
+
+@asynccontextmanager
+async def booted(app):
+    """Run the app's lifespan and yield an in-process HTTP client for it."""
+    import httpx
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            yield client
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# Settings that change results; recorded so reports are comparable.
+RECORDED_ENV = (
+    "DB_POOL_SIZE",
+    "DB_MAX_OVERFLOW",
+    "CACHE_ENABLED",
+    "CACHE_BACKEND",
+    "KAFKA_LINGER_MS",
+    "OUTBOX_BATCH_SIZE",
+    "OUTBOX_POLL_INTERVAL_S",
+)
+
+
+def write_report(service: str, results: dict, path: str):
+    report = {
+        "service": service,
+        "git_revision": _git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "env": {name: os.environ[name] for name in RECORDED_ENV if name in os.environ},
+        "scenarios": results,
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"📝 Report written to {path}")
@@ -0,0 +1,145 @@
+"""Benchmark scenarios for the members service.
+
+    DATABASE_URL=postgresql+asyncpg://.../members_bench python -m benchmarks.run \\
+        [--scenarios create_relay,read_lookups,list_10k,list_100k] \\
+        [--ops 2000] [--concurrency 16] [--out bench-members.json]
+
+The app runs in-process with its real lifespan, against the given Postgres
+database and an in-memory Kafka fake. Tables are truncated first so runs
+are reproducible. SQLite cannot stand in: the repositories rely on
+Postgres-only SQL (ON CONFLICT, = ANY(array), advisory locks, SKIP LOCKED).
+Compare two reports with ``python -m benchmarks.compare old.json new.json``.
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+from uuid import uuid4
+from benchmarks import fake_kafka
+from benchmarks.harness import booted, check_database, scenario, write_report
+
+SCENARIOS = ("create_relay", "read_lookups", "list_10k", "list_100k")
+SEED_CHUNK = 10000
+
+
+async def _reset():
+    from sqlalchemy import text
+    from src.infrastructure.db.session import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as session:
+        await session.execute(text("TRUNCATE outbox, members RESTART IDENTITY CASCADE"))
+        await session.commit()
+
+
+async def _seed_members(total: int):
+    """Top the members table up to ``total`` rows; returns every member id."""
+    from sqlalchemy import select
+    from src.domain.library.entities.member import Member
+    from src.infrastructure.db.models import MemberModel
+    from src.infrastructure.db.session import AsyncSessionLocal
+    from src.infrastructure.repositories.member_repo_sql import MemberRepositorySQL
+
+    async with AsyncSessionLocal() as session:
+        ids = list((await session.execute(select(MemberModel.member_id))).scalars())
+        repo = MemberRepositorySQL(session)
+        while len(ids) < total:
+            count = min(SEED_CHUNK, total - len(ids))
+            members = []
+            for _ in range(count):
+                member_id = uuid4()
+                members.append(Member(member_id, f"Seed {member_id.hex[:8]}", f"{member_id.hex}@seed.bench"))
+            ids.extend(await repo.create_many(members))
+            await session.commit()
+    return ids
+
+
+async def _wait_published(broker, key: bytes, timeout=30):
+    deadline = time.monotonic() + timeout
+    while key not in broker.by_key:
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"event for {key!r} was not published")
+        await asyncio.sleep(0.001)
+
+
+def _expect(response, status):
+    if response.status_code != status:
+        raise RuntimeError(f"{response.request.method} {response.request.url}: {response.status_code} {response.text}")
+    return response
+
+
+async def _http_scenarios(args, broker, results):
+    from src.main import app
+    from src.presentation.pagination import encode_cursor
+
+    rng = random.Random(42)
+    alloc_ops = min(200, args.ops // 10)
+
+    async with booted(app) as client:
+        if "create_relay" in args.scenarios:
+            async def create_relay(i):
+                # From the POST until the outbox relay has handed the event to Kafka.
+                email = f"{uuid4().hex}@bench.io"
+                response = _expect(await client.post("/members/", json={"name": f"Bench {i}", "email": email}), 201)
+                await _wait_published(broker, response.json()["member_id"].encode("utf-8"))
+
+            results["create_relay"] = await scenario(
+                "create_relay", create_relay, args.ops, args.concurrency, alloc_ops,
+            )
+
+        if "read_lookups" in args.scenarios:
+            ids = await _seed_members(1000)
+            picks = [rng.choice(ids) for _ in range(args.ops + alloc_ops)]
+
+            async def read_lookup(i):
+                _expect(await client.get(f"/members/members/{picks[i]}"), 200)
+
+            results["read_lookups"] = await scenario(
+                "read_lookups", read_lookup, args.ops, args.concurrency, alloc_ops, table_rows=len(ids),
+            )
+
+        for name, rows in (("list_10k", 10000), ("list_100k", 100000)):
+            if name not in args.scenarios:
+                continue
+            await _seed_members(rows)
+            # Random cursors land each page at an arbitrary point in the key range.
+            cursors = [encode_cursor(uuid4()) for _ in range(args.ops + alloc_ops)]
+
+            async def list_page(i, cursors=cursors):
+                _expect(await client.get("/members/", params={"limit": 50, "cursor": cursors[i]}), 200)
+
+            results[name] = await scenario(
+                name, list_page, args.ops, args.concurrency, alloc_ops, table_rows=rows, page_size=50,
+            )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Members service benchmarks")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--ops", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--out", default="bench-members.json")
+    parser.add_argument("--allow-any-db", action="store_true")
+    args = parser.parse_args()
+    args.scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    check_database(os.environ.get("DATABASE_URL", ""), args.allow_any_db)
+
+    broker = fake_kafka.FakeBroker()
+    fake_kafka.install(broker)
+
+    from src.infrastructure.db.migrate import migrate
+
+    await migrate()
+    await _reset()
+
+    results = {}
+    await _http_scenarios(args, broker, results)
+    write_report("members", results, args.out)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
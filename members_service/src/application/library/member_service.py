@@ -3,49 +3,103 @@ from uuid import UUID
 
 class MemberService:
 
-    def __init__(self, member_repo, kafka_producer):
-        self.member_repo = member_repo
-        self.kafka_producer = kafka_producer
+    def __init__(self, uow):
+        self.uow = uow
 
     async def create_member(self, member):
-        existing = await self.member_repo.get_by_email(member.email)
+        existing = await self.uow.members.get_by_email(member.email)
         if existing:
             raise Exception("Email already exists")
         
-        await self.member_repo.create(member)
-
-        success = self.kafka_producer.send_member_created(member.member_id)
-
-        if not success:
-            print(f"⚠️  WARNING: Member {member.member_id} created but event not published")
+        # The event is committed with the member and relayed to Kafka later,
+        # so it can neither be lost nor delay the request.
+        await self.uow.members.create(member)
+        await self.uow.outbox.add_member_created([member.member_id])
+        await self.uow.commit()
 
         return member
     
 
+    async def create_members(self, members):
+        """Insert many members and their outbox events in one transaction.
+
+        Returns ``(member, status)`` pairs in input order, where status is
+        "created" or "conflict" (email already registered or repeated in
+        the batch).
+        """
+        unique, seen = [], set()
+        for member in members:
+            if member.email not in seen:
+                seen.add(member.email)
+                unique.append(member)
+
+        created = await self.uow.members.create_many(unique)
+        await self.uow.outbox.add_member_created(
+            [member.member_id for member in unique if member.member_id in created]
+        )
+        await self.uow.commit()
+
+        return [
+            (member, "created" if member.member_id in created else "conflict")
+            for member in members
+        ]
+
+    async def delete_members(self, member_ids):
+        """Delete many members; returns ``(member_id, status)`` pairs in input order."""
+        deleted = await self.uow.members.delete_many(list(dict.fromkeys(member_ids)))
+        await self.uow.commit()
+        return [
+            (member_id, "deleted" if member_id in deleted else "not_found")
+            for member_id in member_ids
+        ]
+
     async def update_member(self, member_id, data):
-        member = await self.member_repo.get_by_id(member_id)
+        member = await self.uow.members.get_by_id(member_id)
         if not member:
             raise Exception("Member not found")
         
         if data.name is not None:
             member.name = data.name
 
-        await self.member_repo.update(member)
+        await self.uow.members.update(member)
+        await self.uow.commit()
         return member
 
-    async def list_members(self):
-        return await self.member_repo.list()
+    async def list_members(self, limit: int, after: UUID = None, **filters):
+        """Return one page of member rows and the id to continue after, if any."""
+        members = await self.uow.members.list_rows(limit + 1, after, **filters)
+        if len(members) > limit:
+            members = members[:limit]
+            return members, members[-1].member_id
+        return members, None
     
+    def export_members(self, batch_size: int = 1000):
+        """Async iterator over batches of member rows for bulk export."""
+        return self.uow.members.stream_rows(batch_size)
+
     async def get_member_by_id(self, member_id: UUID):
-        member = await self.member_repo.get_by_id(member_id)
+        member = await self.uow.members.get_by_id(member_id)
         if not member:
             raise Exception("Member not found")
         
         return member
 
+    async def get_members(self, member_ids):
+        """Look up many members at once.
+
+        Returns the members found, in request order without repeats, and the
+        requested ids that do not exist.
+        """
+        unique = list(dict.fromkeys(member_ids))
+        found = {member.member_id: member for member in await self.uow.members.get_many(unique)}
+        members = [found[member_id] for member_id in unique if member_id in found]
+        missing = [member_id for member_id in unique if member_id not in found]
+        return members, missing
+
     async def delete_member_by_id(self, member_id: UUID):
-        member = await self.member_repo.get_by_id(member_id)
+        member = await self.uow.members.get_by_id(member_id)
         if not member:
             raise Exception("Member not found")
         
-        await self.member_repo.delete(member_id)
\ No newline at end of file
+        await self.uow.members.delete(member_id)
+        await self.uow.commit()
\ No newline at end of file
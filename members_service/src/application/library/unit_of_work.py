@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+
+
+class UnitOfWork(ABC):
+    """Groups the repositories used by one operation under a single transaction."""
+
+    members = None
+    outbox = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.rollback()
+
+    @abstractmethod
+    async def commit(self):
+        pass
+
+    @abstractmethod
+    async def rollback(self):
+        pass
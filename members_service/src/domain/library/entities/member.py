@@ -1,5 +1,9 @@
 class Member:
-    def __init__(self, member_id, name, email):
+    __slots__ = ("member_id", "name", "email", "version")
+
+    def __init__(self, member_id, name, email, version=1):
         self.member_id = member_id
         self.name = name
-        self.email = email
\ No newline at end of file
+        self.email = email
+        # Bumped by the repository on every write; exposed to clients as the ETag.
+        self.version = version
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Set
 from src.domain.library.entities.member import Member
 
 class MemberRepository(ABC):
@@ -8,10 +8,25 @@ class MemberRepository(ABC):
     def get_by_id(self, member_id) -> Optional[Member]:
         pass
 
+    @abstractmethod
+    def get_many(self, member_ids: List) -> List[Member]:
+        """Members for the ids that exist, in no particular order."""
+        pass
+
     @abstractmethod
     def get_by_email(self, email) -> Optional[Member]:
         pass
 
     @abstractmethod
     def delete(self, member_id) -> None:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def create_many(self, members: List[Member]) -> Set:
+        """Insert members, skipping duplicates. Returns the inserted ids."""
+        pass
+
+    @abstractmethod
+    def delete_many(self, member_ids: List) -> Set:
+        """Delete members by id. Returns the ids that were deleted."""
+        pass
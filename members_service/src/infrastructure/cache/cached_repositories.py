@@ -0,0 +1,47 @@
+class CachedMemberRepository:
+    """Read-through cache in front of a member repository.
+
+    ``get_by_id`` is served from the shared member cache. Every write drops
+    the affected keys immediately and once more after the unit of work
+    commits, so a read racing the transaction cannot leave the old row
+    cached. Other calls go straight to the wrapped repository.
+    """
+
+    def __init__(self, repo, cache, on_commit):
+        self._repo = repo
+        self._cache = cache
+        self._pending = set()
+        on_commit(self._invalidate_pending)
+
+    def __getattr__(self, name):
+        return getattr(self._repo, name)
+
+    async def _invalidate(self, *member_ids):
+        self._pending.update(member_ids)
+        await self._cache.invalidate(*member_ids)
+
+    async def _invalidate_pending(self):
+        pending, self._pending = self._pending, set()
+        await self._cache.invalidate(*pending)
+
+    async def get_by_id(self, member_id):
+        return await self._cache.get_or_load(member_id, lambda: self._repo.get_by_id(member_id))
+
+    async def get_many(self, member_ids):
+        found = await self._cache.get_many_or_load(member_ids, self._load_many)
+        return list(found.values())
+
+    async def _load_many(self, member_ids):
+        return {member.member_id: member for member in await self._repo.get_many(member_ids)}
+
+    async def update(self, member):
+        await self._invalidate(member.member_id)
+        await self._repo.update(member)
+
+    async def delete(self, member_id):
+        await self._invalidate(member_id)
+        await self._repo.delete(member_id)
+
+    async def delete_many(self, member_ids):
+        await self._invalidate(*member_ids)
+        return await self._repo.delete_many(member_ids)
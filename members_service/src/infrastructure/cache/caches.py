@@ -0,0 +1,59 @@
+from src.infrastructure.cache.backends import (
+    FakeNetworkCacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+)
+from src.infrastructure.cache.codecs import MemberCodec
+from src.infrastructure.cache.config import (
+    CACHE_BACKEND,
+    CACHE_NAMESPACE,
+    CACHE_MAX_ENTRIES,
+    CACHE_TTL_S,
+    CACHE_LOCAL_TTL_S,
+    CACHE_REDIS_URL,
+    CACHE_INVALIDATION_CHANNEL,
+)
+from src.infrastructure.cache.entity_cache import EntityCache
+
+
+def build_cache(name, codec, backend_name=CACHE_BACKEND):
+    """Create an entity cache on the configured backend.
+
+    Shared backends get a short-lived near-cache in front of them so the
+    hot set is answered without a network hop.
+    """
+    if backend_name == "memory":
+        return EntityCache(name, CACHE_NAMESPACE, codec, MemoryCacheBackend(CACHE_MAX_ENTRIES), CACHE_TTL_S)
+
+    if backend_name == "redis":
+        backend = RedisCacheBackend(CACHE_REDIS_URL, CACHE_INVALIDATION_CHANNEL)
+    elif backend_name == "fake":
+        backend = FakeNetworkCacheBackend()
+    else:
+        raise RuntimeError(f"Unknown CACHE_BACKEND: {backend_name}")
+
+    return EntityCache(
+        name,
+        CACHE_NAMESPACE,
+        codec,
+        backend,
+        CACHE_TTL_S,
+        near=MemoryCacheBackend(CACHE_MAX_ENTRIES),
+        near_ttl=CACHE_LOCAL_TTL_S,
+    )
+
+
+# Shared by every request in this process.
+member_cache = build_cache("members", MemberCodec)
+
+CACHES = (member_cache,)
+
+
+async def start_caches():
+    for cache in CACHES:
+        await cache.start()
+
+
+async def close_caches():
+    for cache in CACHES:
+        await cache.close()
@@ -0,0 +1,25 @@
+import json
+from uuid import UUID
+from src.domain.library.entities.member import Member
+
+# Entities are stored as small positional JSON arrays (never pickled ORM
+# objects), so any replica can decode them and entries stay compact.
+_SEPARATORS = (",", ":")
+
+
+class MemberCodec:
+    # Bump the prefix whenever the array layout changes, so replicas running
+    # the old layout never read entries they cannot decode.
+    prefix = "m2"
+
+    @staticmethod
+    def encode(member: Member) -> bytes:
+        return json.dumps(
+            [member.member_id.hex, member.name, member.email, member.version],
+            separators=_SEPARATORS,
+        ).encode("utf-8")
+
+    @staticmethod
+    def decode(data: bytes) -> Member:
+        member_id, name, email, version = json.loads(data)
+        return Member(UUID(hex=member_id), name, email, version)
@@ -0,0 +1,240 @@
+import asyncio
+from uuid import UUID
+
+
+def _consume_exception(future: asyncio.Future):
+    # A failed load with no concurrent waiters must not log
+    # "exception was never retrieved"; the loader's caller already got it.
+    if not future.cancelled():
+        future.exception()
+
+
+async def _load_one(loader, entity_id):
+    return (await loader([entity_id])).get(entity_id)
+
+
+class EntityCache:
+    """Read-through cache for one entity type on top of a ``CacheBackend``.
+
+    Lookups check the optional per-replica ``near`` cache, then the
+    backend, then the loader. Concurrent misses for the same id share one
+    load (single-flight), and an invalidation during a load keeps its
+    possibly stale result out of the cache. Invalidations are broadcast so
+    other replicas drop their near copies.
+    """
+
+    def __init__(self, name, namespace, codec, backend, ttl, near=None, near_ttl=None):
+        self.name = name
+        self.codec = codec
+        self.backend = backend
+        self.ttl = ttl
+        self.near = near
+        self.near_ttl = near_ttl or ttl
+        self._prefix = f"{namespace}:{codec.prefix}:"
+        self._inflight = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    def key(self, entity_id: UUID) -> str:
+        return self._prefix + entity_id.hex
+
+    async def start(self):
+        await self.backend.subscribe(self._on_remote_invalidation, self._on_resubscribed)
+
+    def _on_remote_invalidation(self, keys):
+        if self.near is None:
+            return
+        for key in keys:
+            if key.startswith(self._prefix):
+                self.near.delete_now([key])
+                self._inflight.pop(key, None)
+
+    def _on_resubscribed(self):
+        # Invalidations sent while the channel was down never arrived, so
+        # nothing held locally can be trusted; in-flight loads stay uncached.
+        if self.near is None:
+            return
+        self.near.clear()
+        self._inflight.clear()
+
+    async def _lookup(self, key):
+        if self.near is not None:
+            data = await self.near.get(key)
+            if data is not None:
+                return data
+        data = await self.backend.get(key)
+        if data is not None and self.near is not None:
+            await self.near.set(key, data, self.near_ttl)
+        return data
+
+    async def _lookup_many(self, keys):
+        found = [None] * len(keys)
+        remote = list(range(len(keys)))
+        if self.near is not None:
+            found = await self.near.get_many(keys)
+            remote = [i for i, data in enumerate(found) if data is None]
+        if remote:
+            fetched = await self.backend.get_many([keys[i] for i in remote])
+            fresh = {}
+            for i, data in zip(remote, fetched):
+                found[i] = data
+                if data is not None:
+                    fresh[keys[i]] = data
+            if fresh and self.near is not None:
+                await self.near.set_many(fresh, self.near_ttl)
+        return found
+
+    async def get_or_load(self, entity_id: UUID, loader):
+        """Return the cached entity or await ``loader()`` once for all callers.
+
+        ``None`` results are not cached. Every caller gets its own decoded
+        object, so mutating it never touches the cache.
+        """
+        key = self.key(entity_id)
+        data = await self._lookup(key)
+        if data is not None:
+            self.hits += 1
+            return self.codec.decode(data)
+
+        self.misses += 1
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.coalesced += 1
+            try:
+                data = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The leading caller was cancelled, not us: load it ourselves.
+                return await self.get_or_load(entity_id, loader)
+            return self.codec.decode(data) if data is not None else None
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_consume_exception)
+        self._inflight[key] = future
+        try:
+            value = await loader()
+            data = self.codec.encode(value) if value is not None else None
+            if data is not None and self._inflight.get(key) is future:
+                await self.backend.set(key, data, self.ttl)
+                if self.near is not None:
+                    await self.near.set(key, data, self.near_ttl)
+        except BaseException as e:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+            raise
+
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        future.set_result(data)
+        return value
+
+    async def get_many_or_load(self, entity_ids, loader):
+        """Batch form of ``get_or_load``.
+
+        Cache lookups are batched per layer and every miss not already being
+        loaded goes to a single ``loader(ids)`` call, which must return a
+        mapping of id to entity. Returns that mapping for the ids that exist.
+        """
+        ids = {self.key(entity_id): entity_id for entity_id in entity_ids}
+        keys = list(ids)
+        found = {}
+        misses = []
+        for key, data in zip(keys, await self._lookup_many(keys)):
+            if data is not None:
+                found[ids[key]] = self.codec.decode(data)
+            else:
+                misses.append(key)
+        self.hits += len(found)
+        self.misses += len(misses)
+
+        waiting, owned = {}, {}
+        for key in misses:
+            if key in self._inflight:
+                waiting[key] = self._inflight[key]
+            else:
+                future = asyncio.get_running_loop().create_future()
+                future.add_done_callback(_consume_exception)
+                self._inflight[key] = owned[key] = future
+
+        if owned:
+            try:
+                loaded = await loader([ids[key] for key in owned])
+                encoded = {}
+                for key in owned:
+                    value = loaded.get(ids[key])
+                    encoded[key] = self.codec.encode(value) if value is not None else None
+                    if value is not None:
+                        found[ids[key]] = value
+                fresh = {
+                    key: data
+                    for key, data in encoded.items()
+                    if data is not None and self._inflight.get(key) is owned[key]
+                }
+                if fresh:
+                    await self.backend.set_many(fresh, self.ttl)
+                    if self.near is not None:
+                        await self.near.set_many(fresh, self.near_ttl)
+            except BaseException as e:
+                for key, future in owned.items():
+                    if self._inflight.get(key) is future:
+                        del self._inflight[key]
+                    if isinstance(e, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(e)
+                raise
+
+            for key, future in owned.items():
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+                future.set_result(encoded[key])
+
+        for key, pending in waiting.items():
+            self.coalesced += 1
+            try:
+                data = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                entity_id = ids[key]
+                value = await self.get_or_load(entity_id, lambda: _load_one(loader, entity_id))
+                if value is not None:
+                    found[entity_id] = value
+                continue
+            if data is not None:
+                found[ids[key]] = self.codec.decode(data)
+
+        return found
+
+    async def invalidate(self, *entity_ids: UUID):
+        keys = [self.key(entity_id) for entity_id in entity_ids]
+        if not keys:
+            return
+        self.invalidations += len(keys)
+        for key in keys:
+            self._inflight.pop(key, None)
+        if self.near is not None:
+            await self.near.delete(keys)
+        await self.backend.delete(keys)
+        await self.backend.publish_invalidation(keys)
+
+    async def close(self):
+        await self.backend.close()
+
+    def stats(self) -> dict:
+        store = self.near if self.near is not None else self.backend
+        return {
+            "entries": len(store) if hasattr(store, "__len__") else 0,
+            "hits_total": self.hits,
+            "misses_total": self.misses,
+            "evictions_total": store.evictions,
+            "coalesced_total": self.coalesced,
+            "invalidations_total": self.invalidations,
+        }
@@ -1,7 +1,39 @@
+import logging
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import declarative_base
-from src.infrastructure.db.config import DATABASE_URL
+from src.infrastructure.db.config import (
+    DATABASE_URL,
+    DB_ECHO,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+    DB_STATEMENT_TIMEOUT_MS,
+)
+from src.infrastructure.db.pool import InstrumentedAsyncPool
 
-engine = create_async_engine(DATABASE_URL, echo=True)
 
-Base = declarative_base()
\ No newline at end of file
+def _connect_args():
+    # statement_timeout is applied server side on every new asyncpg connection.
+    if DB_STATEMENT_TIMEOUT_MS > 0 and "asyncpg" in DATABASE_URL:
+        return {"server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}}
+    return {}
+
+
+if DB_ECHO:
+    # Through the log queue rather than echo=True's own stdout handler.
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+
+engine = create_async_engine(
+    DATABASE_URL,
+    poolclass=InstrumentedAsyncPool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+    connect_args=_connect_args(),
+)
+
+Base = declarative_base()
@@ -1,5 +0,0 @@
-from src.infrastructure.db.connection import Base, engine
-
-async def init_db():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
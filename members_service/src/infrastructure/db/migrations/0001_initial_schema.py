@@ -0,0 +1,29 @@
+"""Tables, as they were first created by create_all at app start.
+
+Every statement tolerates a database that create_all already built, so
+existing deployments adopt migrations by recording this version.
+"""
+
+STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS members (
+        member_id UUID NOT NULL,
+        name VARCHAR NOT NULL,
+        email VARCHAR NOT NULL,
+        PRIMARY KEY (member_id),
+        UNIQUE (email)
+    )
+    """,
+    # Added after the first deploy.
+    "ALTER TABLE members ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1",
+    """
+    CREATE TABLE IF NOT EXISTS outbox (
+        id BIGSERIAL NOT NULL,
+        topic VARCHAR NOT NULL,
+        key VARCHAR NOT NULL,
+        payload TEXT NOT NULL,
+        created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+        PRIMARY KEY (id)
+    )
+    """,
+)
@@ -0,0 +1,11 @@
+"""Index behind the member name prefix search.
+
+Built concurrently, so reads and writes carry on while it builds.
+"""
+
+# CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+TRANSACTIONAL = False
+
+STATEMENTS = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_members_name_prefix ON members (name text_pattern_ops)",
+)
@@ -0,0 +1,8 @@
+"""Lets the relay claim outbox rows and publish them outside a transaction.
+
+A nullable column without a default is added without rewriting the table.
+"""
+
+STATEMENTS = (
+    "ALTER TABLE outbox ADD COLUMN IF NOT EXISTS claimed_until TIMESTAMP WITH TIME ZONE",
+)
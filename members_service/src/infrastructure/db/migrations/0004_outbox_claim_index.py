@@ -0,0 +1,12 @@
+"""Index behind the relay's check for a batch still in flight.
+
+Only claimed rows are indexed, at most one batch of them.
+"""
+
+# CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+TRANSACTIONAL = False
+
+STATEMENTS = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_outbox_claimed_until ON outbox (claimed_until) "
+    "WHERE claimed_until IS NOT NULL",
+)
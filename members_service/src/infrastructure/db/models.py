@@ -1,11 +1,28 @@
-from sqlalchemy import Column, String
+from sqlalchemy import Column, String, BigInteger, DateTime, Integer, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from src.infrastructure.db.connection import Base
 import uuid
 
+# The tables and their indexes are created by the migrations in
+# src/infrastructure/db/migrations; these classes only map them.
+
 class MemberModel(Base):
     __tablename__ = "members"
 
     member_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False)
     email = Column(String, nullable=False, unique=True)
+    version = Column(Integer, nullable=False, default=1, server_default=text("1"))
+
+
+class OutboxModel(Base):
+    """Events waiting to be relayed to Kafka, written with the change they describe."""
+    __tablename__ = "outbox"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    topic = Column(String, nullable=False)
+    key = Column(String, nullable=False)
+    payload = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    # Set while a relay is publishing the row; see OutboxRelay.
+    claimed_until = Column(DateTime(timezone=True), nullable=True)
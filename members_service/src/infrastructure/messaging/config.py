@@ -0,0 +1,23 @@
+import os
+
+from src.infrastructure.env import env_bool
+
+KAFKA_BOOTSTRAP_SERVERS = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "kafka:9092")
+KAFKA_MEMBER_CREATED_TOPIC = os.getenv("KAFKA_MEMBER_CREATED_TOPIC", "member-created")
+
+KAFKA_ACKS = os.getenv("KAFKA_ACKS", "all")
+KAFKA_ENABLE_IDEMPOTENCE = env_bool("KAFKA_ENABLE_IDEMPOTENCE", True)
+KAFKA_LINGER_MS = int(os.getenv("KAFKA_LINGER_MS", "5"))
+KAFKA_BATCH_SIZE = int(os.getenv("KAFKA_BATCH_SIZE", "65536"))
+KAFKA_BATCH_NUM_MESSAGES = int(os.getenv("KAFKA_BATCH_NUM_MESSAGES", "10000"))
+KAFKA_COMPRESSION_TYPE = os.getenv("KAFKA_COMPRESSION_TYPE", "lz4")
+KAFKA_QUEUE_MAX_MESSAGES = int(os.getenv("KAFKA_QUEUE_MAX_MESSAGES", "100000"))
+KAFKA_POLL_INTERVAL_S = float(os.getenv("KAFKA_POLL_INTERVAL_S", "0.1"))
+
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "500"))
+OUTBOX_POLL_INTERVAL_S = float(os.getenv("OUTBOX_POLL_INTERVAL_S", "0.2"))
+OUTBOX_DELIVERY_TIMEOUT_S = float(os.getenv("OUTBOX_DELIVERY_TIMEOUT_S", "30"))
+# Rows claimed by a relay that died mid-batch are claimed again after this.
+# Keep it above OUTBOX_DELIVERY_TIMEOUT_S.
+OUTBOX_CLAIM_TTL_S = float(os.getenv("OUTBOX_CLAIM_TTL_S", "60"))
+OUTBOX_MAX_BACKOFF_S = float(os.getenv("OUTBOX_MAX_BACKOFF_S", "30"))
@@ -1,82 +1,168 @@
-import json
+import asyncio
 import atexit
+import logging
+import time
+from typing import Optional
 from confluent_kafka import Producer, KafkaException
-from uuid import UUID
+from src.infrastructure.messaging.config import (
+    KAFKA_BOOTSTRAP_SERVERS,
+    KAFKA_ACKS,
+    KAFKA_ENABLE_IDEMPOTENCE,
+    KAFKA_LINGER_MS,
+    KAFKA_BATCH_SIZE,
+    KAFKA_BATCH_NUM_MESSAGES,
+    KAFKA_COMPRESSION_TYPE,
+    KAFKA_QUEUE_MAX_MESSAGES,
+    KAFKA_POLL_INTERVAL_S,
+)
+from src.infrastructure.observability.metrics import KAFKA_PRODUCER_QUEUE, topic_metrics
+from src.infrastructure.observability.health import OK, DEGRADED, DOWN
+from src.infrastructure.observability.config import HEALTH_CHECK_TIMEOUT_S, HEALTH_MAX_PRODUCER_QUEUE
+
+logger = logging.getLogger(__name__)
 
 
 class KafkaProducer:
-    """Simple, reliable Kafka producer for member events."""
+    """Non-blocking Kafka producer used by the outbox relay.
+
+    ``produce`` only appends to librdkafka's local queue; a background task
+    on the event loop polls the producer so delivery reports are handled,
+    and each publish returns an asyncio future resolved by its report.
 
-    def __init__(self, bootstrap_servers: str = "kafka:9092"):
+    librdkafka's threads do not survive a fork, so each worker process
+    creates its own producer in the app lifespan.
+    """
+
+    def __init__(self, bootstrap_servers: str = KAFKA_BOOTSTRAP_SERVERS):
         self.bootstrap_servers = bootstrap_servers
-        self.topic = "member-created"
         self.producer = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._poll_task: Optional[asyncio.Task] = None
         self._initialize_producer()
         atexit.register(self.close)
 
     def _initialize_producer(self):
-        """Initialize Kafka producer with minimal, reliable configuration."""
+        """Initialize Kafka producer with batching and compression settings."""
         config = {
             "bootstrap.servers": self.bootstrap_servers,
-            "acks": "1",  # Wait for leader acknowledgment only
+            "acks": KAFKA_ACKS,
+            # Idempotence keeps retried batches in order within a partition.
+            "enable.idempotence": KAFKA_ENABLE_IDEMPOTENCE,
             "retries": 3,
             "retry.backoff.ms": 300,
+            "linger.ms": KAFKA_LINGER_MS,
+            "batch.size": KAFKA_BATCH_SIZE,
+            "batch.num.messages": KAFKA_BATCH_NUM_MESSAGES,
+            "compression.type": KAFKA_COMPRESSION_TYPE,
+            "queue.buffering.max.messages": KAFKA_QUEUE_MAX_MESSAGES,
+            # librdkafka's own log lines go through the log queue, served by poll().
+            "logger": logging.getLogger("librdkafka"),
         }
 
         try:
             self.producer = Producer(config)
-            print(f"✅ Kafka producer initialized")
-            print(f"   Bootstrap: {self.bootstrap_servers}")
-            print(f"   Topic: {self.topic}")
-        except KafkaException as e:
-            print(f"❌ Failed to initialize producer: {e}")
+            logger.info("Kafka producer initialized", extra={"bootstrap": self.bootstrap_servers})
+        except KafkaException:
+            logger.exception("Failed to initialize producer")
             raise
 
-    def _delivery_callback(self, err, msg):
-        """Callback for delivery confirmation."""
+    async def start(self):
+        """Start the background task that serves delivery callbacks."""
+        self._loop = asyncio.get_running_loop()
+        if self._poll_task is None:
+            self._poll_task = asyncio.create_task(self._poll_loop(), name="KafkaProducerPoll")
+
+    async def _poll_loop(self):
+        # poll() blocks for up to the interval, so it runs in the default
+        # executor; delivery callbacks fire on that worker thread.
+        while self.producer is not None:
+            producer = self.producer
+            await self._loop.run_in_executor(None, producer.poll, KAFKA_POLL_INTERVAL_S)
+            # Set on every poll rather than read at scrape time, so the
+            # multiprocess aggregate sees it too.
+            KAFKA_PRODUCER_QUEUE.set(len(producer))
+        KAFKA_PRODUCER_QUEUE.set(0)
+
+    async def health(self):
+        """Readiness probe: running, broker reachable, local queue not backed up."""
+        producer = self.producer
+        if producer is None or self._poll_task is None or self._poll_task.done():
+            return DOWN, "producer is not running"
+        # A metadata request proves the broker answers; it blocks, so off the loop.
+        await asyncio.to_thread(producer.list_topics, timeout=HEALTH_CHECK_TIMEOUT_S)
+        detail = {"queued": len(producer)}
+        if detail["queued"] > HEALTH_MAX_PRODUCER_QUEUE:
+            return DEGRADED, detail
+        return OK, detail
+
+    def _delivery_callback(self, future: asyncio.Future, metrics, started: float, err, msg):
+        """Runs on the poll thread; hands the result back to the event loop."""
+        if err:
+            metrics.failed.inc()
+        else:
+            metrics.delivered.inc()
+            metrics.delivery.observe(time.perf_counter() - started)
+        try:
+            self._loop.call_soon_threadsafe(self._resolve, future, err, msg)
+        except RuntimeError:
+            # Event loop already closed (final flush at interpreter exit).
+            pass
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, err, msg):
+        if future.done():
+            return
         if err:
-            print(f"❌ Delivery FAILED: {err}")
+            future.set_exception(KafkaException(err))
         else:
-            print(f"✅ Delivered to {msg.topic()} [partition {msg.partition()}] at offset {msg.offset()}")
+            future.set_result((msg.partition(), msg.offset()))
 
-    def send_member_created(self, member_id: UUID) -> bool:
-        """Send member-created event to Kafka."""
-        if not self.producer:
-            print("❌ Producer not initialized")
-            return False
+    async def publish(self, topic: str, key: bytes, value: bytes) -> asyncio.Future:
+        """Queue a message without waiting for the broker.
 
-        event = {"member_id": str(member_id)}
-        
-        print(f"📤 Sending member-created event: {member_id}")
+        Returns once the message is queued; the returned future resolves to
+        ``(partition, offset)`` on delivery or raises KafkaException.
+        """
+        if self.producer is None:
+            raise RuntimeError("Producer not initialized")
+        if self._loop is None:
+            raise RuntimeError("Producer not started")
 
-        try:
-            self.producer.produce(
-                topic=self.topic,
-                key=str(member_id).encode('utf-8'),
-                value=json.dumps(event).encode('utf-8'),
-                callback=self._delivery_callback
-            )
-
-            # Trigger callbacks
-            self.producer.poll(0)
-
-            # Wait for delivery
-            remaining = self.producer.flush(timeout=5)
-            
-            if remaining > 0:
-                print(f"⚠️  {remaining} message(s) not delivered")
-                return False
-            
-            return True
+        future = self._loop.create_future()
+        metrics = topic_metrics(topic)
+        started = time.perf_counter()
+        while True:
+            try:
+                self.producer.produce(
+                    topic=topic,
+                    key=key,
+                    value=value,
+                    on_delivery=lambda err, msg: self._delivery_callback(future, metrics, started, err, msg),
+                )
+                return future
+            except BufferError:
+                # Local queue is full: yield to the loop until the poll task
+                # has drained some deliveries instead of blocking.
+                await asyncio.sleep(KAFKA_POLL_INTERVAL_S)
 
-        except Exception as e:
-            print(f"❌ Error sending message: {e}")
-            return False
+    async def stop(self, timeout: float = 10):
+        """Flush outstanding messages without blocking the event loop."""
+        if self.producer is not None:
+            logger.info("Closing Kafka producer")
+            producer = self.producer
+            remaining = await asyncio.to_thread(producer.flush, timeout)
+            if remaining > 0:
+                logger.warning("Messages not delivered before close", extra={"remaining": remaining})
+            self.producer = None
+            logger.info("Producer closed")
+        if self._poll_task:
+            await self._poll_task
+            self._poll_task = None
 
     def close(self):
-        """Close the producer."""
-        if self.producer:
-            print("🔄 Closing Kafka producer...")
+        """Close the producer (synchronous fallback used at interpreter exit)."""
+        if self.producer is not None:
+            logger.info("Closing Kafka producer")
             self.producer.flush(timeout=10)
             self.producer = None
-            print("✅ Producer closed")
+            logger.info("Producer closed")
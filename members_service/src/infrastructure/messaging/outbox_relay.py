@@ -0,0 +1,158 @@
+import asyncio
+import logging
+import time
+from src.infrastructure.db.session import AsyncSessionLocal
+from src.infrastructure.repositories.outbox_repo_sql import OutboxRepositorySQL
+from src.infrastructure.messaging.config import (
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_CLAIM_TTL_S,
+    OUTBOX_POLL_INTERVAL_S,
+    OUTBOX_DELIVERY_TIMEOUT_S,
+    OUTBOX_MAX_BACKOFF_S,
+)
+from src.infrastructure.observability.metrics import OUTBOX_BATCH_DURATION, OUTBOX_FAILED, OUTBOX_RELAYED
+from src.infrastructure.observability.health import OK, DEGRADED, DOWN
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """Drains the outbox table to Kafka in batches.
+
+    Each batch is claimed in a short transaction, published with no
+    transaction or connection held, and its delivered rows are deleted in a
+    second one, so a row is only removed once the broker acknowledged it.
+    Undelivered rows are released and retried with exponential backoff; the
+    claim of a relay that dies mid-batch expires after OUTBOX_CLAIM_TTL_S.
+    Delivery is therefore at-least-once and consumers must be idempotent.
+    """
+
+    def __init__(
+        self,
+        producer,
+        session_factory=AsyncSessionLocal,
+        batch_size: int = OUTBOX_BATCH_SIZE,
+        poll_interval: float = OUTBOX_POLL_INTERVAL_S,
+    ):
+        self.producer = producer
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.running = False
+        self._task = None
+        self._failures = 0
+        self._stopping = asyncio.Event()
+
+    def start(self):
+        self.running = True
+        self._stopping.clear()
+        self._task = asyncio.create_task(self.run(), name="OutboxRelay")
+
+    async def stop(self):
+        """Stop after the batch in flight is settled.
+
+        Cancelling it instead would hand its rows back while the producer
+        still delivers them on close, so each shutdown would resend a batch.
+        """
+        self.running = False
+        self._stopping.set()
+        if self._task:
+            await self._task
+            self._task = None
+
+    async def _sleep(self, delay: float):
+        """Sleep that ends early when ``stop`` is called."""
+        try:
+            await asyncio.wait_for(self._stopping.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+
+    def _backoff(self) -> float:
+        # The exponent is clamped first: 2.0 ** 1024 overflows a float.
+        return min(self.poll_interval * 2 ** min(self._failures, 16), OUTBOX_MAX_BACKOFF_S)
+
+    async def health(self):
+        """Readiness probe: the relay task is alive and its last batch went out."""
+        if self._task is None or self._task.done():
+            return DOWN, "relay is not running"
+        if self._failures:
+            return DEGRADED, {"consecutive_failures": self._failures}
+        return OK, None
+
+    async def run(self):
+        logger.info("Outbox relay started")
+        self._failures = 0
+        while self.running:
+            try:
+                relayed, failed = await self.relay_once()
+                if failed:
+                    self._failures += 1
+                    await self._sleep(self._backoff())
+                else:
+                    self._failures = 0
+                    # A full batch means more rows are probably waiting.
+                    if relayed < self.batch_size:
+                        await self._sleep(self.poll_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Outbox relay error")
+                self._failures += 1
+                await self._sleep(self._backoff())
+        logger.info("Outbox relay stopped")
+
+    async def relay_once(self):
+        """Publish one batch. Returns ``(relayed, failed)`` row counts."""
+        started = time.perf_counter()
+        rows = await self._claim()
+        if not rows:
+            return 0, 0
+
+        delivered = []
+        try:
+            deliveries = [
+                await self.producer.publish(
+                    row.topic,
+                    row.key.encode("utf-8"),
+                    row.payload.encode("utf-8"),
+                )
+                for row in rows
+            ]
+            await asyncio.wait(deliveries, timeout=OUTBOX_DELIVERY_TIMEOUT_S)
+
+            failed_keys = set()
+            for row, delivery in zip(rows, deliveries):
+                ok = delivery.done() and not delivery.cancelled() and delivery.exception() is None
+                # After a failure, later rows of the same key are kept too so
+                # the retry resends them in their original order.
+                if ok and row.key not in failed_keys:
+                    delivered.append(row.id)
+                else:
+                    failed_keys.add(row.key)
+        finally:
+            await self._settle(rows, delivered)
+
+        failed = len(rows) - len(delivered)
+        OUTBOX_RELAYED.inc(len(delivered))
+        OUTBOX_FAILED.inc(failed)
+        OUTBOX_BATCH_DURATION.observe(time.perf_counter() - started)
+        if failed:
+            logger.warning("Outbox events not delivered, will retry", extra={"failed": failed})
+        return len(delivered), failed
+
+    async def _claim(self):
+        async with self.session_factory() as session:
+            async with session.begin():
+                outbox = OutboxRepositorySQL(session)
+                if not await outbox.try_lock_relay() or await outbox.batch_in_flight():
+                    return []
+                return await outbox.claim_batch(self.batch_size, OUTBOX_CLAIM_TTL_S)
+
+    async def _settle(self, rows, delivered):
+        """Delete the delivered rows and hand the rest back for the next attempt."""
+        done = set(delivered)
+        async with self.session_factory() as session:
+            async with session.begin():
+                outbox = OutboxRepositorySQL(session)
+                await outbox.delete_many(delivered)
+                await outbox.release([row.id for row in rows if row.id not in done], rows[0].claimed_until)
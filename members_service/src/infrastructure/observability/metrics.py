@@ -0,0 +1,175 @@
+"""Prometheus metrics for the members service.
+
+Labelled metrics are bound once and the children kept, so hot paths
+only call ``observe``/``inc`` and never build a label set per call.
+Pool and cache state is read at scrape time by ``StatsCollector``.
+
+Under several workers (PROMETHEUS_MULTIPROC_DIR set), each process writes
+its samples to that directory and /metrics aggregates them; gauges say
+how per-worker values combine.
+"""
+import os
+import time
+from functools import wraps
+from inspect import iscoroutinefunction
+from prometheus_client import Counter, Gauge, Histogram, multiprocess
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+# Seconds; fine-grained at the low end where queries and cache hits live.
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template",
+    ("method", "route"), buckets=LATENCY_BUCKETS,
+)
+HTTP_RESPONSES = Counter(
+    "http_responses_total", "HTTP responses by route template and status class",
+    ("method", "route", "status"),
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "HTTP requests being served", multiprocess_mode="livesum",
+)
+
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds", "Repository method latency, including connection checkout",
+    ("repository", "method"), buckets=LATENCY_BUCKETS,
+)
+DB_QUERY_ERRORS = Counter(
+    "db_query_errors_total", "Repository methods that raised", ("repository", "method"),
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection",
+    buckets=LATENCY_BUCKETS,
+)
+DB_POOL_TIMEOUTS = Counter("db_pool_timeouts_total", "Checkouts that hit pool_timeout")
+DB_SESSIONS_ACTIVE = Gauge(
+    "db_sessions_active", "Units of work currently holding a session", multiprocess_mode="livesum",
+)
+DB_SESSION_DURATION = Histogram(
+    "db_session_duration_seconds", "Lifetime of a unit of work's session", buckets=LATENCY_BUCKETS,
+)
+
+LOG_RECORDS_DROPPED = Counter("log_records_dropped_total", "Log records dropped because the log queue was full")
+
+KAFKA_PRODUCER_DELIVERY_DURATION = Histogram(
+    "kafka_producer_delivery_seconds", "Time from produce() to the broker's delivery report",
+    ("topic",), buckets=LATENCY_BUCKETS,
+)
+KAFKA_PRODUCER_MESSAGES = Counter(
+    "kafka_producer_messages_total", "Delivery reports by outcome", ("topic", "outcome"),
+)
+KAFKA_PRODUCER_QUEUE = Gauge(
+    "kafka_producer_queue_messages", "Messages and requests waiting in the producer's local queue",
+    multiprocess_mode="livesum",
+)
+
+OUTBOX_RELAYED = Counter("outbox_events_relayed_total", "Outbox events published and deleted")
+OUTBOX_FAILED = Counter("outbox_events_failed_total", "Outbox events left in place for a retry")
+OUTBOX_BATCH_DURATION = Histogram(
+    "outbox_batch_duration_seconds", "Time to claim, publish and delete one outbox batch",
+    buckets=LATENCY_BUCKETS,
+)
+
+
+class TopicMetrics:
+    """Producer metrics bound to one topic."""
+
+    __slots__ = ("delivery", "delivered", "failed")
+
+    def __init__(self, topic: str):
+        self.delivery = KAFKA_PRODUCER_DELIVERY_DURATION.labels(topic)
+        self.delivered = KAFKA_PRODUCER_MESSAGES.labels(topic, "delivered")
+        self.failed = KAFKA_PRODUCER_MESSAGES.labels(topic, "failed")
+
+
+_topics = {}
+
+
+def topic_metrics(topic: str) -> TopicMetrics:
+    metrics = _topics.get(topic)
+    if metrics is None:
+        metrics = _topics[topic] = TopicMetrics(topic)
+    return metrics
+
+
+def _timed(fn, duration, errors):
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await fn(*args, **kwargs)
+        except Exception:
+            errors.inc()
+            raise
+        finally:
+            duration.observe(time.perf_counter() - started)
+
+    return wrapper
+
+
+def timed_queries(repository: str):
+    """Class decorator timing every public coroutine method of a repository."""
+
+    def decorate(cls):
+        for name, fn in list(vars(cls).items()):
+            if name.startswith("_") or not iscoroutinefunction(fn):
+                continue
+            duration = DB_QUERY_DURATION.labels(repository, name)
+            errors = DB_QUERY_ERRORS.labels(repository, name)
+            setattr(cls, name, _timed(fn, duration, errors))
+        return cls
+
+    return decorate
+
+
+_POOL_GAUGES = (
+    ("size", "db_pool_size", "Configured number of persistent connections"),
+    ("checked_in", "db_pool_checked_in", "Idle connections in the pool"),
+    ("checked_out", "db_pool_checked_out", "Connections currently in use"),
+    ("overflow", "db_pool_overflow", "Connections opened beyond pool_size"),
+)
+
+_CACHE_METRICS = (
+    ("entries", "cache_entries", GaugeMetricFamily, "Entries currently cached"),
+    ("hits_total", "cache_hits", CounterMetricFamily, "Lookups answered from the cache"),
+    ("misses_total", "cache_misses", CounterMetricFamily, "Lookups that went to the database"),
+    ("evictions_total", "cache_evictions", CounterMetricFamily, "Entries dropped to respect the size bound"),
+    ("coalesced_total", "cache_coalesced", CounterMetricFamily, "Misses that joined an in-flight load"),
+    ("invalidations_total", "cache_invalidations", CounterMetricFamily, "Explicit invalidations"),
+)
+
+
+class StatsCollector:
+    """Reads pool gauges and cache counters when /metrics is scraped.
+
+    With several workers a scrape reaches only one of them, so ``pid``
+    labels its values rather than passing them off as totals.
+    """
+
+    def __init__(self, pool_snapshot, caches, pid: str = None):
+        self.pool_snapshot = pool_snapshot
+        self.caches = caches
+        self.pid_labels = ("pid",) if pid else ()
+        self.pid_values = (pid,) if pid else ()
+
+    def collect(self):
+        snapshot = self.pool_snapshot()
+        for key, name, help_text in _POOL_GAUGES:
+            gauge = GaugeMetricFamily(name, help_text, labels=self.pid_labels)
+            gauge.add_metric(self.pid_values, snapshot[key])
+            yield gauge
+
+        stats = [(cache.name, cache.stats()) for cache in self.caches]
+        for key, name, family, help_text in _CACHE_METRICS:
+            metric = family(name, help_text, labels=("cache",) + self.pid_labels)
+            for cache_name, values in stats:
+                metric.add_metric((cache_name,) + self.pid_values, values[key])
+            yield metric
+
+
+def mark_worker_stopped():
+    """Drop this worker's live gauges from the multiprocess aggregate."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
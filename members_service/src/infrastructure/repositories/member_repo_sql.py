@@ -1,81 +1,170 @@
 from src.domain.library.repositories.member_repository import MemberRepository
 from src.domain.library.entities.member import Member
-from src.infrastructure.db.session import db_async_session
 from src.infrastructure.db.models import MemberModel
-from sqlalchemy import select
+from sqlalchemy import select, delete, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Set
+from uuid import UUID
+from src.infrastructure.observability.metrics import timed_queries
 
 
+# Keeps each multi-row statement well below asyncpg's 32767 bind parameter cap.
+BULK_CHUNK_SIZE = 1000
+
+_members = MemberModel.__table__
+
+# Plain Core reads of just these columns skip ORM instance construction and
+# the identity map; rows expose the same attribute names as a Member.
+MEMBER_ROW_COLUMNS = (
+    _members.c.member_id,
+    _members.c.name,
+    _members.c.email,
+    _members.c.version,
+)
+
+
+@timed_queries("members")
 class MemberRepositorySQL(MemberRepository):
 
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
     async def get_by_id(self, member_id):
-        async with db_async_session() as db:
-            result = await db.execute(
-                select(MemberModel).where(MemberModel.member_id == member_id)
-            )
-            row = result.scalars().first()
+        row = await self.session.get(MemberModel, member_id)
 
-            if not row:
-                return None
+        if not row:
+            return None
 
-            return Member(row.member_id, row.name, row.email)
+        return Member(row.member_id, row.name, row.email, row.version)
 
-    async def get_by_email(self, email):
-        async with db_async_session() as db:
-            result = await db.execute(
-                select(MemberModel).where(MemberModel.email == email)
-            )
-            row = result.scalars().first()
-
-            if not row:
-                return None
-
-            return Member(row.member_id, row.name, row.email)
-
-    async def list(self):
-        async with db_async_session() as db:
-            result = await db.execute(select(MemberModel))
-            rows = result.scalars().all()
-
-            members = []
-            for row in rows:
-                members.append(
-                    Member(
-                        member_id=row.member_id,
-                        name=row.name,
-                        email=row.email,
-                    )
+    async def get_many(self, member_ids: List[UUID]) -> List[Member]:
+        # A single array parameter keeps the statement text identical for any
+        # number of ids, unlike IN (...), so its prepared plan is reused.
+        result = await self.session.execute(
+            select(*MEMBER_ROW_COLUMNS).where(
+                _members.c.member_id == any_(
+                    bindparam("member_ids", list(member_ids), type_=ARRAY(PG_UUID(as_uuid=True)))
                 )
+            )
+        )
+        return [Member(*row) for row in result]
 
-            return members
+    async def get_by_email(self, email):
+        result = await self.session.execute(
+            select(MemberModel).where(MemberModel.email == email)
+        )
+        row = result.scalars().first()
+
+        if not row:
+            return None
+
+        return Member(row.member_id, row.name, row.email, row.version)
+
+    async def list(
+        self,
+        limit: int,
+        after: Optional[UUID] = None,
+        email: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+    ):
+        rows = await self.list_rows(limit, after, email, name_prefix)
+        return [Member(*row) for row in rows]
+
+    async def list_rows(
+        self,
+        limit: int,
+        after: Optional[UUID] = None,
+        email: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+    ):
+        """Same as ``list`` but as read-only (member_id, name, email, version) rows."""
+        stmt = select(*MEMBER_ROW_COLUMNS).order_by(_members.c.member_id).limit(limit)
+
+        if after is not None:
+            stmt = stmt.where(_members.c.member_id > after)
+        if email is not None:
+            stmt = stmt.where(_members.c.email == email)
+        if name_prefix:
+            stmt = stmt.where(_members.c.name.startswith(name_prefix, autoescape=True))
+
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def stream_rows(self, batch_size: int):
+        """Yield every member as plain row tuples, ``batch_size`` rows at a time.
+
+        Rows come from a server-side cursor, so memory stays bounded by one
+        batch no matter how large the table is.
+        """
+        result = await self.session.stream(
+            select(*MEMBER_ROW_COLUMNS[:-1])
+            .order_by(_members.c.member_id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for rows in result.partitions():
+            yield rows
 
     async def create(self, member: Member):
-        async with db_async_session() as db:
-            db.add(
-                MemberModel(
-                    member_id=member.member_id,
-                    name=member.name,
-                    email=member.email,
-                )
+        self.session.add(
+            MemberModel(
+                member_id=member.member_id,
+                name=member.name,
+                email=member.email,
+            )
+        )
+
+    async def create_many(self, members: List[Member]) -> Set[UUID]:
+        """Insert members with one INSERT ... ON CONFLICT DO NOTHING per chunk.
+
+        Rows clashing on the primary key or the unique email are skipped;
+        returns the ids that were actually inserted.
+        """
+        table = MemberModel.__table__
+        created = set()
+        for start in range(0, len(members), BULK_CHUNK_SIZE):
+            chunk = members[start:start + BULK_CHUNK_SIZE]
+            result = await self.session.execute(
+                insert(table)
+                .values([
+                    {
+                        "member_id": member.member_id,
+                        "name": member.name,
+                        "email": member.email,
+                    }
+                    for member in chunk
+                ])
+                .on_conflict_do_nothing()
+                .returning(table.c.member_id)
             )
+            created.update(result.scalars())
+        return created
+
+    async def delete_many(self, member_ids: List[UUID]) -> Set[UUID]:
+        """Delete the given members, returning the ids that existed."""
+        table = MemberModel.__table__
+        deleted = set()
+        for start in range(0, len(member_ids), BULK_CHUNK_SIZE):
+            result = await self.session.execute(
+                delete(table)
+                .where(table.c.member_id.in_(member_ids[start:start + BULK_CHUNK_SIZE]))
+                .returning(table.c.member_id)
+            )
+            deleted.update(result.scalars())
+        return deleted
 
     async def update(self, member: Member):
-        async with db_async_session() as db:
-            result = await db.execute(
-                select(MemberModel).where(MemberModel.member_id == member.member_id)
-            )
-            row = result.scalars().first()
+        row = await self.session.get(MemberModel, member.member_id)
 
-            if not row:
-                return
+        if not row:
+            return
 
-            row.name = member.name
+        row.name = member.name
+        # Incremented in SQL so concurrent writers never share a version.
+        row.version = MemberModel.version + 1
 
     async def delete(self, member_id):
-        async with db_async_session() as db:
-            result = await db.execute(
-                select(MemberModel).where(MemberModel.member_id == member_id)
-            )
-            row = result.scalars().first()
+        row = await self.session.get(MemberModel, member_id)
 
-            if row:
-                await db.delete(row)
+        if row:
+            await self.session.delete(row)
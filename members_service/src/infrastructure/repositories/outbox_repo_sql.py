@@ -0,0 +1,91 @@
+import json
+from datetime import timedelta
+from typing import List
+from uuid import UUID
+from sqlalchemy import select, delete, insert, update, exists, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.db.models import OutboxModel
+from src.infrastructure.messaging.config import KAFKA_MEMBER_CREATED_TOPIC
+from src.infrastructure.observability.metrics import timed_queries
+
+# Arbitrary constant identifying the relay's advisory lock.
+OUTBOX_RELAY_LOCK_ID = 0x6F7574626F78
+
+
+@timed_queries("outbox")
+class OutboxRepositorySQL:
+    """Outbox rows live in the same session as the aggregate they belong to."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add_member_created(self, member_ids: List[UUID]):
+        if not member_ids:
+            return
+        await self.session.execute(
+            insert(OutboxModel.__table__),
+            [
+                {
+                    "topic": KAFKA_MEMBER_CREATED_TOPIC,
+                    "key": str(member_id),
+                    "payload": json.dumps({"member_id": str(member_id)}),
+                }
+                for member_id in member_ids
+            ],
+        )
+
+    async def try_lock_relay(self) -> bool:
+        """Take the transaction-scoped relay lock so one replica claims at a time.
+
+        Together with ``batch_in_flight`` only one batch is out at once, and
+        reading in id order keeps events for the same key in the order they
+        were written.
+        """
+        result = await self.session.execute(
+            select(func.pg_try_advisory_xact_lock(OUTBOX_RELAY_LOCK_ID))
+        )
+        return bool(result.scalar())
+
+    async def batch_in_flight(self) -> bool:
+        """Whether some relay holds an unexpired claim."""
+        table = OutboxModel.__table__
+        result = await self.session.execute(
+            select(exists().where(table.c.claimed_until > func.now()))
+        )
+        return bool(result.scalar())
+
+    async def claim_batch(self, limit: int, ttl: float):
+        """Claim the oldest rows for ``ttl`` seconds, in id order.
+
+        Expired claims are taken over. Each row carries the ``claimed_until``
+        it was given, which ``release`` needs.
+        """
+        table = OutboxModel.__table__
+        oldest = (
+            select(table.c.id)
+            .order_by(table.c.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            update(table)
+            .where(table.c.id.in_(oldest.scalar_subquery()))
+            .values(claimed_until=func.now() + timedelta(seconds=ttl))
+            .returning(table.c.id, table.c.topic, table.c.key, table.c.payload, table.c.claimed_until)
+        )
+        return sorted(result.all(), key=lambda row: row.id)
+
+    async def release(self, ids: List[int], claimed_until):
+        """Give up a claim early, unless another relay has taken it over since."""
+        if ids:
+            table = OutboxModel.__table__
+            await self.session.execute(
+                update(table)
+                .where(table.c.id.in_(ids), table.c.claimed_until == claimed_until)
+                .values(claimed_until=None)
+            )
+
+    async def delete_many(self, ids: List[int]):
+        if ids:
+            table = OutboxModel.__table__
+            await self.session.execute(delete(table).where(table.c.id.in_(ids)))
@@ -1,38 +1,76 @@
+import logging
+from functools import partial
 from fastapi import FastAPI
-from src.presentation.routers import members
-from src.infrastructure.db.init_db import init_db
+from src.presentation.routers import members, metrics, health as health_routes
+from src.infrastructure.db.migrate import migrate
 from src.infrastructure.messaging.kafka_producer import KafkaProducer
+from src.infrastructure.messaging.outbox_relay import OutboxRelay
 from contextlib import asynccontextmanager
-from src.presentation.dependencies import set_kafka_producer
+from src.infrastructure.cache.caches import start_caches, close_caches
+from src.presentation.responses import FastJSONResponse
+from src.presentation.request_metrics import RequestMetricsMiddleware
+from src.infrastructure.observability.logs import configure_logging
+from src.infrastructure.observability.health import health, database_probe
+from src.infrastructure.observability.metrics import mark_worker_stopped
+from src.infrastructure.db.connection import engine
+from src.infrastructure.db.config import DB_MIGRATE_ON_STARTUP
+
+
+configure_logging()
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    print("🚀 Starting members service...")
+    logger.info("Starting members service")
+    health.reset()
     
-    await init_db()
-    print("✅ Database initialized")
+    if DB_MIGRATE_ON_STARTUP:
+        await migrate()
+        logger.info("Database migrated")
+
+    await start_caches()
+    logger.info("Caches ready")
+    health.add("database", partial(database_probe, engine))
     
-    # Create producer
-    kafka_producer = KafkaProducer(bootstrap_servers="kafka:9092")
+    # Created here, in the worker process, and started with its delivery-report task
+    kafka_producer = KafkaProducer()
+    await kafka_producer.start()
     
-    # Set it in dependencies so routes can access it
-    set_kafka_producer(kafka_producer)
+    # Kept on the app so routes reach this process's producer
+    app.state.kafka_producer = kafka_producer
+
+    # Relay committed outbox events to Kafka in the background
+    outbox_relay = OutboxRelay(kafka_producer)
+    outbox_relay.start()
+
+    # Writes land in the outbox while Kafka is away, so these only degrade readiness.
+    health.add("kafka_producer", kafka_producer.health, critical=False)
+    health.add("outbox_relay", outbox_relay.health, critical=False)
     
-    print("✅ Members service ready\n")
+    logger.info("Members service ready")
     
     yield
     
     # Shutdown
+    health.draining = True
+    await outbox_relay.stop()
     if kafka_producer:
-        kafka_producer.close()
-    print("✅ Members service stopped")
+        await kafka_producer.stop()
+    await close_caches()
+    mark_worker_stopped()
+    logger.info("Members service stopped")
 
 
 app = FastAPI(
     title="Members Service",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
+app.add_middleware(RequestMetricsMiddleware)
+
 app.include_router(members.router)
+app.include_router(metrics.router)
+app.include_router(health_routes.router)
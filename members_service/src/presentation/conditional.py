@@ -0,0 +1,55 @@
+import hashlib
+from typing import Iterable, Optional
+from fastapi import Response, status
+
+
+# Shared caches may store responses but must revalidate them with the ETag
+# before reuse, so a write is visible on the very next request.
+CACHE_CONTROL = "no-cache"
+
+
+def version_etag(version: int) -> str:
+    """Strong ETag for a single resource at ``version``."""
+    return f'"{version}"'
+
+
+def list_etag(items: Iterable, id_attr: str, next_cursor: Optional[str]) -> str:
+    """Strong ETag for a page: changes whenever any item's version does."""
+    digest = hashlib.blake2b(digest_size=16)
+    for item in items:
+        digest.update(getattr(item, id_attr).bytes)
+        digest.update(item.version.to_bytes(8, "big"))
+    digest.update((next_cursor or "").encode("ascii"))
+    return f'"{digest.hexdigest()}"'
+
+
+def _tags(header: str):
+    return [tag.strip() for tag in header.split(",")]
+
+
+def none_match(if_none_match: Optional[str], etag: str) -> bool:
+    """True when ``If-None-Match`` matches, i.e. the client copy is current.
+
+    Uses weak comparison, as RFC 9110 requires for this header.
+    """
+    if not if_none_match:
+        return False
+    for tag in _tags(if_none_match):
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=validator_headers(etag),
+    )
+
+
+def validator_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def set_validators(response: Response, etag: str):
+    response.headers.update(validator_headers(etag))
@@ -0,0 +1,6 @@
+import os
+
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("PORT", "8000"))
+# API worker processes started by python -m src.serve.
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
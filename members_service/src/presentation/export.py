@@ -0,0 +1,70 @@
+import csv
+import io
+import json
+import zlib
+from typing import AsyncIterator, Iterable, Sequence
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _json_default(value):
+    # UUIDs and datetimes are the only non-JSON types in exported rows.
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _encode_ndjson(columns: Sequence[str], rows: Iterable[Sequence]) -> bytes:
+    return "".join(
+        json.dumps(dict(zip(columns, row)), default=_json_default, separators=(",", ":")) + "\n"
+        for row in rows
+    ).encode("utf-8")
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (str, int, float)):
+        return value
+    return _json_default(value)
+
+
+def _encode_csv(rows: Iterable[Sequence]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+async def encode_export(
+    columns: Sequence[str],
+    batches: AsyncIterator[Sequence[Sequence]],
+    fmt: str,
+    gzip: bool = False,
+) -> AsyncIterator[bytes]:
+    """Encode row batches as NDJSON or CSV chunks, one chunk per batch.
+
+    Only a single batch is ever held in memory, so the export size does not
+    affect the process footprint. With ``gzip`` the chunks are compressed
+    incrementally into a single gzip member.
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS) if gzip else None
+
+    def emit(chunk: bytes) -> bytes:
+        return compressor.compress(chunk) if compressor else chunk
+
+    if fmt == "csv":
+        yield emit(_encode_csv([columns]))
+
+    async for rows in batches:
+        chunk = emit(_encode_csv(rows) if fmt == "csv" else _encode_ndjson(columns, rows))
+        if chunk:
+            yield chunk
+
+    if compressor:
+        yield compressor.flush()
@@ -0,0 +1,22 @@
+import base64
+import binascii
+from typing import Optional
+from uuid import UUID
+from fastapi import HTTPException, status
+
+
+def encode_cursor(last_id: Optional[UUID]) -> Optional[str]:
+    """Opaque, URL-safe cursor pointing just after ``last_id``."""
+    if last_id is None:
+        return None
+    return base64.urlsafe_b64encode(last_id.bytes).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[UUID]:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return UUID(bytes=base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
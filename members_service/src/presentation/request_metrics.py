@@ -0,0 +1,65 @@
+import time
+from src.infrastructure.observability.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_RESPONSES,
+    HTTP_REQUESTS_IN_PROGRESS,
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class _RouteMetrics:
+    __slots__ = ("duration", "responses")
+
+    def __init__(self, method: str, route: str):
+        self.duration = HTTP_REQUEST_DURATION.labels(method, route)
+        # 2xx..5xx, indexed by status // 100 - 2.
+        self.responses = tuple(HTTP_RESPONSES.labels(method, route, f"{n}xx") for n in range(2, 6))
+
+
+class RequestMetricsMiddleware:
+    """Times every HTTP request under its route template.
+
+    A plain ASGI middleware, so streamed responses are timed to their last
+    chunk. Metric children are bound the first time a route and method are
+    seen and reused afterwards.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._bound = {}
+
+    def _metrics(self, route, method: str) -> _RouteMetrics:
+        path = route.path if route is not None else UNMATCHED_ROUTE
+        by_method = self._bound.get(path)
+        if by_method is None:
+            by_method = self._bound[path] = {}
+        metrics = by_method.get(method)
+        if metrics is None:
+            metrics = by_method[method] = _RouteMetrics(method, path)
+        return metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_REQUESTS_IN_PROGRESS.dec()
+            # The router stores the matched route in the scope.
+            metrics = self._metrics(scope.get("route"), scope["method"])
+            metrics.duration.observe(elapsed)
+            metrics.responses[min(max(status // 100, 2), 5) - 2].inc()
@@ -0,0 +1,29 @@
+import orjson
+from uuid import UUID
+from fastapi.responses import JSONResponse
+
+
+def _default(value):
+    # asyncpg returns its own UUID subclass, which orjson does not recognise.
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    orjson serializes UUIDs and datetimes natively, so handlers can return
+    database rows as plain dicts without a pydantic pass. UTC timestamps
+    keep the "Z" suffix pydantic would emit.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
+
+
+def rows_to_items(rows, columns):
+    """Map each row's leading values onto ``columns``; trailing ones are dropped."""
+    return [dict(zip(columns, row)) for row in rows]
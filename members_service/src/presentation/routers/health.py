@@ -0,0 +1,24 @@
+from fastapi import APIRouter, status
+from src.infrastructure.observability.health import DOWN, OK, health
+from src.presentation.responses import FastJSONResponse
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+_NO_STORE = {"Cache-Control": "no-store"}
+
+
+@router.get("/live")
+async def live():
+    """The process is up and its event loop answers; dependencies are not checked."""
+    return FastJSONResponse({"status": OK}, headers=_NO_STORE)
+
+
+@router.get("/ready")
+async def ready():
+    """503 when a critical dependency is down or the app is shutting down.
+
+    Degraded dependencies are reported but keep the service ready.
+    """
+    report = await health.report()
+    code = status.HTTP_503_SERVICE_UNAVAILABLE if report["status"] == DOWN else status.HTTP_200_OK
+    return FastJSONResponse(report, status_code=code, headers=_NO_STORE)
@@ -1,7 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from uuid import UUID, uuid4
-from typing import Annotated, TypeAlias
-from src.presentation.schemas import MemberCreate, MemberResponse, MemberUpdate
+from typing import Annotated, Literal, Optional, TypeAlias
+from src.presentation.schemas import (
+    MemberBatch,
+    MemberBatchGet,
+    MemberBulkCreate,
+    MemberBulkCreateResult,
+    MemberBulkDelete,
+    MemberBulkDeleteResult,
+    MemberCreate,
+    MemberPage,
+    MemberResponse,
+    MemberUpdate,
+)
+from src.presentation.pagination import decode_cursor, encode_cursor
+from src.presentation.export import EXPORT_MEDIA_TYPES, encode_export
+from src.presentation.conditional import (
+    list_etag,
+    none_match,
+    not_modified,
+    set_validators,
+    validator_headers,
+    version_etag,
+)
+from src.presentation.responses import FastJSONResponse, rows_to_items
 from src.presentation.dependencies import get_member_service
 from src.domain.library.entities.member import Member
 from src.application.library.member_service import MemberService
@@ -20,16 +43,93 @@ async def create_member( data: MemberCreate, service: MemberServiceDep):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
 
-@router.get("/", response_model=list[MemberResponse], status_code=status.HTTP_200_OK)
-async def get_all_members(service: MemberServiceDep):
-    return await service.list_members()
+@router.post("/bulk", response_model=list[MemberBulkCreateResult], status_code=status.HTTP_200_OK)
+async def create_members_bulk(data: MemberBulkCreate, service: MemberServiceDep):
+    members = [Member(uuid4(), item.name, item.email) for item in data]
+    results = await service.create_members(members)
+    return [
+        {
+            "email": member.email,
+            "member_id": member.member_id if result == "created" else None,
+            "status": result,
+        }
+        for member, result in results
+    ]
+
+
+@router.post("/bulk/delete", response_model=list[MemberBulkDeleteResult], status_code=status.HTTP_200_OK)
+async def delete_members_bulk(member_ids: MemberBulkDelete, service: MemberServiceDep):
+    results = await service.delete_members(member_ids)
+    return [{"member_id": member_id, "status": result} for member_id, result in results]
+
+
+@router.post("/batch-get", response_model=MemberBatch, status_code=status.HTTP_200_OK)
+async def get_members_batch(member_ids: MemberBatchGet, service: MemberServiceDep):
+    members, missing = await service.get_members(member_ids)
+    return {"items": members, "missing": missing}
+
+
+# Field order of MemberResponse; list and export rows come back in this order.
+MEMBER_COLUMNS = ("member_id", "name", "email")
+
+
+@router.get("/", response_model=MemberPage, status_code=status.HTTP_200_OK)
+async def get_all_members(
+    service: MemberServiceDep,
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+    cursor: Optional[str] = None,
+    email: Optional[str] = None,
+    name_prefix: Optional[str] = None,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+):
+    rows, last_id = await service.list_members(
+        limit,
+        decode_cursor(cursor),
+        email=email,
+        name_prefix=name_prefix,
+    )
+    next_cursor = encode_cursor(last_id)
+    etag = list_etag(rows, "member_id", next_cursor)
+    if none_match(if_none_match, etag):
+        return not_modified(etag)
+    # Rows go straight to orjson; response_model still documents the shape.
+    return FastJSONResponse(
+        {"items": rows_to_items(rows, MEMBER_COLUMNS), "next_cursor": next_cursor},
+        headers=validator_headers(etag),
+    )
+
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_members(
+    service: MemberServiceDep,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    gzip: bool = False,
+    batch_size: Annotated[int, Query(ge=100, le=10000)] = 1000,
+):
+    body = encode_export(MEMBER_COLUMNS, service.export_members(batch_size), format, gzip)
+    headers = {"Content-Disposition": f'attachment; filename="members.{format}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=EXPORT_MEDIA_TYPES[format], headers=headers)
+
 
 @router.get("/members/{member_id}", response_model=MemberResponse, status_code=status.HTTP_200_OK)
-async def get_member_by_id(member_id: UUID, service: MemberServiceDep):
+async def get_member_by_id(
+    member_id: UUID,
+    service: MemberServiceDep,
+    response: Response,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+):
     try:
-        return await service.get_member_by_id(member_id)
+        member = await service.get_member_by_id(member_id)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    etag = version_etag(member.version)
+    if none_match(if_none_match, etag):
+        return not_modified(etag)
+    set_validators(response, etag)
+    return member
     
 
 @router.put("/{member_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,23 @@
+import os
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest, multiprocess
+from src.infrastructure.db.connection import engine
+from src.infrastructure.db.pool import pool_snapshot
+from src.infrastructure.cache.caches import CACHES
+from src.infrastructure.observability.metrics import MULTIPROCESS, StatsCollector
+
+router = APIRouter(tags=["Metrics"])
+
+if MULTIPROCESS:
+    # Every worker's samples, read from PROMETHEUS_MULTIPROC_DIR at scrape time.
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    registry.register(StatsCollector(lambda: pool_snapshot(engine.pool), CACHES, pid=str(os.getpid())))
+else:
+    registry = REGISTRY
+    registry.register(StatsCollector(lambda: pool_snapshot(engine.pool), CACHES))
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
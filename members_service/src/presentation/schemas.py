@@ -1,6 +1,6 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from uuid import UUID
-from typing import Optional
+from typing import Annotated, Literal, Optional
 
 
 class MemberCreate(BaseModel):
@@ -14,5 +14,37 @@ class MemberResponse(BaseModel):
     email: EmailStr
 
 
+class MemberPage(BaseModel):
+    items: list[MemberResponse]
+    next_cursor: Optional[str] = None
+
+
 class MemberUpdate(BaseModel):
     name: Optional[str] = None
+
+
+BULK_MAX_ITEMS = 10000
+
+MemberBulkCreate = Annotated[list[MemberCreate], Field(min_length=1, max_length=BULK_MAX_ITEMS)]
+MemberBulkDelete = Annotated[list[UUID], Field(min_length=1, max_length=BULK_MAX_ITEMS)]
+
+
+BATCH_GET_MAX_ITEMS = 1000
+
+MemberBatchGet = Annotated[list[UUID], Field(min_length=1, max_length=BATCH_GET_MAX_ITEMS)]
+
+
+class MemberBatch(BaseModel):
+    items: list[MemberResponse]
+    missing: list[UUID]
+
+
+class MemberBulkCreateResult(BaseModel):
+    email: EmailStr
+    member_id: Optional[UUID]
+    status: Literal["created", "conflict"]
+
+
+class MemberBulkDeleteResult(BaseModel):
+    member_id: UUID
+    status: Literal["deleted", "not_found"]
@@ -0,0 +1,126 @@
+import asyncio
+import copy
+from uuid import uuid4
+from src.domain.library.entities.member import Member
+from src.infrastructure.cache.cached_repositories import CachedMemberRepository
+
+
+class InMemoryMemberRepository:
+    """The slice of MemberRepositorySQL the cache wraps, over a dict."""
+
+    def __init__(self):
+        self.rows = {}
+        self.reads = 0
+
+    async def get_by_id(self, member_id):
+        self.reads += 1
+        member = self.rows.get(member_id)
+        return copy.copy(member) if member else None
+
+    async def get_many(self, member_ids):
+        self.reads += 1
+        return [copy.copy(self.rows[member_id]) for member_id in member_ids if member_id in self.rows]
+
+    async def update(self, member):
+        member.version += 1
+        self.rows[member.member_id] = copy.copy(member)
+
+    async def delete(self, member_id):
+        self.rows.pop(member_id, None)
+
+    async def delete_many(self, member_ids):
+        return [member_id for member_id in member_ids if self.rows.pop(member_id, None)]
+
+
+class UnitOfWork:
+    """Runs the commit hooks the cached repository registers."""
+
+    def __init__(self, repo, cache):
+        self._hooks = []
+        self.members = CachedMemberRepository(repo, cache, self._hooks.append)
+
+    async def commit(self):
+        for hook in self._hooks:
+            await hook()
+
+
+def _stored_member(repo):
+    member = Member(uuid4(), "Ada", "ada@example.com")
+    repo.rows[member.member_id] = member
+    return member
+
+
+def test_reads_are_served_from_cache(make_member_cache):
+    repo = InMemoryMemberRepository()
+    member = _stored_member(repo)
+
+    async def scenario():
+        uow = UnitOfWork(repo, make_member_cache())
+        return [await uow.members.get_by_id(member.member_id) for _ in range(3)]
+
+    results = asyncio.run(scenario())
+
+    assert repo.reads == 1
+    assert [result.name for result in results] == ["Ada"] * 3
+
+
+def test_update_drops_the_cached_member_on_every_replica(make_member_cache):
+    repo = InMemoryMemberRepository()
+    member = _stored_member(repo)
+
+    async def scenario():
+        writer_cache, reader_cache = make_member_cache(), make_member_cache()
+        for cache in (writer_cache, reader_cache):
+            await cache.start()
+        writer, reader = UnitOfWork(repo, writer_cache), UnitOfWork(repo, reader_cache)
+        await writer.members.get_by_id(member.member_id)
+        await reader.members.get_by_id(member.member_id)
+
+        changed = await writer.members.get_by_id(member.member_id)
+        changed.name = "Ada Lovelace"
+        await writer.members.update(changed)
+        await writer.commit()
+        return await writer.members.get_by_id(member.member_id), await reader.members.get_by_id(member.member_id)
+
+    seen_by_writer, seen_by_reader = asyncio.run(scenario())
+
+    assert (seen_by_writer.name, seen_by_writer.version) == ("Ada Lovelace", 2)
+    assert (seen_by_reader.name, seen_by_reader.version) == ("Ada Lovelace", 2)
+
+
+def test_delete_drops_the_cached_member(make_member_cache):
+    repo = InMemoryMemberRepository()
+    member, other = _stored_member(repo), _stored_member(repo)
+
+    async def scenario():
+        uow = UnitOfWork(repo, make_member_cache())
+        await uow.members.get_many([member.member_id, other.member_id])
+        await uow.members.delete(member.member_id)
+        await uow.members.delete_many([other.member_id])
+        await uow.commit()
+        return await uow.members.get_by_id(member.member_id), await uow.members.get_many([other.member_id])
+
+    by_id, many = asyncio.run(scenario())
+
+    assert by_id is None
+    assert many == []
+
+
+def test_read_racing_the_write_is_dropped_at_commit(make_member_cache):
+    repo = InMemoryMemberRepository()
+    member = _stored_member(repo)
+
+    async def scenario():
+        cache = make_member_cache()
+        uow = UnitOfWork(repo, cache)
+        changed = await uow.members.get_by_id(member.member_id)
+        changed.name = "Countess of Lovelace"
+        await uow.members.update(changed)
+        # Another request reads before the commit and caches the old row.
+        repo.rows[member.member_id] = member
+        await UnitOfWork(repo, cache).members.get_by_id(member.member_id)
+        repo.rows[member.member_id] = changed
+        await uow.commit()
+        return await uow.members.get_by_id(member.member_id)
+
+    assert asyncio.run(scenario()).name == "Countess of Lovelace"
@@ -0,0 +1,171 @@
+import asyncio
+from uuid import uuid4
+from src.domain.library.entities.member import Member
+from src.infrastructure.cache.codecs import MemberCodec
+
+
+async def settle():
+    """Let every runnable task advance until it blocks."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def _member(name="Ada"):
+    return Member(uuid4(), name, f"{name.lower()}@example.com")
+
+
+class GatedLoader:
+    """Loader that counts its calls and blocks until ``release`` is set."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def test_concurrent_misses_share_one_load(make_member_cache):
+    member = _member()
+
+    async def scenario():
+        cache = make_member_cache()
+        loader = GatedLoader(member)
+        readers = [asyncio.create_task(cache.get_or_load(member.member_id, loader)) for _ in range(10)]
+        await settle()
+        loader.release.set()
+        return cache, loader, await asyncio.gather(*readers)
+
+    cache, loader, results = asyncio.run(scenario())
+
+    assert loader.calls == 1
+    assert cache.misses == 10
+    assert cache.coalesced == 9
+    assert [result.name for result in results] == ["Ada"] * 10
+
+
+def test_loaded_entity_is_served_from_cache(make_member_cache):
+    member = _member()
+
+    async def scenario():
+        cache = make_member_cache()
+        loader = GatedLoader(member)
+        loader.release.set()
+        await cache.get_or_load(member.member_id, loader)
+        cached = await cache.get_or_load(member.member_id, loader)
+        return cache, loader, cached
+
+    cache, loader, cached = asyncio.run(scenario())
+
+    assert loader.calls == 1
+    assert cache.hits == 1
+    assert cached.name == "Ada" and cached is not member
+
+
+def test_batch_lookup_joins_a_load_in_flight(make_member_cache):
+    first, second = _member("Ada"), _member("Grace")
+    batches = []
+
+    async def load_many(member_ids):
+        batches.append(list(member_ids))
+        return {member.member_id: member for member in (first, second) if member.member_id in member_ids}
+
+    async def scenario():
+        cache = make_member_cache()
+        loader = GatedLoader(first)
+        single = asyncio.create_task(cache.get_or_load(first.member_id, loader))
+        await settle()
+        batch = asyncio.create_task(cache.get_many_or_load([first.member_id, second.member_id], load_many))
+        await settle()
+        loader.release.set()
+        await single
+        return cache, loader, await batch
+
+    cache, loader, found = asyncio.run(scenario())
+
+    assert loader.calls == 1
+    assert batches == [[second.member_id]]
+    assert cache.coalesced == 1
+    assert {member_id: member.name for member_id, member in found.items()} == {
+        first.member_id: "Ada",
+        second.member_id: "Grace",
+    }
+
+
+def test_failed_load_reaches_every_caller_and_is_not_cached(make_member_cache):
+    member = _member()
+
+    async def scenario():
+        cache = make_member_cache()
+        loader = GatedLoader(RuntimeError("database down"))
+        readers = [asyncio.create_task(cache.get_or_load(member.member_id, loader)) for _ in range(3)]
+        await settle()
+        loader.release.set()
+        outcomes = await asyncio.gather(*readers, return_exceptions=True)
+
+        loader.result = member
+        retried = await cache.get_or_load(member.member_id, loader)
+        return loader, outcomes, retried
+
+    loader, outcomes, retried = asyncio.run(scenario())
+
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+    assert loader.calls == 2
+    assert retried.name == "Ada"
+
+
+def test_invalidation_during_load_keeps_the_result_out(make_member_cache):
+    member = _member("Stale")
+
+    async def scenario():
+        cache = make_member_cache()
+        loader = GatedLoader(member)
+        reader = asyncio.create_task(cache.get_or_load(member.member_id, loader))
+        await settle()
+        await cache.invalidate(member.member_id)
+        loader.release.set()
+        await reader
+
+        loader.result = Member(member.member_id, "Fresh", member.email, 2)
+        return loader, await cache.get_or_load(member.member_id, loader)
+
+    loader, reloaded = asyncio.run(scenario())
+
+    assert loader.calls == 2
+    assert reloaded.name == "Fresh"
+
+
+def test_invalidation_reaches_other_replicas(make_member_cache):
+    member = _member("Old")
+
+    async def scenario():
+        writer, reader = make_member_cache(), make_member_cache()
+        for cache in (writer, reader):
+            await cache.start()
+        loader = GatedLoader(member)
+        loader.release.set()
+        await writer.get_or_load(member.member_id, loader)
+        await reader.get_or_load(member.member_id, loader)
+
+        await writer.invalidate(member.member_id)
+        loader.result = Member(member.member_id, "New", member.email, 2)
+        return loader, await reader.get_or_load(member.member_id, loader)
+
+    loader, seen = asyncio.run(scenario())
+
+    # The reader's near-cache copy was dropped, so it went back to the loader.
+    assert loader.calls == 2
+    assert seen.name == "New"
+
+
+def test_member_codec_round_trip():
+    member = Member(uuid4(), "Ada Lovelace", "ada@example.com", 3)
+
+    decoded = MemberCodec.decode(MemberCodec.encode(member))
+
+    assert [getattr(decoded, slot) for slot in Member.__slots__] == [getattr(member, slot) for slot in Member.__slots__]
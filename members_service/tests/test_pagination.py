@@ -0,0 +1,25 @@
+from uuid import uuid4
+import pytest
+from fastapi import HTTPException
+from src.presentation.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    member_id = uuid4()
+    cursor = encode_cursor(member_id)
+
+    assert decode_cursor(cursor) == member_id
+    assert cursor.isascii() and "=" not in cursor
+
+
+def test_no_cursor_means_first_page():
+    assert encode_cursor(None) is None
+    assert decode_cursor(None) is None
+    assert decode_cursor("") is None
+
+
+@pytest.mark.parametrize("tamper", [lambda c: c[:-2], lambda c: c + "AAAA", lambda c: "%%" + c])
+def test_tampered_cursor_is_rejected(tamper):
+    with pytest.raises(HTTPException) as raised:
+        decode_cursor(tamper(encode_cursor(uuid4())))
+    assert raised.value.status_code == 400